@@ -14,12 +14,31 @@ from .config import (
     NHL_API_BASE,
     API_TIMEOUT,
     API_MAX_RETRIES,
-    RATE_LIMIT_DELAY,
+    RATE_LIMIT_PER_SECOND,
+    RATE_LIMIT_BURST,
 )
 
 from .utils import (
     fetch_from_api,
+    fetch_json,
+    FetchResult,
+    fetch_many,
+    map_in_order,
+    get_session,
+    http_get,
+    get_connection_stats,
+    reset_connection_stats,
+    format_connection_stats,
+    get_cache_stats,
+    format_cache_stats,
+    get_coalesce_stats,
+    get_skipped_requests,
+    get_skip_reason,
+    reset_failures,
+    format_failure_stats,
+    endpoint_family,
     rate_limit,
+    get_rate_limiter,
     ensure_dir,
     save_json,
     load_json,
@@ -27,6 +46,8 @@ from .utils import (
     game_boxscore_url,
     play_by_play_url,
     player_landing_url,
+    roster_url,
+    standings_url,
     extract_team_name,
     get_player_name,
 )
@@ -43,10 +64,29 @@ __all__ = [
     "NHL_API_BASE",
     "API_TIMEOUT",
     "API_MAX_RETRIES",
-    "RATE_LIMIT_DELAY",
+    "RATE_LIMIT_PER_SECOND",
+    "RATE_LIMIT_BURST",
     # Utilities
     "fetch_from_api",
+    "fetch_json",
+    "FetchResult",
+    "fetch_many",
+    "map_in_order",
+    "get_session",
+    "http_get",
+    "get_connection_stats",
+    "reset_connection_stats",
+    "format_connection_stats",
+    "get_cache_stats",
+    "format_cache_stats",
+    "get_coalesce_stats",
+    "get_skipped_requests",
+    "get_skip_reason",
+    "reset_failures",
+    "format_failure_stats",
+    "endpoint_family",
     "rate_limit",
+    "get_rate_limiter",
     "ensure_dir",
     "save_json",
     "load_json",
@@ -54,6 +94,8 @@ __all__ = [
     "game_boxscore_url",
     "play_by_play_url",
     "player_landing_url",
+    "roster_url",
+    "standings_url",
     "extract_team_name",
     "get_player_name",
 ]
@@ -8,14 +8,13 @@ missing period/OT information, and updates the files with complete data.
 
 import json
 import sys
-import time
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from config import GAMES_DIR
-from utils import fetch_from_api, game_boxscore_url, save_json, load_json
+from game_store import get_game_store
+from utils import fetch_from_api, game_boxscore_url
 
 # =============================================================================
 # Backfill Functions
@@ -40,12 +39,7 @@ def fetch_game_period_info(game_id):
 
 def backfill_date_file(date_str, dry_run=False):
     """Backfill missing data for a single date file."""
-    json_file = GAMES_DIR / f"{date_str}.json"
-
-    if not json_file.exists():
-        return False
-
-    data = load_json(json_file)
+    data = get_game_store().day(date_str)
     if not data:
         return False
 
@@ -77,11 +71,10 @@ def backfill_date_file(date_str, dry_run=False):
             needs_update = True
 
         updated_games.append(game)
-        time.sleep(0.5)  # Rate limiting
 
     if needs_update and not dry_run:
         data["games"] = updated_games
-        save_json(data, json_file)
+        get_game_store().save_day(data)
         print(f"  ✅ Updated {updates_made} games in {date_str}.json")
         return True
     elif needs_update:
@@ -112,25 +105,14 @@ def main():
     total_games_to_fix = 0
 
     print("Scanning for games missing period data...")
-    for json_file in sorted(GAMES_DIR.glob("*.json")):
-        date_str = json_file.stem
-        data = load_json(json_file)
-        if not data:
-            continue
-
-        games = data.get("games", [])
-        games_needing_fix = 0
-
-        for game in games:
-            if (game.get("period") is None and
-                game.get("gameState") != "FUT" and
-                game.get("gameType") == 2):
-                games_needing_fix += 1
-
-        if games_needing_fix > 0:
-            files_to_update.append(date_str)
-            total_games_to_fix += games_needing_fix
-            print(f"  {date_str}.json: {games_needing_fix} games")
+    counts = {}
+    for date_str, _ in get_game_store().find_games(missing_period=True, game_type=2, exclude_states=("FUT",)):
+        counts[date_str] = counts.get(date_str, 0) + 1
+
+    for date_str, games_needing_fix in sorted(counts.items()):
+        files_to_update.append(date_str)
+        total_games_to_fix += games_needing_fix
+        print(f"  {date_str}.json: {games_needing_fix} games")
 
     print()
     print(f"Found {total_games_to_fix} games in {len(files_to_update)} files missing period data")
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Benchmark PlayerGameRow against the per-player dicts it replaced.
+
+Extracts rows from synthetic boxscores (fake_api_server.SyntheticLeague, no
+network) and reports memory per row, extraction time and season file write
+time, after checking both produce byte-identical season JSON.
+
+Usage:
+    python bench_player_rows.py            # 1000 games (~43k rows)
+    python bench_player_rows.py --games 300
+"""
+
+import argparse
+import io
+import json
+import sys
+import timeit
+import tracemalloc
+from datetime import timedelta
+
+from fake_api_server import SEASON_START, SyntheticLeague
+from player_rows import SEASON_SCHEMA, dump_json, extract_player_rows, iter_boxscore_players
+
+
+def legacy_player_dicts(game_data, game_id, home_team, away_team, game_date):
+    """The dict rows season/fetch_season_games.py used to build."""
+    teams = {"awayTeam": away_team, "homeTeam": home_team}
+    players = []
+    for team_side, player in iter_boxscore_players(game_data):
+        name = player.get("name", {}).get("default", "")
+        position = player.get("position", "N/A")
+        if position == "G":
+            save_pct = player.get("savePctg", 0.0)
+            players.append({
+                "playerId": player.get("playerId"),
+                "name": name.strip(),
+                "team": teams[team_side],
+                "position": position,
+                "goals": 0,
+                "assists": 0,
+                "points": 0,
+                "shots": 0,
+                "plusMinus": 0,
+                "pim": player.get("pim", 0),
+                "timeOnIce": player.get("toi", "00:00"),
+                "isGoalie": True,
+                "saves": player.get("saves", 0),
+                "savePct": round(save_pct, 3) if save_pct else 0.0,
+                "shotsAgainst": player.get("shotsAgainst", 0),
+                "goalsAgainst": player.get("goalsAgainst", 0),
+                "gameId": game_id,
+                "gameDate": game_date
+            })
+        else:
+            players.append({
+                "playerId": player.get("playerId"),
+                "name": name.strip(),
+                "team": teams[team_side],
+                "position": position,
+                "goals": player.get("goals", 0),
+                "assists": player.get("assists", 0),
+                "points": player.get("points", 0),
+                "shots": player.get("sog", 0),
+                "plusMinus": player.get("plusMinus", 0),
+                "pim": player.get("pim", 0),
+                "timeOnIce": player.get("toi", "00:00"),
+                "isGoalie": False,
+                "saves": 0,
+                "savePct": 0.0,
+                "hits": player.get("hits", 0),
+                "blockedShots": player.get("blockedShots", 0),
+                "takeaways": player.get("takeaways", 0),
+                "giveaways": player.get("giveaways", 0),
+                "powerPlayGoals": player.get("powerPlayGoals", 0),
+                "gameId": game_id,
+                "gameDate": game_date
+            })
+    return players
+
+
+def synthetic_boxscores(count, seed=0):
+    """First `count` final synthetic boxscores of the season."""
+    league = SyntheticLeague(seed=seed, today=SEASON_START + timedelta(days=200))
+    boxscores = []
+    day = SEASON_START
+    while len(boxscores) < count and day < league.today:
+        for game_id, home, away in league.games_on(day):
+            boxscore = league.boxscore(game_id)
+            if boxscore and boxscore.get("playerByGameStats"):
+                boxscores.append((game_id, home, away, day.isoformat(), boxscore))
+        day += timedelta(days=1)
+    return boxscores[:count]
+
+
+def extract_all(extract, boxscores):
+    rows = []
+    for game_id, home, away, game_date, boxscore in boxscores:
+        rows.extend(extract(boxscore, game_id, home, away, game_date))
+    return rows
+
+
+def season_json(players, write=None):
+    """Season-file text for the rows (dicts via json.dump, rows via dump_json)."""
+    data = {"season": "2025-26", "players": players, "total_players": len(players)}
+    out = io.StringIO()
+    if write is None:
+        json.dump(data, out, indent=2, ensure_ascii=False)
+    else:
+        write(data, out, SEASON_SCHEMA)
+    return out.getvalue()
+
+
+def best_seconds(func, repeat):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def retained_bytes(func):
+    """Bytes still allocated by what func() returns."""
+    tracemalloc.start()
+    result = func()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark compact player-game rows")
+    parser.add_argument("--games", type=int, default=1000, help="Synthetic games to extract (default: 1000)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions, best is reported (default: 5)")
+    args = parser.parse_args()
+
+    boxscores = synthetic_boxscores(args.games)
+    legacy_rows = extract_all(legacy_player_dicts, boxscores)
+    rows = extract_all(extract_player_rows, boxscores)
+    if season_json(legacy_rows) != season_json(rows, dump_json):
+        print("❌ Row JSON differs from the legacy dict JSON")
+        return 1
+
+    print(f"🏒 {len(boxscores)} games, {len(rows)} player rows (identical JSON)")
+    print()
+    print(f"{'':<22}{'dicts':>12}{'rows':>12}{'change':>10}")
+
+    def report(label, legacy, compact, unit):
+        print(f"{label:<22}{legacy:>10.1f}{unit:<2}{compact:>10.1f}{unit:<2}{(compact - legacy) / legacy:>+10.0%}")
+
+    del legacy_rows, rows
+    _, legacy_bytes = retained_bytes(lambda: extract_all(legacy_player_dicts, boxscores))
+    rows, row_bytes = retained_bytes(lambda: extract_all(extract_player_rows, boxscores))
+    report("Memory per row", legacy_bytes / len(rows), row_bytes / len(rows), "B")
+
+    legacy_seconds = best_seconds(lambda: extract_all(legacy_player_dicts, boxscores), args.repeat)
+    row_seconds = best_seconds(lambda: extract_all(extract_player_rows, boxscores), args.repeat)
+    report("Extraction", legacy_seconds * 1000, row_seconds * 1000, "ms")
+
+    legacy_rows = extract_all(legacy_player_dicts, boxscores)
+    legacy_seconds = best_seconds(lambda: season_json(legacy_rows), args.repeat)
+    row_seconds = best_seconds(lambda: season_json(rows, dump_json), args.repeat)
+    report("Season JSON write", legacy_seconds * 1000, row_seconds * 1000, "ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
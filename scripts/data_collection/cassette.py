@@ -0,0 +1,227 @@
+"""
+Record/replay cassettes for HTTP traffic.
+
+In record mode every response that passes through utils.http_get is kept
+in memory and written to a gzip-compressed archive when the process exits.
+In replay mode the archive is loaded once and requests are answered from
+memory with no network access, rate limiting or response cache, which makes
+collector runs reproducible offline.
+
+Select a cassette with NHL_API_CASSETTE=path (plus
+NHL_API_CASSETTE_MODE=record|replay) or the --record/--replay flags of the
+fetch scripts.
+"""
+
+import atexit
+import base64
+import gzip
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from config import API_CASSETTE_PATH, API_CASSETTE_MODE
+
+CASSETTE_FORMAT = 1
+CASSETTE_MODES = ("record", "replay")
+RECORDED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+def interaction_body(interaction):
+    """Decode the stored body of a recorded interaction to bytes."""
+    if "body_b64" in interaction:
+        return base64.b64decode(interaction["body_b64"])
+    return interaction.get("body", "").encode("utf-8")
+
+
+class CassetteMiss(requests.ConnectionError):
+    """Raised in replay mode for a URL that was never recorded."""
+
+
+class Cassette:
+    """In-memory archive of recorded responses, keyed by URL."""
+
+    def __init__(self, path, mode="replay"):
+        """
+        Args:
+            path: Cassette file (gzip-compressed JSON)
+            mode: "record" to capture traffic, "replay" to serve it
+        """
+        if mode not in CASSETTE_MODES:
+            raise ValueError(f"Unknown cassette mode: {mode!r} (expected one of {CASSETTE_MODES})")
+        self.path = Path(path)
+        self.mode = mode
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.stats = {"recorded": 0, "replayed": 0, "missed": 0}
+        if mode == "replay" and not self.path.exists():
+            raise FileNotFoundError(f"Cassette not found: {self.path}")
+        self.interactions = self._load()
+
+    @property
+    def replaying(self):
+        return self.mode == "replay"
+
+    def _load(self):
+        """Read the archive; recording into an existing file extends it."""
+        if not self.path.exists():
+            return {}
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            archive = json.load(f)
+        if archive.get("format") != CASSETTE_FORMAT:
+            raise ValueError(f"Unsupported cassette format in {self.path}: {archive.get('format')}")
+        return archive.get("interactions", {})
+
+    def record(self, url, response):
+        """
+        Store a response for a URL.
+
+        Throttled (429) and server error (5xx) answers are transient and
+        never recorded; the retry that follows them is.
+        """
+        if response.status_code == 429 or response.status_code >= 500:
+            return
+
+        content_type = response.headers.get("Content-Type", "")
+        interaction = {
+            "status": response.status_code,
+            "headers": {k: response.headers[k] for k in RECORDED_HEADERS if k in response.headers},
+        }
+        if "json" in content_type or content_type.startswith("text/"):
+            interaction["body"] = response.content.decode(response.encoding or "utf-8", errors="replace")
+        else:
+            interaction["body_b64"] = base64.b64encode(response.content).decode("ascii")
+
+        with self._lock:
+            self.interactions[url] = interaction
+            self.stats["recorded"] += 1
+            self._dirty = True
+
+    def replay(self, url):
+        """
+        Build a response for a URL from the archive.
+
+        Returns:
+            requests.Response (raises CassetteMiss if the URL was not recorded)
+        """
+        with self._lock:
+            interaction = self.interactions.get(url)
+            self.stats["missed" if interaction is None else "replayed"] += 1
+        if interaction is None:
+            raise CassetteMiss(f"Not in cassette {self.path.name}: {url}")
+
+        response = requests.Response()
+        response.url = url
+        response.status_code = interaction["status"]
+        response.headers = CaseInsensitiveDict(interaction.get("headers", {}))
+        response._content = interaction_body(interaction)
+        if "body" in interaction:
+            response.encoding = "utf-8"
+        return response
+
+    def save(self):
+        """Write recorded interactions to disk (atomic replace)."""
+        with self._lock:
+            if not self._dirty:
+                return False
+            archive = {
+                "format": CASSETTE_FORMAT,
+                "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "interactions": dict(sorted(self.interactions.items())),
+            }
+            self._dirty = False
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(archive, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, self.path)
+        return True
+
+    def summary(self):
+        """Format cassette activity as a one-line summary."""
+        if self.replaying:
+            return (
+                f"Cassette: replayed {self.stats['replayed']} response(s) from {self.path}"
+                f" ({self.stats['missed']} missing)"
+            )
+        return f"Cassette: recorded {self.stats['recorded']} response(s) to {self.path}"
+
+
+_cassette = None
+_configured = False
+_cassette_lock = threading.Lock()
+
+
+def use_cassette(path, mode="replay"):
+    """
+    Activate a cassette for the rest of the process.
+
+    Recorded cassettes are saved automatically at exit.
+
+    Args:
+        path: Cassette file
+        mode: "record" or "replay"
+
+    Returns:
+        The active Cassette
+    """
+    global _cassette, _configured
+    cassette = Cassette(path, mode)
+    with _cassette_lock:
+        _cassette = cassette
+        _configured = True
+    if mode == "record":
+        atexit.register(cassette.save)
+    return cassette
+
+
+def get_cassette():
+    """
+    Get the active cassette.
+
+    The first call picks up NHL_API_CASSETTE / NHL_API_CASSETTE_MODE when
+    no cassette was activated explicitly.
+
+    Returns:
+        Cassette instance, or None when traffic goes to the network
+    """
+    global _configured
+    if not _configured:
+        if API_CASSETTE_PATH:
+            try:
+                use_cassette(API_CASSETTE_PATH, API_CASSETTE_MODE)
+            except (OSError, ValueError) as e:
+                raise SystemExit(f"Error: {e}")
+        else:
+            _configured = True
+    return _cassette
+
+
+def is_replaying():
+    """True when requests are answered from a cassette instead of the network."""
+    cassette = get_cassette()
+    return cassette is not None and cassette.replaying
+
+
+def add_cassette_arguments(parser):
+    """Add --record/--replay options to an argparse parser."""
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--record", metavar="CASSETTE", help="Record all API traffic to a cassette file")
+    group.add_argument("--replay", metavar="CASSETTE", help="Serve all API traffic from a cassette file (no network)")
+
+
+def apply_cassette_arguments(args):
+    """Activate the cassette selected by --record/--replay, if any."""
+    try:
+        if args.record:
+            return use_cassette(args.record, "record")
+        if args.replay:
+            return use_cassette(args.replay, "replay")
+    except (OSError, ValueError) as e:
+        raise SystemExit(f"Error: {e}")
+    return None
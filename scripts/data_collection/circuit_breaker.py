@@ -0,0 +1,204 @@
+"""
+Failure containment for NHL data collection.
+
+A circuit breaker per endpoint family stops hammering a degraded API: after
+CIRCUIT_FAILURE_THRESHOLD consecutive failures the circuit opens and
+requests fail fast for CIRCUIT_RESET_SECONDS, then a limited number of
+half-open probe requests decide whether to close it again. A per-run retry
+budget caps the total number of retries across all URLs, so an outage
+cannot stall a nightly run for an hour. Every URL given up on is recorded
+with its reason so it can be retried later.
+"""
+
+import threading
+import time
+
+from config import (
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_RESET_SECONDS,
+    CIRCUIT_HALF_OPEN_PROBES,
+    RETRY_BUDGET_PER_RUN,
+)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Thread-safe closed/open/half-open circuit breaker."""
+
+    def __init__(self, failure_threshold=None, reset_seconds=None, half_open_probes=None):
+        """
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_seconds: How long the circuit stays open before probing
+            half_open_probes: Requests allowed through while half-open
+        """
+        self.failure_threshold = CIRCUIT_FAILURE_THRESHOLD if failure_threshold is None else failure_threshold
+        self.reset_seconds = CIRCUIT_RESET_SECONDS if reset_seconds is None else reset_seconds
+        self.half_open_probes = CIRCUIT_HALF_OPEN_PROBES if half_open_probes is None else half_open_probes
+
+        self.state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._lock = threading.Lock()
+
+        self.opened = 0
+        self.rejected = 0
+
+    def allow(self):
+        """
+        Decide whether a request may be sent.
+
+        Returns:
+            True if the request may go ahead, False to fail fast
+        """
+        with self._lock:
+            if self.state == OPEN:
+                if time.monotonic() - self._opened_at < self.reset_seconds:
+                    self.rejected += 1
+                    return False
+                self.state = HALF_OPEN
+                self._probes = 0
+            if self.state == HALF_OPEN:
+                if self._probes >= self.half_open_probes:
+                    self.rejected += 1
+                    return False
+                self._probes += 1
+            return True
+
+    def on_success(self):
+        """Close the circuit after a successful response."""
+        with self._lock:
+            self.state = CLOSED
+            self._failures = 0
+
+    def on_failure(self):
+        """
+        Record a failed request.
+
+        Returns:
+            True if the circuit is now open
+        """
+        with self._lock:
+            self._failures += 1
+            if self.state == HALF_OPEN or self._failures >= self.failure_threshold:
+                if self.state != OPEN:
+                    self.opened += 1
+                self.state = OPEN
+                self._opened_at = time.monotonic()
+            return self.state == OPEN
+
+    def stats(self):
+        """Return a snapshot of this breaker's state and counters."""
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self._failures,
+                "opened": self.opened,
+                "rejected": self.rejected,
+            }
+
+
+class RetryBudget:
+    """Per-run cap on the total number of retries."""
+
+    def __init__(self, max_retries=None):
+        """
+        Args:
+            max_retries: Retries allowed across all requests (None = unlimited)
+        """
+        self.max_retries = RETRY_BUDGET_PER_RUN if max_retries is None else max_retries
+        self.spent = 0
+        self.denied = 0
+        self._lock = threading.Lock()
+
+    def try_spend(self):
+        """
+        Take one retry from the budget.
+
+        Returns:
+            True if the retry may be attempted
+        """
+        with self._lock:
+            if self.max_retries is not None and self.spent >= self.max_retries:
+                self.denied += 1
+                return False
+            self.spent += 1
+            return True
+
+    def reset(self):
+        """Refill the budget (e.g. at the start of a polling cycle)."""
+        with self._lock:
+            self.spent = 0
+            self.denied = 0
+
+    def stats(self):
+        with self._lock:
+            return {"max_retries": self.max_retries, "spent": self.spent, "denied": self.denied}
+
+
+class FailureRegistry:
+    """Circuit breakers per endpoint family, the retry budget and skipped URLs."""
+
+    def __init__(self):
+        self._breakers = {}
+        self._skipped = {}  # url -> reason, in insertion order
+        self._lock = threading.Lock()
+        self.retry_budget = RetryBudget()
+
+    def start_run(self):
+        """Begin a new run: refill the retry budget and forget skipped URLs."""
+        self.retry_budget.reset()
+        with self._lock:
+            self._skipped.clear()
+
+    def breaker(self, family):
+        """Get (creating if needed) the circuit breaker for an endpoint family."""
+        with self._lock:
+            breaker = self._breakers.get(family)
+            if breaker is None:
+                breaker = CircuitBreaker()
+                self._breakers[family] = breaker
+            return breaker
+
+    def record_skipped(self, url, reason):
+        """Remember a URL that was given up on, with the reason."""
+        with self._lock:
+            self._skipped[url] = reason
+
+    def clear_skipped(self, url):
+        """Forget a URL that has since been fetched successfully."""
+        with self._lock:
+            self._skipped.pop(url, None)
+
+    def skip_reason(self, url):
+        """Reason a URL was given up on, or None."""
+        with self._lock:
+            return self._skipped.get(url)
+
+    def skipped(self):
+        """List of {"url", "reason"} dicts for every URL given up on."""
+        with self._lock:
+            return [{"url": url, "reason": reason} for url, reason in self._skipped.items()]
+
+    def stats(self):
+        with self._lock:
+            breakers = dict(self._breakers)
+            skipped = len(self._skipped)
+        return {
+            "circuits": {family: breaker.stats() for family, breaker in sorted(breakers.items())},
+            "retry_budget": self.retry_budget.stats(),
+            "skipped": skipped,
+        }
+
+
+# Process-wide registry shared by every fetcher
+_registry = FailureRegistry()
+
+
+def get_failure_registry():
+    """Get the process-wide circuit breaker / retry budget registry."""
+    return _registry
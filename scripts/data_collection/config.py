@@ -4,6 +4,7 @@ Central configuration for NHL data collection scripts.
 Provides consistent paths, API settings, and constants across all data fetchers.
 """
 
+import os
 from pathlib import Path
 
 # =============================================================================
@@ -11,7 +12,10 @@ from pathlib import Path
 # =============================================================================
 # Scripts are in scripts/data_collection/, so we go up 3 levels to reach project root
 PROJECT_ROOT = Path(__file__).parent.parent.parent
-DATA_DIR = PROJECT_ROOT / "static" / "data"
+# Every writable root can be redirected (NHL_DATA_DIR, NHL_HEADSHOTS_DIR, NHL_REGISTRY_DIR,
+# NHL_FINNISH_CACHE_DIR, NHL_CACHE_ROOT), e.g. for a run against fake_api_server.py
+DATA_DIR = Path(os.environ.get("NHL_DATA_DIR", PROJECT_ROOT / "static" / "data"))
+HEADSHOTS_DIR = Path(os.environ.get("NHL_HEADSHOTS_DIR", PROJECT_ROOT / "static" / "headshots"))
 PREPOPULATED_DIR = DATA_DIR / "prepopulated"
 
 # Output directories for different data types
@@ -22,12 +26,40 @@ ALL_PLAYERS_DIR = PREPOPULATED_DIR / "all-players"  # All players by date
 # =============================================================================
 # NHL API Configuration
 # =============================================================================
-NHL_API_BASE = "https://api-web.nhle.com"
+# Override with NHL_API_BASE to point the collectors at a local stand-in (see fake_api_server.py)
+NHL_API_BASE = os.environ.get("NHL_API_BASE", "https://api-web.nhle.com").rstrip("/")
+NHL_STATS_API_BASE = os.environ.get("NHL_STATS_API_BASE", "https://api.nhle.com/stats/rest").rstrip("/")
 API_TIMEOUT = 15  # seconds (increased for slower responses)
 API_MAX_RETRIES = 5
-RATE_LIMIT_DELAY = 0.5  # seconds between requests (reduced, handled elsewhere)
 RATE_LIMIT_JITTER = (0.1, 0.5)  # random jitter range for retries
 
+# Token-bucket rate limiting per host (see rate_limiter.py)
+RATE_LIMIT_PER_SECOND = float(os.environ.get("NHL_API_RATE_LIMIT", 2.0))  # sustained requests per second
+RATE_LIMIT_BURST = int(os.environ.get("NHL_API_RATE_BURST", 4))  # requests allowed back-to-back before throttling kicks in
+RATE_LIMIT_MIN_RATE = 0.2  # floor for the adaptive rate after repeated 429s
+RATE_LIMIT_BACKOFF_FACTOR = 0.5  # rate multiplier applied on every 429
+RATE_LIMIT_RECOVERY_STEP = 0.05  # requests/second regained per successful request
+
+# Failure containment (see circuit_breaker.py)
+CIRCUIT_FAILURE_THRESHOLD = 5  # consecutive failures before an endpoint family fails fast
+CIRCUIT_RESET_SECONDS = 60  # how long an open circuit rejects requests before probing
+CIRCUIT_HALF_OPEN_PROBES = 1  # probe requests let through while half-open
+RETRY_BUDGET_PER_RUN = int(os.environ.get("NHL_API_RETRY_BUDGET", 100))  # total retries per run, all URLs
+
+# Connection pooling for the shared HTTP session (see utils.get_session)
+HTTP_POOL_CONNECTIONS = 4  # number of per-host pools kept alive
+HTTP_POOL_MAXSIZE = 8  # max keep-alive connections per host
+HTTP_POOL_BLOCK = False  # when the pool is full, open extra (unpooled) connections instead of waiting
+HTTP_KEEP_ALIVE = True  # reuse TCP+TLS connections between requests
+FETCH_MAX_CONCURRENCY = 4  # default worker count for utils.fetch_many
+GAME_PIPELINE_WORKERS = int(os.environ.get("NHL_GAME_WORKERS", 4))  # games processed at once (1 = serial)
+# Summarise games without tracked Finnish players from the schedule alone
+# (no boxscore/play-by-play); NHL_PREFILTER_VERIFY=1 still checks them in the background.
+SCHEDULE_PREFILTER = os.environ.get("NHL_SCHEDULE_PREFILTER", "1") != "0"
+SCHEDULE_PREFILTER_VERIFY = os.environ.get("NHL_PREFILTER_VERIFY", "0") == "1"
+SINGLE_FLIGHT_MEMO_SECONDS = 30  # reuse a just-fetched result for identical URLs
+SINGLE_FLIGHT_MEMO_SIZE = 256  # max recent results kept in memory
+
 # =============================================================================
 # Data File Settings
 # =============================================================================
@@ -37,12 +69,73 @@ JSON_ENSURE_ASCII = False
 # =============================================================================
 # Cache Settings
 # =============================================================================
-FINNISH_CACHE_DIR = PROJECT_ROOT / "scripts" / "data_collection" / "finnish" / "cache"
+FINNISH_CACHE_DIR = Path(os.environ.get("NHL_FINNISH_CACHE_DIR", PROJECT_ROOT / "scripts" / "data_collection" / "finnish" / "cache"))
 FINNISH_CACHE_FILE = FINNISH_CACHE_DIR / "finnish-players.json"
 
+# Committed registries (venue addresses, teams), so CI runs start warm
+REGISTRY_DIR = Path(os.environ.get("NHL_REGISTRY_DIR", PROJECT_ROOT / "scripts" / "data_collection" / "cache"))
+
+# Venue address registry (see venue_registry.py)
+VENUE_REGISTRY_FILE = REGISTRY_DIR / "venue-registry.json"
+VENUE_REFRESH_SECONDS = 90 * 24 * 60 * 60  # re-geocode entries older than this in the background
+
+# Season team registry (see team_registry.py): names, IDs and home venues
+TEAM_REGISTRY_FILE = REGISTRY_DIR / "team-registry.json"
+TEAM_REGISTRY_REFRESH_SECONDS = 7 * 24 * 60 * 60  # rebuild from standings/teams endpoints after this
+
+# Local, gitignored state (response cache, indexes, checkpoints, reports)
+LOCAL_CACHE_DIR = Path(os.environ.get("NHL_CACHE_ROOT", PROJECT_ROOT / ".cache"))
+
+# On-disk NHL API response cache (see response_cache.py)
+# Set NHL_API_CACHE=0 to bypass it for a run.
+API_CACHE_ENABLED = os.environ.get("NHL_API_CACHE", "1") != "0"
+API_CACHE_DIR = Path(os.environ.get("NHL_API_CACHE_DIR", LOCAL_CACHE_DIR / "nhl-api"))
+API_CACHE_MAX_BYTES = 256 * 1024 * 1024  # LRU eviction above this size
+# Seconds a response stays fresh, per endpoint family (None = forever, 0 = never cached).
+# Boxscores and play-by-play are only kept forever once the game is official (OFF);
+# FINAL payloads are provisional and stat corrections arrive after them.
+API_CACHE_TTLS = {
+    "boxscore": None,
+    "play-by-play": None,
+    "live-game": 30,
+    "final-game": 5 * 60,
+    "schedule": 5 * 60,
+    "club-schedule": 24 * 60 * 60,
+    "player-landing": 6 * 60 * 60,
+    "roster": 6 * 60 * 60,
+    "standings": 60 * 60,
+    "teams": 24 * 60 * 60,
+}
+
+# Final game results indexed from the daily game files (see game_facts.py)
+GAME_FACTS_FILE = Path(os.environ.get("NHL_GAME_FACTS_FILE", LOCAL_CACHE_DIR / "game-facts.json"))
+
+# SQLite store of the daily game files, queried by repairs (see game_store.py)
+GAME_STORE_FILE = Path(os.environ.get("NHL_GAME_STORE", LOCAL_CACHE_DIR / "game-store.sqlite3"))
+
+# Multi-date backfill checkpoint (see finnish/fetch_season.py)
+BACKFILL_CHECKPOINT_FILE = Path(os.environ.get("NHL_BACKFILL_CHECKPOINT", LOCAL_CACHE_DIR / "backfill-checkpoint.json"))
+BACKFILL_DATE_WORKERS = int(os.environ.get("NHL_BACKFILL_DATE_WORKERS", 2))  # dates processed at once
+
+# Full-season NDJSON shards and checkpoint (see season/season_stream.py)
+SEASON_STREAM_DIR = Path(os.environ.get("NHL_SEASON_STREAM_DIR", LOCAL_CACHE_DIR / "season-stream"))
+
+# Columnar player-game store, one .npy per column (see season_store.py)
+SEASON_STORE_DIR = Path(os.environ.get("NHL_SEASON_STORE_DIR", LOCAL_CACHE_DIR / "season-store"))
+
+# Per-endpoint metrics and run reports (see metrics.py, utils.start_run_report)
+RUN_REPORT_DIR = Path(os.environ.get("NHL_RUN_REPORT_DIR", LOCAL_CACHE_DIR / "run-reports"))
+METRICS_LATENCY_BUCKETS_MS = (25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Record/replay cassette for offline runs (see cassette.py)
+# NHL_API_CASSETTE=path selects the archive, NHL_API_CASSETTE_MODE=record|replay.
+API_CASSETTE_PATH = os.environ.get("NHL_API_CASSETTE") or None
+API_CASSETTE_MODE = os.environ.get("NHL_API_CASSETTE_MODE", "replay")
+
 # =============================================================================
 # External Services
 # =============================================================================
 # OpenStreetMap Nominatim for geocoding
 NOMINATIM_BASE = "https://nominatim.openstreetmap.org/search"
 NOMINATIM_TIMEOUT = 5  # seconds
+NOMINATIM_RATE_LIMIT = 1.0  # requests per second (Nominatim usage policy)
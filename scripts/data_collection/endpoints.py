@@ -0,0 +1,41 @@
+"""
+NHL API endpoint classification.
+
+Maps request URLs to endpoint families (schedule, boxscore, play-by-play, ...)
+so caching, metrics and failure handling can apply per-family policies.
+"""
+
+import re
+from urllib.parse import urlsplit
+
+# (family, path regex) pairs, checked in order
+ENDPOINT_PATTERNS = [
+    ("schedule", re.compile(r"^/v1/schedule/")),
+    ("club-schedule", re.compile(r"^/v1/club-schedule-season/")),
+    ("boxscore", re.compile(r"^/v1/gamecenter/\d+/boxscore")),
+    ("play-by-play", re.compile(r"^/v1/gamecenter/\d+/play-by-play")),
+    ("player-landing", re.compile(r"^/v1/player/\d+/landing")),
+    ("roster", re.compile(r"^/v1/roster/")),
+    ("standings", re.compile(r"^/v1/standings/")),
+    ("teams", re.compile(r"^/stats/rest/en/team$")),
+]
+
+
+def endpoint_family(url):
+    """
+    Classify a request URL into an endpoint family.
+
+    Args:
+        url: Request URL
+
+    Returns:
+        Family name such as "boxscore" or "schedule"; "geocode" for
+        Nominatim and "other" for anything unrecognised
+    """
+    parts = urlsplit(url)
+    if parts.hostname and "nominatim" in parts.hostname:
+        return "geocode"
+    for family, pattern in ENDPOINT_PATTERNS:
+        if pattern.match(parts.path):
+            return family
+    return "other"
@@ -0,0 +1,841 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the NHL web API (api-web.nhle.com).
+
+Serves the endpoints the collectors use (schedule, club schedule, boxscore,
+play-by-play, player landing, roster, standings, and the stats API team list) from a
+recorded cassette or from deterministic synthetic payloads, with injectable
+latency, 429 bursts and 5xx failures. Point the collectors at it with
+NHL_API_BASE (and NHL_STATS_API_BASE) to measure throughput, retry behaviour
+and end-to-end runtime under controlled conditions.
+
+Usage:
+    python fake_api_server.py [--port 8800] [--cassette FILE]
+                              [--latency exp:40] [--error-rate 0.02]
+                              [--throttle-every 200 --throttle-burst 10]
+
+    # Keep everything the run writes out of the tree
+    SANDBOX=/tmp/nhl-sandbox
+    mkdir -p $SANDBOX/finnish-cache && cp scripts/data_collection/finnish/cache/*.json $SANDBOX/finnish-cache/
+    NHL_API_BASE=http://127.0.0.1:8800 NHL_STATS_API_BASE=http://127.0.0.1:8800/stats/rest \
+    NHL_DATA_DIR=$SANDBOX/data NHL_HEADSHOTS_DIR=$SANDBOX/headshots \
+    NHL_REGISTRY_DIR=$SANDBOX/registry NHL_FINNISH_CACHE_DIR=$SANDBOX/finnish-cache \
+    NHL_CACHE_ROOT=$SANDBOX/cache \
+        ./scripts/daily_update.sh 2025-11-15
+
+Synthetic game IDs use game numbers from SYNTHETIC_GAME_NUMBER_BASE up, so
+they cannot be mistaken for real games.
+
+Latency specs: "0", "fixed:MS", "uniform:LO:HI", "exp:MEAN",
+"lognormal:MEDIAN:SIGMA" (all in milliseconds).
+
+GET /__stats returns request counters; GET /__reset clears them.
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import random
+import re
+import sys
+import threading
+import time
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit
+
+# Add this directory to path for imports when run from elsewhere
+sys.path.insert(0, str(Path(__file__).parent))
+
+from config import FINNISH_CACHE_FILE
+from endpoints import endpoint_family
+from cassette import Cassette, interaction_body
+from utils import load_json
+
+# =============================================================================
+# Synthetic league
+# =============================================================================
+SEASON_START = date(2025, 10, 7)
+SEASON_END = date(2026, 4, 16)  # last regular-season day in club schedules
+SEASON_ID = 2025
+MAX_GAMES_PER_DAY = 16
+# Game numbers start here; a real regular season stops at 1312, so synthetic
+# games can never collide with real ones in the data files.
+SYNTHETIC_GAME_NUMBER_BASE = 5000
+
+# (abbrev, placeName, commonName, venue)
+TEAMS = [
+    ("ANA", "Anaheim", "Ducks", "Honda Center"),
+    ("BOS", "Boston", "Bruins", "TD Garden"),
+    ("BUF", "Buffalo", "Sabres", "KeyBank Center"),
+    ("CGY", "Calgary", "Flames", "Scotiabank Saddledome"),
+    ("CAR", "Carolina", "Hurricanes", "Lenovo Center"),
+    ("CHI", "Chicago", "Blackhawks", "United Center"),
+    ("COL", "Colorado", "Avalanche", "Ball Arena"),
+    ("CBJ", "Columbus", "Blue Jackets", "Nationwide Arena"),
+    ("DAL", "Dallas", "Stars", "American Airlines Center"),
+    ("DET", "Detroit", "Red Wings", "Little Caesars Arena"),
+    ("EDM", "Edmonton", "Oilers", "Rogers Place"),
+    ("FLA", "Florida", "Panthers", "Amerant Bank Arena"),
+    ("LAK", "Los Angeles", "Kings", "Crypto.com Arena"),
+    ("MIN", "Minnesota", "Wild", "Xcel Energy Center"),
+    ("MTL", "Montréal", "Canadiens", "Centre Bell"),
+    ("NSH", "Nashville", "Predators", "Bridgestone Arena"),
+    ("NJD", "New Jersey", "Devils", "Prudential Center"),
+    ("NYI", "New York", "Islanders", "UBS Arena"),
+    ("NYR", "New York", "Rangers", "Madison Square Garden"),
+    ("OTT", "Ottawa", "Senators", "Canadian Tire Centre"),
+    ("PHI", "Philadelphia", "Flyers", "Wells Fargo Center"),
+    ("PIT", "Pittsburgh", "Penguins", "PPG Paints Arena"),
+    ("SJS", "San Jose", "Sharks", "SAP Center at San Jose"),
+    ("SEA", "Seattle", "Kraken", "Climate Pledge Arena"),
+    ("STL", "St. Louis", "Blues", "Enterprise Center"),
+    ("TBL", "Tampa Bay", "Lightning", "Amalie Arena"),
+    ("TOR", "Toronto", "Maple Leafs", "Scotiabank Arena"),
+    ("UTA", "Utah", "Mammoth", "Delta Center"),
+    ("VAN", "Vancouver", "Canucks", "Rogers Arena"),
+    ("VGK", "Vegas", "Golden Knights", "T-Mobile Arena"),
+    ("WSH", "Washington", "Capitals", "Capital One Arena"),
+    ("WPG", "Winnipeg", "Jets", "Canada Life Centre"),
+]
+TEAM_INDEX = {team[0]: i for i, team in enumerate(TEAMS)}
+
+FIRST_NAMES = ["Alex", "Ben", "Connor", "Dylan", "Erik", "Filip", "Jack", "Leo", "Mason", "Nick", "Owen", "Ryan"]
+LAST_NAMES = ["Anderson", "Bennett", "Carter", "Dubois", "Eriksson", "Foley", "Gauthier", "Hughes",
+              "Ivanov", "Jensen", "Keller", "Larsen", "Morrison", "Novak", "Olsen", "Peterson"]
+COUNTRIES = ["CAN", "USA", "SWE", "CZE", "RUS", "SUI", "GER", "SVK"]
+ROSTER_LAYOUT = [("forwards", "C", 4), ("forwards", "L", 4), ("forwards", "R", 4),
+                 ("defensemen", "D", 7), ("goalies", "G", 2)]
+SYNTHETIC_ID_BASE = 8490000
+
+
+def _rng(*parts):
+    """Deterministic random generator for a tuple of keys."""
+    return random.Random(":".join(str(p) for p in parts))
+
+
+def _name(text):
+    return {"default": text}
+
+
+def _toi(seconds):
+    return f"{seconds // 60:02d}:{seconds % 60:02d}"
+
+
+class SyntheticLeague:
+    """Deterministic, self-consistent NHL data generated from a seed."""
+
+    def __init__(self, seed=0, today=None):
+        self.seed = seed
+        self.today = today or date.today()
+        self.finnish = {}  # team -> list of cached Finnish player records
+        for record in (load_json(FINNISH_CACHE_FILE) or {}).values():
+            self.finnish.setdefault(record.get("currentTeam"), []).append(record)
+
+    # -------------------------------------------------------------------------
+    # Rosters and players
+    # -------------------------------------------------------------------------
+    @lru_cache(maxsize=None)
+    def roster(self, team):
+        """Roster for a team: synthetic depth players plus cached Finns."""
+        rng = _rng(self.seed, "roster", team)
+        team_idx = TEAM_INDEX[team]
+        roster = {"forwards": [], "defensemen": [], "goalies": []}
+        n = 0
+        for category, position, count in ROSTER_LAYOUT:
+            for _ in range(count):
+                n += 1
+                player = {
+                    "id": SYNTHETIC_ID_BASE + team_idx * 100 + n,
+                    "firstName": _name(rng.choice(FIRST_NAMES)),
+                    "lastName": _name(rng.choice(LAST_NAMES)),
+                    "sweaterNumber": n + 1,
+                    "positionCode": position,
+                    "shootsCatches": rng.choice("LR"),
+                    "heightInInches": rng.randint(69, 77),
+                    "weightInPounds": rng.randint(175, 225),
+                    "birthDate": f"{rng.randint(1990, 2005)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+                    "birthCity": _name("Springfield"),
+                    "birthCountry": rng.choice(COUNTRIES),
+                    "headshot": "",
+                }
+                roster[category].append(player)
+        # Real Finnish players replace depth players at their position
+        for record in self.finnish.get(team, []):
+            category = {"G": "goalies", "D": "defensemen"}.get(record.get("position"), "forwards")
+            slot = next((i for i, p in enumerate(roster[category]) if p["id"] >= SYNTHETIC_ID_BASE), None)
+            if slot is None:
+                continue
+            roster[category][slot] = {
+                "id": record["playerId"],
+                "firstName": record.get("firstName", {}),
+                "lastName": record.get("lastName", {}),
+                "sweaterNumber": record.get("sweaterNumber", 0),
+                "positionCode": record.get("position", "C"),
+                "shootsCatches": record.get("shootsCatches", "L"),
+                "heightInInches": record.get("heightInches", 72),
+                "weightInPounds": record.get("weightLbs", 195),
+                "birthDate": record.get("birthDate", ""),
+                "birthCity": record.get("birthCity", {}),
+                "birthCountry": "FIN",
+                "headshot": record.get("headshot", ""),
+            }
+        return roster
+
+    def player_team(self, player_id):
+        """Find the team a player belongs to, or None."""
+        if player_id >= SYNTHETIC_ID_BASE:
+            team_idx = (player_id - SYNTHETIC_ID_BASE - 1) // 100
+            return TEAMS[team_idx][0] if 0 <= team_idx < len(TEAMS) else None
+        for team, records in self.finnish.items():
+            if any(r.get("playerId") == player_id for r in records):
+                return team
+        return None
+
+    def roster_players(self, team):
+        roster = self.roster(team)
+        return roster["forwards"] + roster["defensemen"] + roster["goalies"]
+
+    # -------------------------------------------------------------------------
+    # Schedule
+    # -------------------------------------------------------------------------
+    def games_on(self, day):
+        """Games scheduled on a date as (game_id, home, away) tuples."""
+        day_index = (day - SEASON_START).days
+        if day_index < 0 or SYNTHETIC_GAME_NUMBER_BASE + (day_index + 1) * MAX_GAMES_PER_DAY > 9999:
+            return []
+        rng = _rng(self.seed, "day", day.isoformat())
+        teams = [t[0] for t in TEAMS]
+        rng.shuffle(teams)
+        count = rng.randint(2, MAX_GAMES_PER_DAY // 2 + 4)
+        return [
+            (SEASON_ID * 1000000 + 20000 + SYNTHETIC_GAME_NUMBER_BASE + day_index * MAX_GAMES_PER_DAY + i + 1,
+             teams[2 * i], teams[2 * i + 1])
+            for i in range(min(count, len(teams) // 2))
+        ]
+
+    def game_date(self, game_id):
+        number = game_id % 10000 - SYNTHETIC_GAME_NUMBER_BASE - 1
+        return SEASON_START + timedelta(days=number // MAX_GAMES_PER_DAY)
+
+    def find_game(self, game_id):
+        for gid, home, away in self.games_on(self.game_date(game_id)):
+            if gid == game_id:
+                return home, away
+        return None
+
+    def game_state(self, day):
+        if day < self.today:
+            return "OFF"
+        return "LIVE" if day == self.today else "FUT"
+
+    def schedule_game(self, game_id, home, away, day):
+        rng = _rng(self.seed, "start", game_id)
+        start = datetime(day.year, day.month, day.day, 23, 0) + timedelta(minutes=30 * rng.randint(0, 6))
+        home_team = TEAMS[TEAM_INDEX[home]]
+        away_team = TEAMS[TEAM_INDEX[away]]
+        game = {
+            "id": game_id,
+            "season": SEASON_ID * 10000 + SEASON_ID + 1,
+            "gameType": 2,
+            "gameDate": day.isoformat(),
+            "venue": _name(home_team[3]),
+            "startTimeUTC": start.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "gameState": self.game_state(day),
+            "awayTeam": {"id": TEAM_INDEX[away] + 1, "abbrev": away, "commonName": _name(away_team[2]),
+                         "placeName": _name(away_team[1])},
+            "homeTeam": {"id": TEAM_INDEX[home] + 1, "abbrev": home, "commonName": _name(home_team[2]),
+                         "placeName": _name(home_team[1])},
+        }
+        if game["gameState"] != "FUT":
+            result = self.game_result(game_id)
+            game["awayTeam"]["score"] = result["away_score"]
+            game["homeTeam"]["score"] = result["home_score"]
+            game["periodDescriptor"] = {"number": result["periods"], "periodType": result["period_type"]}
+            if game["gameState"] == "OFF":
+                game["gameOutcome"] = {"lastPeriodType": result["period_type"]}
+        return game
+
+    def schedule(self, start):
+        """Week of schedule starting at a date, like /v1/schedule/{date}."""
+        game_week = []
+        for offset in range(7):
+            day = start + timedelta(days=offset)
+            games = [self.schedule_game(gid, home, away, day) for gid, home, away in self.games_on(day)]
+            game_week.append({
+                "date": day.isoformat(),
+                "dayAbbrev": day.strftime("%a").upper(),
+                "numberOfGames": len(games),
+                "games": games,
+            })
+        return {
+            "nextStartDate": (start + timedelta(days=7)).isoformat(),
+            "previousStartDate": (start - timedelta(days=7)).isoformat(),
+            "gameWeek": game_week,
+        }
+
+    def club_schedule(self, team):
+        """A team's games for the season, like /v1/club-schedule-season/{team}/{season}."""
+        games = []
+        day = SEASON_START
+        while day <= SEASON_END:
+            games.extend(
+                self.schedule_game(gid, home, away, day)
+                for gid, home, away in self.games_on(day) if team in (home, away)
+            )
+            day += timedelta(days=1)
+        return {
+            "previousSeason": (SEASON_ID - 1) * 10000 + SEASON_ID,
+            "currentSeason": SEASON_ID * 10000 + SEASON_ID + 1,
+            "clubTimezone": "America/New_York",
+            "games": games,
+        }
+
+    # -------------------------------------------------------------------------
+    # Games
+    # -------------------------------------------------------------------------
+    @lru_cache(maxsize=4096)
+    def game_result(self, game_id):
+        """Goals, scorers and final score for a game."""
+        home, away = self.find_game(game_id)
+        rng = _rng(self.seed, "game", game_id)
+        home_goals, away_goals = rng.randint(0, 6), rng.randint(0, 6)
+        sides = ["home"] * home_goals + ["away"] * away_goals
+        rng.shuffle(sides)
+        periods = 3
+        period_type = "REG"
+        if home_goals == away_goals:
+            periods = rng.choice([4, 4, 5])
+            period_type = "OT" if periods == 4 else "SO"
+            winner = rng.choice(["home", "away"])
+            if winner == "home":
+                home_goals += 1
+            else:
+                away_goals += 1
+            if period_type == "OT":
+                sides.append(winner)  # a shootout win is not a player goal
+
+        goals = []
+        score = {"home": 0, "away": 0}
+        for n, side in enumerate(sides):
+            team = home if side == "home" else away
+            skaters = [p for p in self.roster_players(team) if p["positionCode"] != "G"]
+            shooters = rng.sample(skaters, 3)
+            score[side] += 1
+            period = 4 if period_type == "OT" and n == len(sides) - 1 else 1 + n * 3 // len(sides)
+            goals.append({
+                "side": side,
+                "team": team,
+                "period": period,
+                "time": _toi(rng.randint(1, 1199)),
+                "scorer": shooters[0]["id"],
+                "assists": [p["id"] for p in shooters[1:1 + rng.randint(0, 2)]],
+                "situation": rng.choice(["1551"] * 8 + ["1541", "1451"]),
+                "home_score": score["home"],
+                "away_score": score["away"],
+            })
+        return {
+            "home": home,
+            "away": away,
+            "home_score": home_goals,
+            "away_score": away_goals,
+            "periods": periods,
+            "period_type": period_type,
+            "goals": goals,
+        }
+
+    def _team_stats(self, game_id, team, side, result, rng):
+        goals_for = [g for g in result["goals"] if g["side"] == side]
+        goals_against = result["away_score"] if side == "home" else result["home_score"]
+        stats = {"forwards": [], "defense": [], "goalies": []}
+        shots = 0
+        for player in self.roster_players(team):
+            pid = player["id"]
+            entry = {
+                "playerId": pid,
+                "sweaterNumber": player["sweaterNumber"],
+                "name": _name(f"{player['firstName'].get('default', '')[:1]}. {player['lastName'].get('default', '')}"),
+                "position": player["positionCode"],
+            }
+            if player["positionCode"] == "G":
+                stats["goalies"].append(entry)
+                continue
+            g = sum(1 for goal in goals_for if goal["scorer"] == pid)
+            a = sum(1 for goal in goals_for if pid in goal["assists"])
+            sog = g + rng.randint(0, 4)
+            shots += sog
+            entry.update({
+                "goals": g,
+                "assists": a,
+                "points": g + a,
+                "plusMinus": rng.randint(-2, 2),
+                "pim": rng.choice([0, 0, 0, 2]),
+                "hits": rng.randint(0, 5),
+                "powerPlayGoals": sum(1 for goal in goals_for if goal["scorer"] == pid and goal["situation"] != "1551"),
+                "sog": sog,
+                "faceoffWinningPctg": round(rng.random(), 3) if player["positionCode"] == "C" else 0.0,
+                "toi": _toi(rng.randint(600, 1500)),
+                "blockedShots": rng.randint(0, 3),
+                "shifts": rng.randint(14, 28),
+                "giveaways": rng.randint(0, 2),
+                "takeaways": rng.randint(0, 2),
+            })
+            stats["defense" if player["positionCode"] == "D" else "forwards"].append(entry)
+
+        starter = stats["goalies"][rng.randint(0, len(stats["goalies"]) - 1)]
+        for goalie in stats["goalies"]:
+            if goalie is starter:
+                shots_against = goals_against + rng.randint(18, 35)
+                goalie.update({
+                    "shotsAgainst": shots_against,
+                    "goalsAgainst": goals_against,
+                    "saves": shots_against - goals_against,
+                    "saveShotsAgainst": f"{shots_against - goals_against}/{shots_against}",
+                    "savePctg": round((shots_against - goals_against) / shots_against, 3),
+                    "toi": "60:00",
+                    "starter": True,
+                })
+            else:
+                goalie.update({"shotsAgainst": 0, "goalsAgainst": 0, "saves": 0,
+                               "saveShotsAgainst": "0/0", "toi": "00:00", "starter": False})
+        return stats, shots
+
+    @lru_cache(maxsize=1024)
+    def boxscore(self, game_id):
+        teams = self.find_game(game_id)
+        if teams is None:
+            return None
+        home, away = teams
+        day = self.game_date(game_id)
+        game = self.schedule_game(game_id, home, away, day)
+        state = game["gameState"]
+        box = {
+            "id": game_id,
+            "season": game["season"],
+            "gameType": 2,
+            "gameDate": day.isoformat(),
+            "venue": game["venue"],
+            "venueLocation": _name(TEAMS[TEAM_INDEX[home]][1]),
+            "startTimeUTC": game["startTimeUTC"],
+            "gameState": state,
+            "awayTeam": dict(game["awayTeam"]),
+            "homeTeam": dict(game["homeTeam"]),
+        }
+        if state == "FUT":
+            box["periodDescriptor"] = {"number": 1, "periodType": "REG"}
+            return box
+
+        result = self.game_result(game_id)
+        rng = _rng(self.seed, "box", game_id)
+        box["periodDescriptor"] = {"number": result["periods"], "periodType": result["period_type"]}
+        box["playerByGameStats"] = {}
+        for side, team in (("awayTeam", away), ("homeTeam", home)):
+            stats, shots = self._team_stats(game_id, team, side[:4], result, rng)
+            box["playerByGameStats"][side] = stats
+            box[side]["sog"] = shots
+        return box
+
+    def play_by_play(self, game_id):
+        box = self.boxscore(game_id)
+        if box is None:
+            return None
+        result = self.game_result(game_id) if box["gameState"] != "FUT" else {"goals": []}
+        goalies = {}
+        for side in ("awayTeam", "homeTeam"):
+            for goalie in box.get("playerByGameStats", {}).get(side, {}).get("goalies", []):
+                if goalie.get("starter"):
+                    goalies[side[:4]] = goalie["playerId"]
+        plays = []
+        for n, goal in enumerate(result["goals"], 1):
+            owner = box["homeTeam"] if goal["side"] == "home" else box["awayTeam"]
+            defending = "away" if goal["side"] == "home" else "home"
+            details = {
+                "eventOwnerTeamId": owner["id"],
+                "scoringPlayerId": goal["scorer"],
+                "goalieInNetId": goalies.get(defending),
+                "homeScore": goal["home_score"],
+                "awayScore": goal["away_score"],
+                "zoneCode": "O",
+            }
+            for i, assist in enumerate(goal["assists"], 1):
+                details[f"assist{i}PlayerId"] = assist
+            plays.append({
+                "eventId": n,
+                "periodDescriptor": {"number": goal["period"],
+                                     "periodType": "REG" if goal["period"] <= 3 else "OT"},
+                "timeInPeriod": goal["time"],
+                "situationCode": goal["situation"],
+                "typeDescKey": "goal",
+                "details": details,
+            })
+        return {
+            "id": game_id,
+            "gameState": box["gameState"],
+            "awayTeam": {"id": box["awayTeam"]["id"], "abbrev": box["awayTeam"]["abbrev"]},
+            "homeTeam": {"id": box["homeTeam"]["id"], "abbrev": box["homeTeam"]["abbrev"]},
+            "plays": plays,
+        }
+
+    # -------------------------------------------------------------------------
+    # Players, rosters, standings
+    # -------------------------------------------------------------------------
+    def landing(self, player_id):
+        team = self.player_team(player_id)
+        if team is None:
+            return None
+        player = next((p for p in self.roster_players(team) if p["id"] == player_id), None)
+        if player is None:
+            return None
+
+        last_games = []
+        day = self.today - timedelta(days=1)
+        while len(last_games) < 5 and day >= SEASON_START and (self.today - day).days <= 60:
+            for game_id, home, away in self.games_on(day):
+                if team not in (home, away):
+                    continue
+                side = "homeTeam" if team == home else "awayTeam"
+                stats = self.boxscore(game_id)["playerByGameStats"][side]
+                line = next(p for group in stats.values() for p in group if p["playerId"] == player_id)
+                entry = {
+                    "gameId": game_id,
+                    "gameDate": day.isoformat(),
+                    "teamAbbrev": team,
+                    "opponentAbbrev": away if team == home else home,
+                    "homeRoadFlag": "H" if team == home else "R",
+                    "toi": line.get("toi", "00:00"),
+                }
+                if player["positionCode"] == "G":
+                    entry.update({key: line.get(key, 0) for key in ("shotsAgainst", "goalsAgainst")})
+                    entry["savePctg"] = line.get("savePctg", 0.0)
+                else:
+                    entry.update({key: line.get(key, 0) for key in ("goals", "assists", "points", "plusMinus")})
+                last_games.append(entry)
+            day -= timedelta(days=1)
+
+        return {
+            "playerId": player_id,
+            "isActive": True,
+            "currentTeamAbbrev": team,
+            "firstName": player["firstName"],
+            "lastName": player["lastName"],
+            "sweaterNumber": player["sweaterNumber"],
+            "position": player["positionCode"],
+            "headshot": player["headshot"],
+            "heightInInches": player["heightInInches"],
+            "weightInPounds": player["weightInPounds"],
+            "birthDate": player["birthDate"],
+            "birthCity": player["birthCity"],
+            "birthCountry": player["birthCountry"],
+            "shootsCatches": player["shootsCatches"],
+            "last5Games": last_games[:5],
+        }
+
+    def standings(self):
+        rows = []
+        for abbrev, place, common, _ in TEAMS:
+            rng = _rng(self.seed, "standings", abbrev, self.today.isoformat())
+            wins, losses, ot = rng.randint(5, 40), rng.randint(5, 30), rng.randint(0, 10)
+            rows.append({
+                "teamAbbrev": _name(abbrev),
+                "teamName": _name(f"{place} {common}"),
+                "teamCommonName": _name(common),
+                "placeName": _name(place),
+                "gamesPlayed": wins + losses + ot,
+                "wins": wins,
+                "losses": losses,
+                "otLosses": ot,
+                "points": 2 * wins + ot,
+            })
+        rows.sort(key=lambda row: -row["points"])
+        return {"wildCardIndicator": True, "standings": rows}
+
+    def teams(self):
+        """Team list like the stats API's /en/team."""
+        data = [
+            {"id": TEAM_INDEX[abbrev] + 1, "franchiseId": TEAM_INDEX[abbrev] + 1,
+             "fullName": f"{place} {common}", "leagueId": 133, "rawTricode": abbrev, "triCode": abbrev}
+            for abbrev, place, common, _ in TEAMS
+        ]
+        return {"data": data, "total": len(data)}
+
+    def respond(self, path):
+        """
+        Build the JSON payload for an API path.
+
+        Returns:
+            Parsed payload, or None for an unknown resource (404)
+        """
+        family = endpoint_family(path)
+        match = re.search(r"/(\d+)/", path)
+        if family == "schedule":
+            raw = path.rstrip("/").rsplit("/", 1)[-1]
+            start = self.today if raw == "now" else date.fromisoformat(raw)
+            return self.schedule(start)
+        if family == "boxscore":
+            return self.boxscore(int(match.group(1)))
+        if family == "play-by-play":
+            return self.play_by_play(int(match.group(1)))
+        if family == "player-landing":
+            return self.landing(int(match.group(1)))
+        if family == "roster":
+            team = path.split("/")[3]
+            return self.roster(team) if team in TEAM_INDEX else None
+        if family == "club-schedule":
+            team = path.split("/")[3]
+            return self.club_schedule(team) if team in TEAM_INDEX else None
+        if family == "standings":
+            return self.standings()
+        if family == "teams":
+            return self.teams()
+        return None
+
+
+# =============================================================================
+# Fault injection
+# =============================================================================
+def parse_latency(spec):
+    """
+    Parse a latency spec into a sampler returning seconds.
+
+    Args:
+        spec: "0", "fixed:MS", "uniform:LO:HI", "exp:MEAN" or "lognormal:MEDIAN:SIGMA"
+
+    Returns:
+        Callable taking a random.Random and returning a delay in seconds
+    """
+    kind, *args = spec.split(":")
+    values = [float(a) / 1000.0 for a in args]
+    if kind in ("0", "none"):
+        return lambda rng: 0.0
+    if kind == "fixed" and len(values) == 1:
+        return lambda rng: values[0]
+    if kind == "uniform" and len(values) == 2:
+        return lambda rng: rng.uniform(values[0], values[1])
+    if kind == "exp" and len(values) == 1:
+        return lambda rng: rng.expovariate(1.0 / values[0]) if values[0] > 0 else 0.0
+    if kind == "lognormal" and len(args) == 2:
+        median, sigma = values[0], float(args[1])
+        return lambda rng: rng.lognormvariate(math.log(median), sigma) if median > 0 else 0.0
+    raise argparse.ArgumentTypeError(f"Invalid latency spec: {spec!r}")
+
+
+class Faults:
+    """Latency, 429 bursts and 5xx failures applied to every API request."""
+
+    def __init__(self, latency="0", error_rate=0.0, throttle_every=0, throttle_burst=0,
+                 retry_after=1, seed=0):
+        self.sample_latency = parse_latency(latency)
+        self.error_rate = error_rate
+        self.throttle_every = throttle_every
+        self.throttle_burst = throttle_burst
+        self.retry_after = retry_after
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._count = 0
+
+    def decide(self):
+        """
+        Pick the fault for the next request.
+
+        Returns:
+            (delay_seconds, status) where status is None for a normal answer
+        """
+        with self._lock:
+            self._count += 1
+            delay = self.sample_latency(self._rng)
+            if self.throttle_every and (self._count - 1) % self.throttle_every >= self.throttle_every - self.throttle_burst:
+                return delay, 429
+            if self.error_rate and self._rng.random() < self.error_rate:
+                return delay, self._rng.choice([500, 502, 503])
+        return delay, None
+
+
+# =============================================================================
+# HTTP server
+# =============================================================================
+class StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, league, faults, cassette=None, synthetic_fallback=True):
+        super().__init__(address, StandInHandler)
+        self.league = league
+        self.faults = faults
+        self.synthetic_fallback = synthetic_fallback
+        self.recorded = {}
+        if cassette is not None:
+            for url, interaction in cassette.interactions.items():
+                parts = urlsplit(url)
+                key = parts.path + (f"?{parts.query}" if parts.query else "")
+                self.recorded[key] = interaction
+        self.stats_lock = threading.Lock()
+        self.reset_stats()
+
+    def reset_stats(self):
+        with self.stats_lock:
+            self.stats = {"requests": 0, "bytes": 0, "by_status": {}, "by_family": {},
+                          "started_at": time.time()}
+
+    def count(self, family, status, size):
+        with self.stats_lock:
+            self.stats["requests"] += 1
+            self.stats["bytes"] += size
+            self.stats["by_status"][str(status)] = self.stats["by_status"].get(str(status), 0) + 1
+            self.stats["by_family"][family] = self.stats["by_family"].get(family, 0) + 1
+
+    def snapshot(self):
+        with self.stats_lock:
+            stats = json.loads(json.dumps(self.stats))
+        elapsed = time.time() - stats.pop("started_at")
+        stats["elapsed_seconds"] = round(elapsed, 3)
+        stats["requests_per_second"] = round(stats["requests"] / elapsed, 2) if elapsed > 0 else 0.0
+        return stats
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "NHLStandIn/1.0"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body=b"", content_type="application/json", headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        if body and self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _send_json(self, status, payload, headers=None):
+        self._send(status, json.dumps(payload, ensure_ascii=False).encode("utf-8"), headers=headers)
+
+    def do_GET(self):
+        server = self.server
+        if self.path == "/__stats":
+            return self._send_json(200, server.snapshot())
+        if self.path == "/__reset":
+            server.reset_stats()
+            return self._send_json(200, {"reset": True})
+
+        family = endpoint_family(self.path)
+        delay, fault = server.faults.decide()
+        if delay:
+            time.sleep(delay)
+
+        if fault == 429:
+            server.count(family, 429, 0)
+            return self._send_json(429, {"message": "Too Many Requests"},
+                                   headers={"Retry-After": str(server.faults.retry_after)})
+        if fault is not None:
+            server.count(family, fault, 0)
+            return self._send_json(fault, {"message": "Injected failure"})
+
+        status, body, content_type = self._payload()
+        etag = f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+        if status == 200 and self.headers.get("If-None-Match") == etag:
+            server.count(family, 304, 0)
+            return self._send(304, headers={"ETag": etag})
+
+        server.count(family, status, len(body))
+        self._send(status, body, content_type, headers={"ETag": etag} if status == 200 else None)
+
+    do_HEAD = do_GET
+
+    def _payload(self):
+        """Look up the response body: cassette first, then synthetic data."""
+        interaction = self.server.recorded.get(self.path)
+        if interaction is not None:
+            content_type = interaction.get("headers", {}).get("Content-Type", "application/json")
+            return interaction["status"], interaction_body(interaction), content_type
+
+        if self.server.synthetic_fallback:
+            try:
+                payload = self.server.league.respond(self.path.split("?", 1)[0])
+            except (ValueError, IndexError, TypeError):
+                payload = None
+            if payload is not None:
+                return 200, json.dumps(payload, ensure_ascii=False).encode("utf-8"), "application/json"
+
+        return 404, json.dumps({"message": "Not found"}).encode("utf-8"), "application/json"
+
+
+def serve(host="127.0.0.1", port=8800, league=None, faults=None, cassette=None, synthetic_fallback=True):
+    """
+    Start the stand-in server on a background thread.
+
+    Returns:
+        StandInServer (call shutdown() to stop it)
+    """
+    server = StandInServer((host, port), league or SyntheticLeague(), faults or Faults(),
+                           cassette=cassette, synthetic_fallback=synthetic_fallback)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+# =============================================================================
+# Main Entry Point
+# =============================================================================
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the NHL web API")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8800, help="Port (default: 8800)")
+    parser.add_argument("--cassette", help="Serve recorded responses from this cassette")
+    parser.add_argument("--no-synthetic", action="store_true",
+                        help="Answer 404 for paths missing from the cassette instead of synthesizing them")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for synthetic data and faults")
+    parser.add_argument("--today", help="Date treated as today for game states (YYYY-MM-DD)")
+    parser.add_argument("--latency", type=str, default="0",
+                        help="Latency distribution, e.g. fixed:50, uniform:20:80, exp:40, lognormal:40:0.5")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 5xx")
+    parser.add_argument("--throttle-every", type=int, default=0,
+                        help="Start a 429 burst every N requests (0 = never)")
+    parser.add_argument("--throttle-burst", type=int, default=0, help="Length of each 429 burst")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds sent with 429s")
+    args = parser.parse_args()
+
+    try:
+        parse_latency(args.latency)
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+    if args.throttle_burst > args.throttle_every:
+        parser.error("--throttle-burst cannot exceed --throttle-every")
+
+    cassette = Cassette(args.cassette, "replay") if args.cassette else None
+    today = date.fromisoformat(args.today) if args.today else None
+    server = serve(
+        args.host,
+        args.port,
+        league=SyntheticLeague(seed=args.seed, today=today),
+        faults=Faults(args.latency, args.error_rate, args.throttle_every, args.throttle_burst,
+                      args.retry_after, args.seed),
+        cassette=cassette,
+        synthetic_fallback=not args.no_synthetic,
+    )
+
+    base = f"http://{args.host}:{args.port}"
+    print(f"🏒 NHL API stand-in listening on {base}")
+    if cassette is not None:
+        print(f"   📼 {len(server.recorded)} recorded response(s) from {args.cassette}")
+    print(f"   Latency: {args.latency}, 5xx rate: {args.error_rate:.1%}, "
+          f"429 bursts: {args.throttle_burst}/{args.throttle_every or '-'}")
+    print(f"   Use: NHL_API_BASE={base} python finnish/fetch.py 2025-11-15")
+    print("   Press Ctrl+C to stop")
+
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        print()
+        print(json.dumps(server.snapshot(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
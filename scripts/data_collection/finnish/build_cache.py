@@ -8,9 +8,8 @@ cache of all Finnish players currently in the NHL.
 Usage: python build-finnish-cache-from-games.py
 """
 
+import copy
 import json
-import requests
-import time
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -18,33 +17,29 @@ from pathlib import Path
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from config import FINNISH_CACHE_FILE
+from config import FINNISH_CACHE_FILE, NHL_API_BASE
+from utils import (
+    fetch_from_api,
+    fetch_many,
+    load_json,
+    format_connection_stats,
+    format_cache_stats,
+    format_failure_stats,
+    get_skip_reason,
+    get_skipped_requests,
+    start_run_report,
+    player_landing_url,
+    roster_url,
+    standings_url,
+)
 
 # Import Finnish text correction utilities
-from finnish_text_utils import normalize_finnish_player_data
-
-# NHL API endpoints
-NHL_API_BASE = "https://api-web.nhle.com"
-
-def fetch_from_api(url, max_retries=3):
-    """Fetch data from NHL API with retry logic"""
-    for attempt in range(max_retries):
-        try:
-            response = requests.get(url, timeout=15)
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
-            if attempt == max_retries - 1:
-                print(f"Error fetching {url}: {e}")
-                return None
-            time.sleep(2)
-    return None
+from finnish_text_utils import normalize_cache_record
 
 
 def get_all_teams():
     """Get list of all active NHL team abbreviations"""
-    url = f"{NHL_API_BASE}/v1/standings/now"
-    data = fetch_from_api(url)
+    data = fetch_from_api(standings_url())
     teams = []
     if data and "standings" in data:
         for record in data["standings"]:
@@ -59,16 +54,15 @@ def get_boxscore(game_id):
 
 def get_team_roster(team_abbrev):
      """Get roster for a specific team"""
-     url = f"{NHL_API_BASE}/v1/roster/{team_abbrev}/current"
-     return fetch_from_api(url)
+     return fetch_from_api(roster_url(team_abbrev))
 
 def get_player_info(player_id):
     """Get player information"""
-    url = f"{NHL_API_BASE}/v1/player/{player_id}/landing"
-    return fetch_from_api(url)
+    return fetch_from_api(player_landing_url(player_id))
 
 
 def main():
+    start_run_report("build_cache")
     print("Building comprehensive Finnish players cache (Roster Scan Mode)...")
     print("=" * 60)
     print()
@@ -82,64 +76,96 @@ def main():
     finnish_players = {}
     player_count = 0
 
+    # Previous cache lets unchanged rosters skip landing fetches entirely
+    previous_cache = load_json(FINNISH_CACHE_FILE) or {}
+
+    # Fetch every team's roster in one concurrent batch
+    # (conditional requests: unchanged rosters come back as cheap 304s)
+    rosters = fetch_many([roster_url(team) for team in teams], with_status=True)
+
     # Scan each team's roster
-    for i, team in enumerate(teams, 1):
+    for i, (team, roster_result) in enumerate(zip(teams, rosters), 1):
         print(f"[{i}/{len(teams)}] Scanning {team} roster...", end=" ")
-        
-        roster = get_team_roster(team)
+
+        roster = roster_result.data
         if not roster:
-            print("Failed to fetch roster")
+            # Keep last build's players for this team rather than dropping them
+            kept = {
+                int(player_id): record for player_id, record in previous_cache.items()
+                if record.get("currentTeam") == team
+            }
+            finnish_players.update(kept)
+            player_count += len(kept)
+            reason = get_skip_reason(roster_url(team)) or "fetch failed"
+            print(f"Failed to fetch roster ({reason}); kept {len(kept)} cached players")
             continue
 
         team_finnish_count = 0
-        
+
         # Roster is grouped by position categories
+        # Check nationality using birthCountry
+        # Note: API uses 3-letter codes like "FIN", "USA", "SWE"
+        # Skip players already found (though unlikely with team rosters)
+        finnish_ids = []
         for category in ["forwards", "defensemen", "goalies"]:
             for player in roster.get(category, []):
-                # Check nationality using birthCountry
-                # Note: API uses 3-letter codes like "FIN", "USA", "SWE"
-                if player.get("birthCountry") == "FIN":
-                    player_id = player.get("id")
-                    
-                    # Skip if already found (though unlikely with team rosters)
-                    if player_id in finnish_players:
-                        continue
-
-                    # Fetch full player details for cache consistency
-                    # The roster has some info, but landing page has everything we need for the cache format
-                    player_landing = get_player_info(player_id)
-                    
-                    if player_landing:
-                         # Apply Finnish text corrections
-                        player_info = normalize_finnish_player_data(player_landing)
-
-                        finnish_players[player_id] = {
-                            "playerId": player_id,
-                            "name": f"{player_info.get('firstName', {}).get('default', '')} {player_info.get('lastName', {}).get('default', '')}".strip(),
-                            "firstName": player_info.get("firstName", {}),
-                            "lastName": player_info.get("lastName", {}),
-                            "position": player_info.get("position", "N/A"),
-                            "sweaterNumber": player_info.get("sweaterNumber", 0),
-                            "birthDate": player_info.get("birthDate", ""),
-                            "birthCity": player_info.get("birthCity", {}),
-                            "birthCountry": player_info.get("birthCountry", ""),
-                            "birthplace": f"{player_info.get('birthCity', {}).get('default', '')}, {player_info.get('birthCountry', '')}",
-                            "heightInches": player_info.get("heightInInches", 0),
-                            "weightLbs": player_info.get("weightInPounds", 0),
-                            "shootsCatches": player_info.get("shootsCatches", ""),
-                            "headshot": player_info.get("headshot", ""),
-                            "isActive": player_info.get("isActive", True),
-                            "currentTeam": team  # Add current team info
-                        }
-                        team_finnish_count += 1
-                        player_count += 1
-            
-        print(f"Found {team_finnish_count} Finnish players")
-        
-        # Rate limiting
-        time.sleep(0.5)
-
+                player_id = player.get("id")
+                if (player.get("birthCountry") == "FIN"
+                        and player_id not in finnish_players
+                        and player_id not in finnish_ids):
+                    finnish_ids.append(player_id)
+
+        # Roster unchanged since the last build: keep the existing records
+        if roster_result.unchanged:
+            reused = [
+                previous_cache.get(str(player_id)) for player_id in finnish_ids
+            ]
+            if all(record and record.get("currentTeam") == team for record in reused):
+                for player_id, record in zip(finnish_ids, reused):
+                    finnish_players[player_id] = record
+                team_finnish_count = len(reused)
+                player_count += team_finnish_count
+                print(f"Found {team_finnish_count} Finnish players (roster unchanged)")
+                continue
+
+        # Fetch full player details for cache consistency
+        # The roster has some info, but landing page has everything we need for the cache format
+        landings = fetch_many([player_landing_url(player_id) for player_id in finnish_ids])
+
+        for player_id, player_landing in zip(finnish_ids, landings):
+            if not player_landing and str(player_id) in previous_cache:
+                # Landing page unavailable: keep the previous record, now on this team
+                finnish_players[player_id] = dict(previous_cache[str(player_id)], currentTeam=team)
+                team_finnish_count += 1
+                player_count += 1
+            elif player_landing:
+                # Copy: fetched payloads are shared, and the record is corrected in place
+                player_info = copy.deepcopy(player_landing)
+
+                record = {
+                    "playerId": player_id,
+                    "name": f"{player_info.get('firstName', {}).get('default', '')} {player_info.get('lastName', {}).get('default', '')}".strip(),
+                    "firstName": player_info.get("firstName", {}),
+                    "lastName": player_info.get("lastName", {}),
+                    "position": player_info.get("position", "N/A"),
+                    "sweaterNumber": player_info.get("sweaterNumber", 0),
+                    "birthDate": player_info.get("birthDate", ""),
+                    "birthCity": player_info.get("birthCity", {}),
+                    "birthCountry": player_info.get("birthCountry", ""),
+                    "birthplace": f"{player_info.get('birthCity', {}).get('default', '')}, {player_info.get('birthCountry', '')}",
+                    "heightInches": player_info.get("heightInInches", 0),
+                    "weightLbs": player_info.get("weightInPounds", 0),
+                    "shootsCatches": player_info.get("shootsCatches", ""),
+                    "headshot": player_info.get("headshot", ""),
+                    "isActive": player_info.get("isActive", True),
+                    "currentTeam": team  # Add current team info
+                }
+                # Apply Finnish text corrections once; fetch.py loads the stamped record as is
+                finnish_players[player_id] = normalize_cache_record(record, previous_cache.get(str(player_id)))
+                team_finnish_count += 1
+                player_count += 1
 
+        print(f"Found {team_finnish_count} Finnish players")
 
     print()
     print("=" * 60)
@@ -151,6 +177,12 @@ def main():
         json.dump(finnish_players, f, indent=2, ensure_ascii=False)
 
     print(f"📁 Saved to: {FINNISH_CACHE_FILE}")
+    print(f"🔌 {format_connection_stats()}")
+    print(f"🗄️  {format_cache_stats()}")
+    if get_skipped_requests():
+        print(f"⚠️  {format_failure_stats()}")
+        for item in get_skipped_requests():
+            print(f"   - {item['url']}: {item['reason']}")
     print()
 
     # Print summary by position
@@ -5,9 +5,11 @@ Enhanced Finnish NHL Players Data Fetcher with Empty Net Goal Tracking
 Refactored to use shared config and utilities from parent package.
 """
 
+import argparse
+import hashlib
 import json
 import sys
-import time
+import threading
 from datetime import datetime
 from pathlib import Path
 
@@ -21,13 +23,21 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from config import (
     GAMES_DIR,
     FINNISH_CACHE_FILE,
-    NOMINATIM_BASE,
-    NOMINATIM_TIMEOUT,
+    GAME_PIPELINE_WORKERS,
+    SCHEDULE_PREFILTER,
+    SCHEDULE_PREFILTER_VERIFY,
 )
 from utils import (
     fetch_from_api,
-    rate_limit,
-    save_json,
+    fetch_many,
+    map_in_order,
+    format_connection_stats,
+    format_cache_stats,
+    get_coalesce_stats,
+    get_skipped_requests,
+    get_skip_reason,
+    format_failure_stats,
+    start_run_report,
     load_json,
     schedule_url,
     game_boxscore_url,
@@ -36,19 +46,24 @@ from utils import (
     extract_team_name,
     get_player_name,
 )
+from cassette import add_cassette_arguments, apply_cassette_arguments, get_cassette
+from game_facts import get_game_facts, format_game_facts_stats
+from game_store import get_game_store, format_game_store_stats
+from venue_registry import get_venue_registry, format_venue_stats
+from team_registry import get_team_registry, format_team_registry_stats
+from player_rows import iter_boxscore_players
 # Import Finnish text correction utilities
-from finnish_text_utils import normalize_finnish_player_data
+from finnish_text_utils import is_normalized, normalize_finnish_player_data, strip_normalization
 from headshots.sync import sync_headshots
 
 # =============================================================================
 # Geocoding for venue addresses
 # =============================================================================
-_VENUE_ADDRESS_CACHE = {}
-
-
 def geocode_venue_address(venue_name, city):
     """
-    Get full address for a venue using OpenStreetMap Nominatim API.
+    Get full address for a venue from the venue registry.
+
+    Known venues are a local lookup; see venue_registry.py.
 
     Args:
         venue_name: Name of the venue
@@ -57,102 +72,28 @@ def geocode_venue_address(venue_name, city):
     Returns:
         Dict with {street, state, country, full_address} or None
     """
-    global _VENUE_ADDRESS_CACHE
-
-    cache_key = f"{venue_name}|{city}"
-    if cache_key in _VENUE_ADDRESS_CACHE:
-        return _VENUE_ADDRESS_CACHE[cache_key]
-
-    try:
-        import requests
-        headers = {'User-Agent': 'FinnishNHLPlayers/1.0'}
-        query = f"{venue_name}, {city}, USA"
-        url = f"{NOMINATIM_BASE}?format=json&addressdetails=1&q={requests.utils.quote(query)}&limit=1"
-
-        response = requests.get(url, headers=headers, timeout=NOMINATIM_TIMEOUT)
-        response.raise_for_status()
-        results = response.json()
-
-        if results:
-            result = results[0]
-            address = result.get('address', {})
-
-            street = address.get('road', '')
-            house_number = address.get('house_number', '')
-            city_name = address.get('city', address.get('town', address.get('village', '')))
-            state = address.get('state', '')
-            country = address.get('country', '')
-            postcode = address.get('postcode', '')
-
-            full_parts = []
-            if house_number and street:
-                full_parts.append(f"{house_number} {street}")
-            elif street:
-                full_parts.append(street)
-
-            if city_name:
-                full_parts.append(city_name)
-            if state:
-                full_parts.append(state)
-            if country:
-                full_parts.append(country)
-
-            full_address = ", ".join(full_parts)
-
-            venue_address = {
-                'street': street,
-                'city': city_name,
-                'state': state,
-                'country': country,
-                'postcode': postcode,
-                'full_address': full_address
-            }
-
-            _VENUE_ADDRESS_CACHE[cache_key] = venue_address
-            return venue_address
-    except Exception as e:
-        print(f"Warning: Geocoding failed for {venue_name}, {city}: {e}")
-
-    return None
+    return get_venue_registry().lookup(venue_name, city)
 
 
 # =============================================================================
-# Cache for teams data
+# Teams data
 # =============================================================================
-_TEAMS_DATA_CACHE = None
-
-
 def get_teams_data():
     """
-    Fetch and cache teams data from NHL API.
+    Get every team's names and home venue from the team registry.
 
     Returns:
         Dict mapping team abbrev to {venue_name, venue_city, team_name, location_name}
     """
-    global _TEAMS_DATA_CACHE
-
-    if _TEAMS_DATA_CACHE is not None:
-        return _TEAMS_DATA_CACHE
-
-    sample_game_id = 2025020376  # Use a known game ID
-    game_data = fetch_from_api(game_boxscore_url(sample_game_id))
-
-    teams_cache = {}
-
-    if game_data:
-        for team_key in ["homeTeam", "awayTeam"]:
-            team = game_data.get(team_key, {})
-            abbrev = team.get("abbrev", "")
-            if abbrev:
-                teams_cache[abbrev] = {
-                    "venue_name": team.get("venue", {}).get("name", ""),
-                    "venue_city": team.get("venue", {}).get("city", ""),
-                    "team_name": team.get("commonName", {}).get("default", ""),
-                    "location_name": team.get("placeName", {}).get("default", "")
-                }
-
-    _TEAMS_DATA_CACHE = teams_cache
-    return teams_cache
+    return {
+        team["abbrev"]: {
+            "venue_name": team["venue"],
+            "venue_city": team["venue_city"],
+            "team_name": team["common_name"],
+            "location_name": team["place_name"],
+        }
+        for team in get_team_registry().teams()
+    }
 
 
 def get_teams_venue_data():
@@ -167,142 +108,236 @@ def get_teams_venue_data():
     return venue_data
 
 
+_FINNISH_CACHE = None  # (file signature, corrected cache), reused while the file is unchanged
+_FINNISH_CACHE_LOCK = threading.Lock()
+
+
 def load_finnish_player_cache():
-    """Load cached Finnish player information with text corrections."""
-    if FINNISH_CACHE_FILE.exists():
+    """
+    Load cached Finnish player information with text corrections.
+
+    build_cache.py stores records already corrected and stamped with the
+    normalizer version, so loading is a plain JSON read. Only records with a
+    missing or outdated stamp are corrected here (in memory). The result is
+    kept and reused until the cache file changes. Treat it as read-only.
+    """
+    global _FINNISH_CACHE
+    if not FINNISH_CACHE_FILE.exists():
+        return {}
+    st = FINNISH_CACHE_FILE.stat()
+    signature = (st.st_size, st.st_mtime_ns)
+    with _FINNISH_CACHE_LOCK:
+        if _FINNISH_CACHE is not None and _FINNISH_CACHE[0] == signature:
+            return _FINNISH_CACHE[1]
+
+        corrected_cache = {}
+        stale = 0
         data = load_json(FINNISH_CACHE_FILE)
         if data:
-            # Apply corrections to all cached players
-            corrected_cache = {}
             for player_id, player_data in data.items():
-                corrected_cache[int(player_id)] = normalize_finnish_player_data(
-                    player_data.copy()
-                )
-            return corrected_cache
-    return {}
+                if not is_normalized(player_data):
+                    normalize_finnish_player_data(player_data)
+                    stale += 1
+                corrected_cache[int(player_id)] = strip_normalization(player_data)
+        if stale:
+            print(f"Corrected {stale} cached player record(s) with an outdated normalization stamp "
+                  f"(run build_cache.py to store them)")
+        _FINNISH_CACHE = (signature, corrected_cache)
+        return corrected_cache
+
+
+def has_finnish_players(game_data, finnish_cache):
+    """Check whether a boxscore lists any player from the Finnish cache."""
+    if not game_data:
+        return False
+    for team_stats in game_data.get("playerByGameStats", {}).values():
+        for players in team_stats.values():
+            if any(player.get("playerId") in finnish_cache for player in players):
+                return True
+    return False
 
 
-# =============================================================================
-# Empty Net Goal Detection
-# =============================================================================
-def detect_empty_net_goals(play_by_play_data, game_id, finnish_cache, game_data=None):
+def build_team_roster_index(finnish_cache):
     """
-    Parse play-by-play data to find empty net goals.
+    Map team abbreviations to the tracked Finnish players on their roster.
 
-    NHL API indicates empty net goals via:
-    1. zoneCode: 'N' (Neutral zone)
-    2. highlightClipSharingUrl containing 'empty-net'
+    Derived from the cache's currentTeam, so it follows roster changes
+    whenever build_cache.py refreshes the cache.
 
     Args:
-        play_by_play_data: Play-by-play data from API
-        game_id: Game identifier
         finnish_cache: Finnish player cache
-        game_data: Optional game data for goalie detection
 
     Returns:
-        Tuple of (empty_net_goals_scored dict, empty_net_goals_allowed dict)
-    """
-    empty_net_goals_scored = {}
-    empty_net_goals_allowed = {}
-
-    if not play_by_play_data or 'plays' not in play_by_play_data:
-        return empty_net_goals_scored, empty_net_goals_allowed
-
-    # Create reverse cache mapping: playerId -> position (for goalie detection)
-    finnish_positions = {}
-    for pid, info in finnish_cache.items():
-        if info.get('position') in ('G', 'Goalie'):
-            finnish_positions[pid] = 'G'
-
-    for play in play_by_play_data['plays']:
-        if play.get('typeDescKey') == 'goal':
-            details = play.get('details', {})
-            zone_code = details.get('zoneCode', '')
-            highlight_url = details.get('highlightClipSharingUrl', '')
-
-            # Detect empty net goals using multiple indicators
-            is_empty_net = (zone_code == 'N' or 'empty-net' in (highlight_url or '').lower())
-
-            if is_empty_net:
-                # Track scoring player
-                player_id = details.get('scoringPlayerId')
-                if player_id:
-                    empty_net_goals_scored[player_id] = empty_net_goals_scored.get(player_id, 0) + 1
-
-                # Track goalie who allowed it
-                goalie_id = details.get('goalieInNetId')
-                if goalie_id and goalie_id in finnish_positions:
-                    empty_net_goals_allowed[goalie_id] = empty_net_goals_allowed.get(goalie_id, 0) + 1
-                elif not goalie_id and game_data:
-                    # Determine which team had the empty net
-                    event_owner_team_id = details.get('eventOwnerTeamId')
-                    home_team_id = game_data.get('homeTeam', {}).get('id')
-                    away_team_id = game_data.get('awayTeam', {}).get('id')
-
-                    if event_owner_team_id and home_team_id and away_team_id:
-                        defending_team_id = away_team_id if event_owner_team_id == home_team_id else home_team_id
-
-                        # Find Finnish goalie from defending team with highest TOI
-                        # (the one who was actually playing when pulled for empty net)
-                        player_stats = game_data.get('playerByGameStats', {})
-                        finnish_goalies_on_defending_team = []
-                        for team_side in ['awayTeam', 'homeTeam']:
-                            team_data = player_stats.get(team_side, {})
-                            if game_data.get(team_side, {}).get('id') == defending_team_id:
-                                for goalie in team_data.get('goalies', []):
-                                    goalie_id = goalie.get('playerId')
-                                    toi = goalie.get('toi', '00:00')
-
-                                    if goalie_id in finnish_positions and toi not in ('00:00', '0'):
-                                        finnish_goalies_on_defending_team.append((goalie_id, toi))
-
-                        # Assign empty net goal to the goalie with highest TOI (the one who was pulled)
-                        if finnish_goalies_on_defending_team:
-                            # Sort by TOI descending and pick the first (highest TOI)
-                            finnish_goalies_on_defending_team.sort(
-                                key=lambda x: x[1], reverse=True
-                            )
-                            pulled_goalie_id = finnish_goalies_on_defending_team[0][0]
-                            empty_net_goals_allowed[pulled_goalie_id] = empty_net_goals_allowed.get(pulled_goalie_id, 0) + 1
-
-    return empty_net_goals_scored, empty_net_goals_allowed
-
-
-def detect_shorthanded_goals(play_by_play_data, finnish_cache):
-    """
-    Detect shorthanded goals from play-by-play data.
+        Dict of team abbrev -> list of player IDs
+    """
+    index = {}
+    for player_id, player in finnish_cache.items():
+        team = player.get("currentTeam")
+        if team:
+            index.setdefault(team, []).append(player_id)
+    return index
 
-    Args:
-        play_by_play_data: Play-by-play data from API
-        finnish_cache: Finnish player cache
+
+# =============================================================================
+# Play-by-Play Analysis
+# =============================================================================
+SITUATION_COUNTERS = (
+    "ev_goals", "pp_goals", "sh_goals", "en_goals", "gw_goals",
+    "ev_assists", "pp_assists", "sh_assists", "en_assists",
+    "en_goals_allowed",
+)
+
+
+def _build_situation_table():
+    """
+    Decode every situationCode once.
+
+    A situationCode is four digits: away goalie in net (0/1), away skaters,
+    home skaters, home goalie in net (0/1). An extra attacker for a pulled
+    goalie does not change the strength, so 6-on-5 with the net empty is
+    even strength.
 
     Returns:
-        Dict of player IDs to shorthanded goal counts
+        Dict of code -> {"home": (strength, empty_net), "away": (strength, empty_net)}
+        from the scoring team's point of view, strength being "ev", "pp" or "sh"
     """
-    shorthanded_goals = {}
+    table = {}
+    for away_goalie in (0, 1):
+        for away_skaters in range(3, 7):
+            for home_skaters in range(3, 7):
+                for home_goalie in (0, 1):
+                    code = f"{away_goalie}{away_skaters}{home_skaters}{home_goalie}"
+                    away_strength = away_skaters - (1 - away_goalie)
+                    home_strength = home_skaters - (1 - home_goalie)
+                    situations = {}
+                    for side, own, other, other_goalie in (
+                        ("home", home_strength, away_strength, away_goalie),
+                        ("away", away_strength, home_strength, home_goalie),
+                    ):
+                        strength = "pp" if own > other else "sh" if own < other else "ev"
+                        situations[side] = (strength, other_goalie == 0)
+                    table[code] = situations
+    return table
+
+
+SITUATION_TABLE = _build_situation_table()
+
+
+def _situation_from_highlight(details):
+    """Fallback for goals without a known situationCode: infer from the clip URL."""
+    url = (details.get("highlightClipSharingUrl") or "").lower()
+    strength = "sh" if "shg" in url else "pp" if "ppg" in url else "ev"
+    return strength, "empty-net" in url
+
+
+def _pulled_goalie(game_data, defending_team_id):
+    """Goalie of the defending team with the most ice time (the one pulled)."""
+    for team_side in ("awayTeam", "homeTeam"):
+        if game_data.get(team_side, {}).get("id") != defending_team_id:
+            continue
+        goalies = [
+            (goalie.get("toi", "00:00"), goalie.get("playerId"))
+            for goalie in game_data.get("playerByGameStats", {}).get(team_side, {}).get("goalies", [])
+            if goalie.get("toi", "00:00") not in ("00:00", "0")
+        ]
+        if goalies:
+            return max(goalies)[1]
+    return None
 
-    if not play_by_play_data or 'plays' not in play_by_play_data:
-        return shorthanded_goals
 
-    for play in play_by_play_data['plays']:
-        if play.get('typeDescKey') == 'goal':
-            details = play.get('details', {})
-            url = details.get('highlightClipSharingUrl', '')
+def analyze_play_by_play(play_by_play_data, game_data=None):
+    """
+    Derive situational scoring counters for every player in one pass.
 
-            if 'shg' in (url or '').lower():
-                player_id = details.get('scoringPlayerId')
-                if player_id and player_id in finnish_cache:
-                    shorthanded_goals[player_id] = shorthanded_goals.get(player_id, 0) + 1
+    Goal strength (even strength, power play, shorthanded) and empty net are
+    decoded from each goal's situationCode. The game-winning goal is the
+    winner's goal that put them one ahead of the loser's final total;
+    shootout goals are ignored. Empty net goals allowed go to the defending
+    team's goalie with the most ice time (needs game_data).
 
-    return shorthanded_goals
+    Args:
+        play_by_play_data: Play-by-play data from API
+        game_data: Optional boxscore, for team IDs and goalie ice times
+
+    Returns:
+        Dict of player ID -> dict of SITUATION_COUNTERS (players without any are omitted)
+    """
+    counters = {}
+
+    def count(player_id, counter):
+        if player_id:
+            player = counters.get(player_id)
+            if player is None:
+                player = counters[player_id] = dict.fromkeys(SITUATION_COUNTERS, 0)
+            player[counter] += 1
+
+    if not play_by_play_data or "plays" not in play_by_play_data:
+        return counters
+
+    home_team_id = (game_data or play_by_play_data).get("homeTeam", {}).get("id")
+    away_team_id = (game_data or play_by_play_data).get("awayTeam", {}).get("id")
+    scorers = {home_team_id: [], away_team_id: []}
+
+    for play in play_by_play_data["plays"]:
+        if play.get("typeDescKey") != "goal":
+            continue
+        if play.get("periodDescriptor", {}).get("periodType") == "SO":
+            continue
+        details = play.get("details", {})
+        team_id = details.get("eventOwnerTeamId")
+        side = "home" if team_id == home_team_id else "away"
+
+        situation = SITUATION_TABLE.get(play.get("situationCode"))
+        strength, empty_net = situation[side] if situation else _situation_from_highlight(details)
+
+        scorer = details.get("scoringPlayerId")
+        scorers.setdefault(team_id, []).append(scorer)
+        count(scorer, f"{strength}_goals")
+        assists = (details.get("assist1PlayerId"), details.get("assist2PlayerId"))
+        for assist in assists:
+            count(assist, f"{strength}_assists")
+        if empty_net:
+            count(scorer, "en_goals")
+            for assist in assists:
+                count(assist, "en_assists")
+            if game_data:
+                defending_team_id = away_team_id if side == "home" else home_team_id
+                count(_pulled_goalie(game_data, defending_team_id), "en_goals_allowed")
+
+    home_goals = len(scorers.get(home_team_id, []))
+    away_goals = len(scorers.get(away_team_id, []))
+    if home_goals != away_goals:
+        winner, loser_goals = (home_team_id, away_goals) if home_goals > away_goals else (away_team_id, home_goals)
+        count(scorers[winner][loser_goals], "gw_goals")
+
+    return counters
+
+
+def needs_play_by_play(game_data, finnish_cache):
+    """
+    Check whether any tracked player in a game could have situational stats.
+
+    Only players with a point (or goalies who played) can, so games where
+    no Finnish player did either need no play-by-play.
+    """
+    for team_stats in game_data.get("playerByGameStats", {}).values():
+        for category, players in team_stats.items():
+            for player in players:
+                if player.get("playerId") not in finnish_cache:
+                    continue
+                if player.get("points", 0) > 0 or player.get("goals", 0) > 0 or player.get("assists", 0) > 0:
+                    return True
+                if category == "goalies" and player.get("toi", "00:00") not in ("00:00", "0"):
+                    return True
+    return False
 
 
 # =============================================================================
 # NHL API Data Fetching
 # =============================================================================
-def get_schedule_for_date(date):
-    """Get NHL schedule for a specific date."""
-    data = fetch_from_api(schedule_url(date))
+def get_schedule_for_date(date, use_cache=True):
+    """Get NHL schedule for a specific date (use_cache=False bypasses the response cache)."""
+    data = fetch_from_api(schedule_url(date), use_cache=use_cache)
     if not data:
         return None
 
@@ -330,6 +365,9 @@ def get_player_recent_games(player_id, player_team, limit=10):
     """
     Fetch recent games for a player.
 
+    Scores and opponent names come from the local game facts index; only
+    games it does not know are fetched as boxscores.
+
     Args:
         player_id: Player ID
         player_team: Player's team abbreviation
@@ -344,8 +382,29 @@ def get_player_recent_games(player_id, player_team, limit=10):
         if not data or 'last5Games' not in data:
             return []
 
-        recent_games = []
+        last_games = []
         for game in data['last5Games'][:limit]:
+            # Detect if this is goalie data (has goalie-specific stats)
+            is_goalie_data = game.get('savePctg') is not None or game.get('goalsAgainst') is not None
+
+            # Skip games where goalie didn't play (no shots faced = backup/scratch)
+            # Only apply this filter to goalies, not skaters
+            if is_goalie_data and game.get('shotsAgainst', 0) == 0:
+                continue
+            last_games.append((game, is_goalie_data))
+
+        # Fetch boxscores only for games the index does not know, in one concurrent batch
+        game_facts = get_game_facts()
+        team_registry = get_team_registry(refresh=False)
+        # One lookup per game, so the index hit/miss counts stay accurate
+        game_ids = dict.fromkeys(game.get('gameId') for game, _ in last_games if game.get('gameId'))
+        facts_by_id = {gid: game_facts.get(gid) for gid in game_ids}
+        missing = [gid for gid, facts in facts_by_id.items() if facts is None]
+        for gid, boxscore in zip(missing, fetch_many([game_boxscore_url(gid) for gid in missing])):
+            facts_by_id[gid] = game_facts.add_boxscore(gid, boxscore)
+
+        recent_games = []
+        for game, is_goalie_data in last_games:
             game_date = game.get('gameDate', '')
             opponent_abbrev = game.get('opponentAbbrev', '')
             game_id = game.get('gameId')
@@ -355,45 +414,32 @@ def get_player_recent_games(player_id, player_team, limit=10):
             result = 'OT'
 
             if game_id:
-                game_details = get_game_details(game_id)
-                if game_details:
-                    home_team = game_details.get("homeTeam", {})
-                    away_team = game_details.get("awayTeam", {})
-
-                    player_is_home = home_team.get("abbrev", "") == player_team
+                facts = facts_by_id.get(game_id)
+                if facts:
+                    player_is_home = facts["homeTeam"] == player_team
 
                     if player_is_home:
-                        team_score = home_team.get("score", 0)
-                        opponent_score = away_team.get("score", 0)
-                        opponent_full = extract_team_name(away_team)
+                        team_score = facts["homeScore"]
+                        opponent_score = facts["awayScore"]
+                        opponent_full = facts["awayTeamName"] or game_facts.team_name(facts["awayTeam"])
                     else:
-                        team_score = away_team.get("score", 0)
-                        opponent_score = home_team.get("score", 0)
-                        opponent_full = extract_team_name(home_team)
+                        team_score = facts["awayScore"]
+                        opponent_score = facts["homeScore"]
+                        opponent_full = facts["homeTeamName"] or game_facts.team_name(facts["homeTeam"])
 
                     if team_score > opponent_score:
                         result = 'W'
                     elif team_score < opponent_score:
                         result = 'L'
                 else:
-                    opponent_full = opponent_abbrev
+                    opponent_full = team_registry.team_name(opponent_abbrev)
                     plus_minus = game.get('plusMinus', 0)
                     if plus_minus > 0:
                         result = 'W'
                     elif plus_minus < 0:
                         result = 'L'
             else:
-                opponent_full = opponent_abbrev
-
-            # Detect if this is goalie data (has goalie-specific stats)
-            is_goalie_data = game.get('savePctg') is not None or game.get('goalsAgainst') is not None
-            
-            # Skip games where goalie didn't play (no shots faced = backup/scratch)
-            # Only apply this filter to goalies, not skaters
-            if is_goalie_data:
-                shots_against = game.get('shotsAgainst', 0)
-                if shots_against == 0:
-                    continue
+                opponent_full = team_registry.team_name(opponent_abbrev)
 
             # Check if game was decided in OT/SO
             # API recent games doesn't always show this detail easily, 
@@ -426,7 +472,7 @@ def get_player_recent_games(player_id, player_team, limit=10):
 # =============================================================================
 # Finnish Player Data Extraction
 # =============================================================================
-def extract_finnish_player_data(game_data, game_id, date_str, schedule_data, finnish_cache):
+def extract_finnish_player_data(game_data, game_id, date_str, schedule_data, finnish_cache, workers=1):
     """
     Extract Finnish player data with empty net goal tracking.
 
@@ -436,6 +482,7 @@ def extract_finnish_player_data(game_data, game_id, date_str, schedule_data, fin
         date_str: Game date (YYYY-MM-DD)
         schedule_data: Schedule data for venue info
         finnish_cache: Finnish player cache
+        workers: Players whose recent games are fetched at once (1 = serial)
 
     Returns:
         Tuple of (finnish_players list, game_info dict)
@@ -449,12 +496,10 @@ def extract_finnish_player_data(game_data, game_id, date_str, schedule_data, fin
     if not player_stats:
         return finnish_players, {}
 
-    # Get empty net and shorthanded goal data
-    play_by_play_data = get_play_by_play_data(game_id)
-    empty_net_goals_scored, empty_net_goals_allowed = detect_empty_net_goals(
-        play_by_play_data, game_id, finnish_cache, game_data
-    )
-    shorthanded_goals = detect_shorthanded_goals(play_by_play_data, finnish_cache) if play_by_play_data else {}
+    # Situational scoring from play-by-play, only when a Finnish player could have any
+    situation_stats = {}
+    if needs_play_by_play(game_data, finnish_cache):
+        situation_stats = analyze_play_by_play(get_play_by_play_data(game_id), game_data)
 
     # Get game context
     home_team = game_data.get("homeTeam", {}).get("abbrev", "UNK")
@@ -478,6 +523,12 @@ def extract_finnish_player_data(game_data, game_id, date_str, schedule_data, fin
         venue_info["venue"] = game_data.get("venue", {}).get("default", "")
         venue_info["city"] = game_data.get("venueLocation", {}).get("default", "")
 
+    # Last resort: the home team's usual arena
+    if not venue_info.get("venue"):
+        home_venue = get_team_registry(refresh=False).venue(game_data.get("homeTeam", {}).get("abbrev"))
+        if home_venue:
+            venue_info["venue"], venue_info["city"] = home_venue
+
     # Get full venue address via geocoding
     if venue_info.get("venue") and venue_info.get("city"):
         venue_address = geocode_venue_address(venue_info["venue"], venue_info["city"])
@@ -492,17 +543,9 @@ def extract_finnish_player_data(game_data, game_id, date_str, schedule_data, fin
     team_names[home_team] = extract_team_name(game_data.get("homeTeam", {}))
     team_names[away_team] = extract_team_name(game_data.get("awayTeam", {}))
 
-    # Collect all player IDs
-    all_players = []
-    for team_side in ["awayTeam", "homeTeam"]:
-        team_stats = player_stats.get(team_side, {})
-        for player_category in ["forwards", "defense", "goalies"]:
-            for player in team_stats.get(player_category, []):
-                all_players.append((team_side, player))
-
     # Process only Finnish players
     finnish_player_data = {}
-    for team_side, player in all_players:
+    for team_side, player in iter_boxscore_players(game_data):
         player_id = player.get("playerId")
         if player_id not in finnish_player_data and player_id in finnish_cache:
             finnish_player_data[player_id] = {
@@ -532,22 +575,13 @@ def extract_finnish_player_data(game_data, game_id, date_str, schedule_data, fin
             player_team_full = team_names.get(home_team, home_team)
             opponent_team_full = team_names.get(away_team, away_team)
 
-        # Calculate age
-        birth_date = player_cache.get("birthDate", "")
-        age = None
-        if birth_date:
-            try:
-                birth = datetime.strptime(birth_date, "%Y-%m-%d")
-                age = (datetime.now() - birth).days // 365
-            except:
-                age = None
-
         # Count empty net goals
+        situations = situation_stats.get(player_id) or dict.fromkeys(SITUATION_COUNTERS, 0)
         position = player_cache.get("position", "")
         if position in ("G", "Goalie"):
-            empty_net_count = empty_net_goals_allowed.get(player_id, 0)
+            empty_net_count = situations["en_goals_allowed"]
         else:
-            empty_net_count = empty_net_goals_scored.get(player_id, 0)
+            empty_net_count = situations["en_goals"]
 
         # Build record
         record = {
@@ -556,8 +590,8 @@ def extract_finnish_player_data(game_data, game_id, date_str, schedule_data, fin
             "position": position or game_stats.get("position", "N/A"),
             "team": player_team,
             "team_full": player_team_full,
-            "age": age,
-            "birth_date": birth_date,
+            "age": None,  # set by refresh_player_records
+            "birth_date": player_cache.get("birthDate", ""),
             "birthplace": player_cache.get("birthplace", ""),
             "jersey_number": player_cache.get("sweaterNumber", 0),
             "status": "Active",
@@ -571,7 +605,7 @@ def extract_finnish_player_data(game_data, game_id, date_str, schedule_data, fin
             "game_id": game_id,
             "game_date": date_str,
             "game_status": "OFF",
-            "created_at": datetime.now().isoformat(),
+            "created_at": None,
             "headshot_url": player_cache.get("headshot", ""),
             # Game stats
             "goals": game_stats.get("goals", 0),
@@ -587,10 +621,11 @@ def extract_finnish_player_data(game_data, game_id, date_str, schedule_data, fin
             "blocked_shots": game_stats.get("blockedShots", 0),
             "hits": game_stats.get("hits", 0),
             "power_play_goals": game_stats.get("powerPlayGoals", 0),
-            "short_handed_goals": shorthanded_goals.get(player_id, 0),
-            "even_strength_goals": 0,
-            "power_play_assists": 0,
-            "short_handed_assists": 0,
+            "short_handed_goals": situations["sh_goals"],
+            "even_strength_goals": situations["ev_goals"],
+            "power_play_assists": situations["pp_assists"],
+            "short_handed_assists": situations["sh_assists"],
+            "game_winning_goals": situations["gw_goals"],
             "shifts": game_stats.get("shifts", 0),
             "average_ice_time": "00:00"
         }
@@ -602,12 +637,10 @@ def extract_finnish_player_data(game_data, game_id, date_str, schedule_data, fin
             record["save_percentage"] = round(game_stats.get("savePctg", 0.0), 3) if game_stats.get("savePctg") else 0.0
             record["goals_against"] = game_stats.get("goalsAgainst", 0)
 
-        # Get recent games (with delay to avoid rate limiting)
-        time.sleep(0.5)
-        record["recent_results"] = get_player_recent_games(player_id, player_team, limit=10)
-
         finnish_players.append(record)
 
+    refresh_player_records(finnish_players, workers=workers)
+
     return finnish_players, {
         "home_team": home_team,
         "away_team": away_team,
@@ -616,6 +649,39 @@ def extract_finnish_player_data(game_data, game_id, date_str, schedule_data, fin
     }
 
 
+def refresh_player_records(records, workers=1):
+    """
+    Set the fields of player records that depend on when they are built.
+
+    Age, created_at and recent_results change from run to run even when
+    the game itself does not, so they are refreshed for new records and for
+    records reused from an existing file alike.
+
+    Args:
+        records: Finnish player records (updated in place)
+        workers: Players whose recent games are fetched at once (1 = serial)
+    """
+    for record in records:
+        age = None
+        if record.get("birth_date"):
+            try:
+                birth = datetime.strptime(record["birth_date"], "%Y-%m-%d")
+                age = (datetime.now() - birth).days // 365
+            except ValueError:
+                age = None
+        record["age"] = age
+        record["created_at"] = datetime.now().isoformat()
+
+    # Get recent games (keys stay in the same place as a serial run)
+    recent_results = map_in_order(
+        lambda record: get_player_recent_games(record["playerId"], record["team"], limit=10),
+        records,
+        max_workers=workers,
+    )
+    for record, results in zip(records, recent_results):
+        record["recent_results"] = results
+
+
 def normalize_game_state(game_details: dict, schedule_game: dict) -> str:
     """
     Get and normalize game state from NHL API.
@@ -657,12 +723,239 @@ def should_skip_game(game_details: dict, normalized_state: str) -> tuple:
     return False, None
 
 
-def generate_finnish_players_data(game_date):
-    """Generate data for Finnish players on a specific date."""
+# Bump when the per-game output changes shape, so incremental runs rebuild old records
+GAME_RECORD_VERSION = 2
+SOURCE_HASH_GAME_KEYS = ("id", "gameState", "gameType", "startTimeUTC", "venue", "periodDescriptor", "gameOutcome")
+
+
+def game_source_hash(game, finnish_cache, team_index):
+    """
+    Fingerprint everything a game's summary and player records are built from.
+
+    Covers the schedule entry (state, score, teams, venue), the cached
+    records of the Finnish players on both teams and GAME_RECORD_VERSION.
+    A final game whose hash is unchanged produces the same output again.
+
+    Args:
+        game: Schedule entry for the game
+        finnish_cache: Finnish player cache
+        team_index: Team abbrev -> player IDs (see build_team_roster_index)
+
+    Returns:
+        Hex digest string
+    """
+    teams = [game.get(side, {}) for side in ("awayTeam", "homeTeam")]
+    source = {
+        "version": GAME_RECORD_VERSION,
+        "game": {key: game.get(key) for key in SOURCE_HASH_GAME_KEYS},
+        "teams": [{"abbrev": team.get("abbrev"), "score": team.get("score")} for team in teams],
+        "players": [
+            finnish_cache[player_id]
+            for team in teams
+            for player_id in sorted(team_index.get(team.get("abbrev"), []))
+        ],
+    }
+    encoded = json.dumps(source, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+
+
+def reusable_games(previous, games, source_hashes):
+    """
+    Find games in a previously written file that need no re-fetch.
+
+    Args:
+        previous: Existing daily data (or None)
+        games: Schedule entries for the date
+        source_hashes: Game ID -> current game_source_hash
+
+    Returns:
+        Dict of game ID -> (summary, finnish_players) for final games whose
+        sourceHash still matches
+    """
+    if not previous:
+        return {}
+    players_by_game = {}
+    for player in previous.get("players", []):
+        players_by_game.setdefault(player.get("game_id"), []).append(player)
+
+    reusable = {}
+    scheduled = {game.get("id"): game for game in games}
+    for summary in previous.get("games", []):
+        game_id = summary.get("gameId")
+        game = scheduled.get(game_id)
+        if game is None or summary.get("gameState") != "OFF":
+            continue
+        if normalize_game_state(game, game) != "OFF":
+            continue
+        if not summary.get("sourceHash") or summary["sourceHash"] != source_hashes.get(game_id):
+            continue
+        players = players_by_game.get(game_id, [])
+        if len(players) != summary.get("finnish_players_count", 0):
+            continue
+        reusable[game_id] = (summary, players)
+    return reusable
+
+
+def summarize_game_from_schedule(game):
+    """
+    Summarise a game with no tracked Finnish players from its schedule entry.
+
+    Used by the schedule prefilter instead of fetching the boxscore and
+    play-by-play; produces the same summary fields as process_game.
+
+    Args:
+        game: Schedule entry for the game
+
+    Returns:
+        Tuple of (game summary or None, [], None) like process_game
+    """
+    normalized_state = normalize_game_state(game, game)
+    should_skip, skip_reason = should_skip_game(game, normalized_state)
+    if should_skip:
+        print(f"      ⚠️ Skipping: {skip_reason}")
+        print(f"      💡 Run fix_game_states.py later to correct this game")
+        return None, [], None
+
+    pd = game.get("periodDescriptor", {})
+    last_period_type = game.get("gameOutcome", {}).get("lastPeriodType")
+    summary = {
+        "gameId": game.get("id"),
+        "homeTeam": game.get("homeTeam", {}).get("abbrev", "UNK"),
+        "awayTeam": game.get("awayTeam", {}).get("abbrev", "UNK"),
+        "homeScore": game.get("homeTeam", {}).get("score", 0),
+        "awayScore": game.get("awayTeam", {}).get("score", 0),
+        "gameState": normalized_state,
+        "gameType": game.get("gameType", 2),
+        "startTime": game.get("startTimeUTC", ""),
+        "isOT": pd.get("number", 0) > 3 or last_period_type in ("OT", "SO"),
+        "isSO": pd.get("periodType") == "SO" or last_period_type == "SO",
+        "period": pd.get("number", 3),
+        "finnish_players_count": 0,
+        "empty_net_goals": 0
+    }
+    print(f"      No tracked Finnish players (schedule only)")
+    return summary, [], None
+
+
+def process_game(game, game_details, game_date, schedule, finnish_cache, workers=1):
+    """
+    Process one game of the night: state checks, play-by-play, venue and
+    Finnish player records.
+
+    Args:
+        game: Schedule entry for the game
+        game_details: Boxscore data (None if the fetch failed)
+        game_date: Game date (YYYY-MM-DD)
+        schedule: Schedule data for the date
+        finnish_cache: Finnish player cache
+        workers: Players enriched at once (1 = serial)
+
+    Returns:
+        Tuple of (game summary or None, finnish_players list, skipped game entry or None)
+    """
+    game_id = game.get("id")
+    home_team = game.get("homeTeam", {}).get("abbrev", "UNK")
+    away_team = game.get("awayTeam", {}).get("abbrev", "UNK")
+
+    if not game_details:
+        print(f"      ❌ Failed to fetch game details")
+        return None, [], {
+            "gameId": game_id,
+            "homeTeam": home_team,
+            "awayTeam": away_team,
+            "reason": get_skip_reason(game_boxscore_url(game_id)) or "fetch failed",
+        }
+
+    # Normalize game state (FINAL -> OFF, handle CRIT appropriately)
+    normalized_state = normalize_game_state(game_details, game)
+
+    # Check if game should be skipped due to incomplete data
+    should_skip, skip_reason = should_skip_game(game_details, normalized_state)
+    if should_skip:
+        print(f"      ⚠️ Skipping: {skip_reason}")
+        print(f"      💡 Run fix_game_states.py later to correct this game")
+        return None, [], None
+
+    finnish_players, game_info = extract_finnish_player_data(
+        game_details, game_id, game_date, schedule, finnish_cache, workers=workers
+    )
+
+    pd = game_details.get("periodDescriptor", {})
+    is_ot = pd.get("number", 0) > 3
+    is_so = pd.get("periodType") == "SO"
+
+    summary = {
+        "gameId": game_id,
+        "homeTeam": home_team,
+        "awayTeam": away_team,
+        "homeScore": game_info.get("home_score", 0),
+        "awayScore": game_info.get("away_score", 0),
+        "gameState": normalized_state,
+        "gameType": game.get("gameType", 2),
+        "startTime": game.get("startTimeUTC", ""),
+        "isOT": is_ot,
+        "isSO": is_so,
+        "period": pd.get("number", 3),
+        "finnish_players_count": len(finnish_players),
+        "empty_net_goals": len([p for p in finnish_players if p.get('empty_net_goals', 0) > 0])
+    }
+
+    if finnish_players:
+        print(f"      ✅ Found {len(finnish_players)} Finnish players")
+        scorers = [f"{p['name']} ({p['points']}pts)" for p in finnish_players if p['points'] > 0]
+        empty_net_scorers = [p['name'] for p in finnish_players if p.get('empty_net_goals', 0) > 0]
+
+        if scorers:
+            print(f"         Scorers: {', '.join(scorers)}")
+        if empty_net_scorers:
+            print(f"         🥅 Empty Net: {', '.join(empty_net_scorers)}")
+    else:
+        print(f"      No Finnish players")
+
+    return summary, finnish_players, None
+
+
+def generate_finnish_players_data(game_date, workers=None, prefilter=None, verify=None, incremental=False,
+                                  use_cache=True):
+    """
+    Generate data for Finnish players on a specific date.
+
+    Games (and the players within each game) are processed on a worker pool
+    sharing the API rate limiter. Results and log output are assembled in
+    schedule order, so the data is identical to a serial run.
+
+    With the schedule prefilter, games where neither team has a tracked
+    Finnish player (by the cache's currentTeam) are summarised from the
+    schedule without fetching boxscore or play-by-play. In verify mode their
+    boxscores are still checked in the background, and any game that turns
+    out to have a Finnish player is processed in full.
+
+    In incremental mode the existing file for the date is loaded and every
+    final game whose sourceHash is unchanged keeps its summary and player
+    records, with only the time-dependent fields refreshed (age, created_at,
+    recent_results); only live, critical, changed or missing games have
+    their boxscores fetched. The merged result is the same as a full rebuild.
+
+    Args:
+        game_date: Game date (YYYY-MM-DD)
+        workers: Games processed at once (defaults to GAME_PIPELINE_WORKERS; 1 = serial)
+        prefilter: Skip games without tracked players (defaults to SCHEDULE_PREFILTER)
+        verify: Verify prefiltered games in the background (defaults to SCHEDULE_PREFILTER_VERIFY)
+        incremental: Reuse unchanged final games from GAMES_DIR/{game_date}.json
+        use_cache: Read the schedule through the response cache; pass False
+            when the caller has just seen a fresher schedule, so reuse checks
+            and sourceHash are computed against the same data
+    """
+    if workers is None:
+        workers = GAME_PIPELINE_WORKERS
+    if prefilter is None:
+        prefilter = SCHEDULE_PREFILTER
+    if verify is None:
+        verify = SCHEDULE_PREFILTER_VERIFY
     finnish_cache = load_finnish_player_cache()
     print(f"Loaded {len(finnish_cache)} Finnish player records from cache\n")
 
-    schedule = get_schedule_for_date(game_date)
+    schedule = get_schedule_for_date(game_date, use_cache=use_cache)
     if not schedule:
         return {
             "date": game_date,
@@ -673,78 +966,104 @@ def generate_finnish_players_data(game_date):
         }
 
     games = schedule.get("games", [])
+    get_team_registry(day=game_date).observe_games(games)
     all_finnish_players = []
     game_summaries = []
+    skipped_games = []
 
     print(f"Fetching Finnish players for {game_date}...")
     print(f"Found {len(games)} games\n")
 
-    for i, game in enumerate(games, 1):
+    roster_index = build_team_roster_index(finnish_cache)
+    source_hashes = {game.get("id"): game_source_hash(game, finnish_cache, roster_index) for game in games}
+
+    # Final games unchanged since the last run are kept from the existing file
+    reused = {}
+    if incremental:
+        reused = reusable_games(load_json(GAMES_DIR / f"{game_date}.json"), games, source_hashes)
+        if reused:
+            print(f"Incremental: reusing {len(reused)} unchanged final game(s)\n")
+    pending = [game for game in games if game.get("id") not in reused]
+
+    # Games where neither team has a tracked Finnish player need no boxscore
+    team_index = roster_index if prefilter else {}
+    if team_index:
+        tracked = [
+            game for game in pending
+            if game.get("homeTeam", {}).get("abbrev") in team_index
+            or game.get("awayTeam", {}).get("abbrev") in team_index
+        ]
+    else:
+        tracked = pending
+    tracked_ids = {game.get("id") for game in tracked}
+    untracked = [game for game in pending if game.get("id") not in tracked_ids]
+    if untracked:
+        print(f"Schedule prefilter: {len(untracked)} game(s) without tracked Finnish players\n")
+
+    # Check the prefiltered games in the background while the rest are processed
+    verified = {}
+    verifier = None
+    if untracked and verify:
+        def verify_untracked():
+            boxscores = fetch_many([game_boxscore_url(game.get("id")) for game in untracked])
+            verified.update(zip([game.get("id") for game in untracked], boxscores))
+
+        verifier = threading.Thread(target=verify_untracked, name="prefilter-verify", daemon=True)
+        verifier.start()
+
+    # Fetch all boxscores for the night up front in one concurrent batch
+    boxscores = dict(zip([game.get("id") for game in tracked],
+                         fetch_many([game_boxscore_url(game.get("id")) for game in tracked])))
+
+    # Tonight's finished games show up in players' recent results
+    game_facts = get_game_facts()
+    for game_id, game_details in boxscores.items():
+        game_facts.add_boxscore(game_id, game_details)
+
+    def run_game(item):
+        i, game = item
         game_id = game.get("id")
         home_team = game.get("homeTeam", {}).get("abbrev", "UNK")
         away_team = game.get("awayTeam", {}).get("abbrev", "UNK")
-
         print(f"[{i}/{len(games)}] {away_team} @ {home_team}")
-
-        if i > 1:
-            time.sleep(1.5)  # Rate limiting between games
-
-        game_details = get_game_details(game_id)
-
-        if game_details:
-            # Normalize game state (FINAL -> OFF, handle CRIT appropriately)
-            normalized_state = normalize_game_state(game_details, game)
-
-            # Check if game should be skipped due to incomplete data
-            should_skip, skip_reason = should_skip_game(game_details, normalized_state)
-            if should_skip:
-                print(f"      ⚠️ Skipping: {skip_reason}")
-                print(f"      💡 Run fix_game_states.py later to correct this game")
-                continue
-
-            finnish_players, game_info = extract_finnish_player_data(
-                game_details, game_id, game_date, schedule, finnish_cache
-            )
-            all_finnish_players.extend(finnish_players)
-
-            pd = game_details.get("periodDescriptor", {})
-            is_ot = pd.get("number", 0) > 3
-            is_so = pd.get("periodType") == "SO"
-
-            game_summaries.append({
-                "gameId": game_id,
-                "homeTeam": home_team,
-                "awayTeam": away_team,
-                "homeScore": game_info.get("home_score", 0),
-                "awayScore": game_info.get("away_score", 0),
-                "gameState": normalized_state,
-                "gameType": game.get("gameType", 2),
-                "startTime": game.get("startTimeUTC", ""),
-                "isOT": is_ot,
-                "isSO": is_so,
-                "period": pd.get("number", 3),
-                "finnish_players_count": len(finnish_players),
-                "empty_net_goals": len([p for p in finnish_players if p.get('empty_net_goals', 0) > 0])
-            })
-
-            if finnish_players:
-                print(f"      ✅ Found {len(finnish_players)} Finnish players")
-                scorers = [f"{p['name']} ({p['points']}pts)" for p in finnish_players if p['points'] > 0]
-                empty_net_scorers = [p['name'] for p in finnish_players if p.get('empty_net_goals', 0) > 0]
-
-                if scorers:
-                    print(f"         Scorers: {', '.join(scorers)}")
-                if empty_net_scorers:
-                    print(f"         🥅 Empty Net: {', '.join(empty_net_scorers)}")
-            else:
-                print(f"      No Finnish players")
-        else:
-            print(f"      ❌ Failed to fetch game details")
+        if game_id in reused:
+            summary, finnish_players = reused[game_id]
+            print(f"      ♻️  Unchanged since last run ({len(finnish_players)} Finnish players)")
+            refresh_player_records(finnish_players, workers=workers)
+            return summary, finnish_players, None
+        if game_id not in boxscores:
+            return summarize_game_from_schedule(game)
+        return process_game(game, boxscores[game_id], game_date, schedule, finnish_cache, workers=workers)
+
+    results = map_in_order(run_game, enumerate(games, 1), max_workers=workers)
+
+    if verifier is not None:
+        verifier.join()
+        missed = [
+            i for i, game in enumerate(games)
+            if has_finnish_players(verified.get(game.get("id")), finnish_cache)
+        ]
+        if missed:
+            print(f"\n⚠️  Prefilter missed Finnish players in {len(missed)} game(s); "
+                  f"run build_cache.py to refresh currentTeam")
+        for i in missed:
+            game = games[i]
+            boxscores[game.get("id")] = verified[game.get("id")]
+            game_facts.add_boxscore(game.get("id"), verified[game.get("id")])
+            results[i] = run_game((i + 1, game))
+
+    for summary, finnish_players, skipped in results:
+        all_finnish_players.extend(finnish_players)
+        if summary is not None:
+            summary["sourceHash"] = source_hashes.get(summary["gameId"])
+            game_summaries.append(summary)
+        if skipped is not None:
+            skipped_games.append(skipped)
 
     # Sort players by points (descending) then by name
     all_finnish_players.sort(key=lambda x: (-x.get("points", 0), x.get("name", "")))
 
-    return {
+    data = {
         "date": game_date,
         "games": game_summaries,
         "players": all_finnish_players,
@@ -752,36 +1071,97 @@ def generate_finnish_players_data(game_date):
         "generated_at": datetime.now().isoformat(),
         "source": "NHL API - Enhanced with Empty Net Goal Tracking"
     }
+    # Only present when something failed, so a re-run knows what to retry
+    if skipped_games:
+        data["skipped_games"] = skipped_games
+    return data
+
+
+def write_finnish_players_data(date_str, sync_photos=True, **options):
+    """
+    Generate, store and index the Finnish players data for one date.
+
+    The day goes into the game store, and the daily JSON file is exported
+    from it. If the schedule could not be fetched nothing is saved, so the
+    empty day does not replace an existing file.
+
+    Args:
+        date_str: Game date (YYYY-MM-DD)
+        sync_photos: Download headshots for new players
+        **options: Passed to generate_finnish_players_data
+
+    Returns:
+        Tuple of (data dict, output file path or None if nothing was saved)
+    """
+    data = generate_finnish_players_data(date_str, **options)
+    schedule_failure = get_skip_reason(schedule_url(date_str))
+    if schedule_failure:
+        print(f"⚠️  Schedule for {date_str} not fetched ({schedule_failure}), nothing saved")
+        return data, None
+
+    # Sync headshots for any new players
+    if sync_photos and data.get("players"):
+        new_headshots = sync_headshots(data["players"])
+        if new_headshots > 0:
+            print(f"\n📷 Downloaded {new_headshots} new headshot(s)")
+
+    output_file = get_game_store().save_day(data)
+    get_game_facts().add_day(data, output_file)
+    return data, output_file
 
 
 # =============================================================================
 # Main Entry Point
 # =============================================================================
 if __name__ == "__main__":
-    if len(sys.argv) > 1:
-        date_str = sys.argv[1]
-    else:
-        date_str = datetime.now().strftime("%Y-%m-%d")
+    parser = argparse.ArgumentParser(description="Fetch Finnish NHL players data for a date")
+    parser.add_argument("date", nargs="?", default=datetime.now().strftime("%Y-%m-%d"),
+                        help="Game date (YYYY-MM-DD, default: today)")
+    parser.add_argument("--workers", type=int, default=GAME_PIPELINE_WORKERS,
+                        help=f"Games processed concurrently (default: {GAME_PIPELINE_WORKERS}, 1 = serial)")
+    parser.add_argument("--no-prefilter", action="store_true",
+                        help="Fetch boxscores for every game, not just games with tracked Finnish players")
+    parser.add_argument("--verify-prefilter", action="store_true", default=SCHEDULE_PREFILTER_VERIFY,
+                        help="Check prefiltered games' boxscores in the background")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Keep unchanged final games from the existing file instead of re-fetching them")
+    add_cassette_arguments(parser)
+    args = parser.parse_args()
+    apply_cassette_arguments(args)
+    start_run_report("fetch")
+    date_str = args.date
 
     print("=" * 80)
     print(f"Fetching Finnish NHL players data for {date_str}...")
     print("=" * 80)
     print()
 
-    data = generate_finnish_players_data(date_str)
-
-    # Sync headshots for any new players
-    if data.get("players"):
-        new_headshots = sync_headshots(data["players"])
-        if new_headshots > 0:
-            print(f"\n📷 Downloaded {new_headshots} new headshot(s)")
-
-    # Save using shared utilities
-    output_file = GAMES_DIR / f"{date_str}.json"
-    save_json(data, output_file)
+    data, output_file = write_finnish_players_data(
+        date_str, workers=args.workers, prefilter=not args.no_prefilter,
+        verify=args.verify_prefilter, incremental=args.incremental,
+    )
 
     print()
     print("=" * 80)
-    print(f"✅ Generated data for {len(data['players'])} Finnish players")
-    print(f"📁 Saved to: {output_file}")
+    if output_file is None:
+        print(f"❌ Schedule for {date_str} could not be fetched, existing data left as is")
+    else:
+        print(f"✅ Generated data for {len(data['players'])} Finnish players")
+        print(f"📁 Saved to: {output_file}")
+    print(f"🔌 {format_connection_stats()}")
+    print(f"🗄️  {format_cache_stats()}")
+    print(f"🔁 Coalesced {get_coalesce_stats()['coalesced']} duplicate request(s)")
+    print(f"📚 {format_game_facts_stats()}")
+    print(f"🗄️  {format_game_store_stats()}")
+    print(f"📍 {format_venue_stats()}")
+    print(f"🏒 {format_team_registry_stats()}")
+    if get_cassette() is not None:
+        print(f"📼 {get_cassette().summary()}")
+    skipped = get_skipped_requests()
+    if skipped:
+        print(f"⚠️  {format_failure_stats()}")
+        for item in skipped:
+            print(f"   - {item['url']}: {item['reason']}")
     print("=" * 80)
+    if output_file is None:
+        sys.exit(1)
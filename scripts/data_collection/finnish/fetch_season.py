@@ -1,17 +1,42 @@
 #!/usr/bin/env python3
 """
 Fetch full season data for Finnish NHL players.
+
+Runs every date in one process, so the Finnish cache, venue geocodes, team
+data, text corrections, the HTTP session and the response cache stay warm
+across dates. Dates are processed on a small worker pool and each finished
+date is recorded in a checkpoint file, so an interrupted backfill picks up
+where it stopped.
 """
+import argparse
+import json
+import os
 import sys
-import subprocess
+import threading
 import time
 from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import BACKFILL_CHECKPOINT_FILE, BACKFILL_DATE_WORKERS, GAME_PIPELINE_WORKERS
+from utils import (
+    map_in_order, start_run_report, format_connection_stats, format_cache_stats,
+    get_skip_reason, schedule_url,
+)
+from cassette import add_cassette_arguments, apply_cassette_arguments
+from fetch import write_finnish_players_data
+from headshots.sync import sync_headshots
 
 START_DATE = "2025-10-01"
 END_DATE = "2026-01-05"
-PER_DATE_TIMEOUT = 300  # 5 minutes per date
 RETRY_FAILED = True  # Retry failed dates at the end
-RETRY_DELAY = 5  # seconds between retries
+
+DONE = "done"
+PARTIAL = "partial"  # written, but some games were skipped or are not final yet
+FAILED = "failed"  # nothing written (schedule not fetched or an error)
+
 
 def date_range(start, end):
     """Generate list of dates from start to end inclusive."""
@@ -21,94 +46,186 @@ def date_range(start, end):
         yield current.strftime("%Y-%m-%d")
         current += timedelta(days=1)
 
-def fetch_date(date_str):
-    """Fetch data for a single date, return (success, output)."""
+
+class BackfillCheckpoint:
+    """Per-date backfill status, saved to disk after every date."""
+
+    def __init__(self, path=None):
+        self.path = Path(path or BACKFILL_CHECKPOINT_FILE)
+        self._lock = threading.Lock()
+        self.dates = {}
+        if self.path.exists():
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    self.dates = json.load(f).get("dates", {})
+            except (OSError, json.JSONDecodeError):
+                self.dates = {}
+
+    def pending(self, dates, restart=False):
+        """Dates still to do (all of them when restarting)."""
+        if restart:
+            return list(dates)
+        return [d for d in dates if self.dates.get(d, {}).get("status") != DONE]
+
+    def record(self, date_str, entry):
+        """Store a date's status and save the checkpoint (atomic replace)."""
+        with self._lock:
+            self.dates[date_str] = entry
+            checkpoint = {
+                "updated_at": datetime.now().isoformat(),
+                "dates": dict(sorted(self.dates.items())),
+            }
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(checkpoint, f, indent=2)
+            os.replace(tmp_path, self.path)
+
+
+def backfill_date(date_str, checkpoint, workers=None, incremental=False):
+    """
+    Fetch and write one date, recording its status in the checkpoint.
+
+    A date whose schedule could not be fetched is failed and its file left
+    alone; one with skipped or not yet final games is partial, so a later
+    run fetches it again.
+
+    Returns:
+        Tuple of (status entry dict, players list)
+    """
+    started = time.monotonic()
+    players = []
     try:
-        result = subprocess.run(
-            ["python3", "scripts/data_collection/finnish/fetch.py", date_str],
-            capture_output=True,
-            text=True,
-            timeout=PER_DATE_TIMEOUT
-        )
-
-        if result.returncode == 0:
-            for line in result.stdout.split('\n'):
-                if 'Generated data for' in line:
-                    return True, line.strip()
-            return True, "OK"
+        data, output_file = write_finnish_players_data(date_str, sync_photos=False, workers=workers,
+                                                       incremental=incremental)
+    except Exception as e:
+        entry = {"status": FAILED, "error": str(e)}
+    else:
+        if output_file is None:
+            entry = {"status": FAILED,
+                     "error": f"schedule not fetched: {get_skip_reason(schedule_url(date_str)) or 'unknown'}"}
         else:
-            return False, f"Exit code {result.returncode}"
+            players = data.get("players", [])
+            skipped = len(data.get("skipped_games", []))
+            unfinished = sum(1 for game in data.get("games", []) if game.get("gameState") != "OFF")
+            entry = {
+                "status": PARTIAL if skipped or unfinished else DONE,
+                "games": len(data.get("games", [])),
+                "players": len(players),
+                "skipped_games": skipped,
+                "unfinished_games": unfinished,
+            }
+    entry["seconds"] = round(time.monotonic() - started, 1)
+    entry["finished_at"] = datetime.now().isoformat()
+    checkpoint.record(date_str, entry)
+    return entry, players
+
+
+def format_status(date_str, entry):
+    """Format a date's status as a one-line summary."""
+    if entry["status"] == FAILED:
+        return f"  ✗ {date_str}: {entry['error']} ({entry['seconds']}s)"
+    if entry["status"] == PARTIAL:
+        return (f"  ⚠️ {date_str}: {entry['players']} players, {entry['skipped_games']} game(s) skipped, "
+                f"{entry.get('unfinished_games', 0)} not final ({entry['seconds']}s)")
+    return f"  ✓ {date_str}: {entry['players']} players in {entry['games']} games ({entry['seconds']}s)"
+
+
+def run_backfill(dates, checkpoint, date_workers, workers, incremental):
+    """
+    Backfill dates on a worker pool; logs come out in date order.
+
+    Returns:
+        Tuple of (dict of date -> status entry, list of all players written)
+    """
+    total = len(dates)
+    statuses = {}
+    all_players = []
+
+    def run(item):
+        i, date_str = item
+        print(f"\n[{i}/{total}] Fetching {date_str}...")
+        entry, players = backfill_date(date_str, checkpoint, workers=workers, incremental=incremental)
+        print(format_status(date_str, entry))
+        return date_str, entry, players
+
+    for date_str, entry, players in map_in_order(run, enumerate(dates, 1), max_workers=date_workers):
+        statuses[date_str] = entry
+        all_players.extend(players)
+    return statuses, all_players
 
-    except subprocess.TimeoutExpired:
-        return False, "Timeout"
-    except Exception as e:
-        return False, str(e)
 
 def main():
-    total = 0
-    success = 0
-    failed = 0
-    failed_dates = []
-
-    # Calculate total days for progress display
-    total_days = sum(1 for _ in date_range(START_DATE, END_DATE))
+    parser = argparse.ArgumentParser(description="Backfill Finnish NHL players data for a date range")
+    parser.add_argument("start_date", nargs="?", default=START_DATE, help=f"First date (default: {START_DATE})")
+    parser.add_argument("end_date", nargs="?", default=END_DATE, help=f"Last date (default: {END_DATE})")
+    parser.add_argument("--date-workers", type=int, default=BACKFILL_DATE_WORKERS,
+                        help=f"Dates processed concurrently (default: {BACKFILL_DATE_WORKERS})")
+    parser.add_argument("--workers", type=int, default=GAME_PIPELINE_WORKERS,
+                        help=f"Games processed concurrently per date (default: {GAME_PIPELINE_WORKERS})")
+    parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint and fetch every date again")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Keep unchanged final games from existing files")
+    parser.add_argument("--checkpoint", default=None, help=f"Checkpoint file (default: {BACKFILL_CHECKPOINT_FILE})")
+    add_cassette_arguments(parser)
+    args = parser.parse_args()
+    apply_cassette_arguments(args)
+    start_run_report("fetch_season")
+
+    checkpoint = BackfillCheckpoint(args.checkpoint)
+    dates = list(date_range(args.start_date, args.end_date))
+    pending = checkpoint.pending(dates, restart=args.restart)
 
     print("=" * 60)
-    print(f"Fetching from {START_DATE} to {END_DATE}")
-    print(f"Total: {total_days} days | Timeout: {PER_DATE_TIMEOUT}s per date")
+    print(f"Fetching from {args.start_date} to {args.end_date}")
+    print(f"Total: {len(dates)} days | {len(dates) - len(pending)} already done | "
+          f"{args.date_workers} date worker(s)")
+    print(f"Checkpoint: {checkpoint.path}")
     print("=" * 60)
 
-    for date_str in date_range(START_DATE, END_DATE):
-        total += 1
-        print(f"\n[{total}/{total_days}] Fetching {date_str}...", flush=True)
-
-        ok, msg = fetch_date(date_str)
-
-        if ok:
-            success += 1
-            print(f"  ✓ {msg}")
-        else:
-            failed += 1
-            failed_dates.append(date_str)
-            print(f"  ✗ {msg}")
-
-        # Brief pause between dates
-        time.sleep(1)
+    statuses, all_players = run_backfill(pending, checkpoint, args.date_workers, args.workers, args.incremental)
 
     # Retry failed dates
-    if RETRY_FAILED and failed_dates:
+    retry = [d for d in pending if statuses[d]["status"] != DONE]
+    if RETRY_FAILED and retry:
         print(f"\n{'='*60}")
-        print(f"Retrying {len(failed_dates)} failed dates...")
+        print(f"Retrying {len(retry)} failed date(s)...")
         print(f"{'='*60}")
-
-        for date_str in failed_dates[:]:  # Copy to modify during iteration
-            print(f"\n[RETRY] Fetching {date_str}...", flush=True)
-            time.sleep(RETRY_DELAY)
-
-            ok, msg = fetch_date(date_str)
-
-            if ok:
-                success += 1
-                failed -= 1
-                failed_dates.remove(date_str)
-                print(f"  ✓ {msg}")
-            else:
-                print(f"  ✗ Still failed: {msg}")
+        retried, players = run_backfill(retry, checkpoint, 1, args.workers, args.incremental)
+        statuses.update(retried)
+        all_players.extend(players)
+
+    # Sync headshots once for every player seen in the backfill
+    if all_players:
+        unique_players = list({p["playerId"]: p for p in all_players}.values())
+        new_headshots = sync_headshots(unique_players)
+        if new_headshots > 0:
+            print(f"\n📷 Downloaded {new_headshots} new headshot(s)")
+
+    counts = {status: 0 for status in (DONE, PARTIAL, FAILED)}
+    for entry in statuses.values():
+        counts[entry["status"]] += 1
+    not_done = [d for d in dates if checkpoint.dates.get(d, {}).get("status") != DONE]
 
     print(f"\n{'='*60}")
     print(f"Season fetch complete!")
-    print(f"Total: {total}, Success: {success}, Failed: {failed}")
-
-    if failed_dates:
-        print(f"\nFailed dates ({len(failed_dates)}):")
-        for d in failed_dates[:10]:
-            print(f"  - {d}")
-        if len(failed_dates) > 10:
-            print(f"  ... and {len(failed_dates) - 10} more")
+    print(f"Fetched: {len(pending)}, Done: {counts[DONE]}, Partial: {counts[PARTIAL]}, Failed: {counts[FAILED]}")
+    print(f"🔌 {format_connection_stats()}")
+    print(f"🗄️  {format_cache_stats()}")
+
+    if not_done:
+        print(f"\nIncomplete dates ({len(not_done)}), re-run to resume:")
+        for d in not_done[:10]:
+            entry = checkpoint.dates.get(d, {})
+            print(f"  - {d}: {entry.get('status', 'not started')}"
+                  + (f" ({entry['error']})" if entry.get("error") else ""))
+        if len(not_done) > 10:
+            print(f"  ... and {len(not_done) - 10} more")
 
     print(f"{'='*60}")
 
-    return 0 if failed == 0 else 1
+    return 0 if not not_done else 1
+
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -3,12 +3,20 @@ Finnish text normalization utilities for player and city names.
 Handles auto-correction of ASCII approximations to proper Finnish letters (ä, ö, å) using OpenAI gpt-5-nano.
 """
 
+import hashlib
+import json
 import os
 from openai import OpenAI
 
 _openai_client = None
 _correction_cache = {}  # Cache corrections to avoid duplicate API calls
 
+# Bump when MANUAL_CORRECTIONS, the prompt or the model change: cached records
+# stamped with an older version are normalized again
+NORMALIZER_VERSION = 1
+NORMALIZATION_KEY = "normalization"  # stamp stored on each cached player record
+RAW_TEXT_FIELDS = ("firstName", "lastName", "birthCity")
+
 # Manual overrides for specific names/cities where LLM might fail or be inconsistent
 MANUAL_CORRECTIONS = {
     "Hameenaho": "Hämeenaho",
@@ -212,6 +220,81 @@ def normalize_finnish_player_data(player_data):
     return player_data
 
 
+def normalizer_available():
+    """True when corrections can actually run (OpenAI client configured)."""
+    return get_openai_client() is not None
+
+
+def raw_text_hash(player_data):
+    """
+    Hash the text the normalizer reads from a record (before correcting it).
+
+    Covers birthCountry and the default locale of firstName, lastName and
+    birthCity.
+    """
+    raw = [player_data.get("birthCountry", "")]
+    for field in RAW_TEXT_FIELDS:
+        value = player_data.get(field)
+        raw.append(value.get("default", "") if isinstance(value, dict) else "")
+    encoded = json.dumps(raw, ensure_ascii=False)
+    return hashlib.sha1(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+def is_normalized(record, raw_hash=None):
+    """
+    Check a cached record's normalization stamp.
+
+    Args:
+        record: Cached player record
+        raw_hash: If given, the stamp must also match this raw_text_hash()
+
+    Returns:
+        True if the record was normalized by the current NORMALIZER_VERSION
+    """
+    stamp = record.get(NORMALIZATION_KEY) or {}
+    if stamp.get("version") != NORMALIZER_VERSION:
+        return False
+    return raw_hash is None or stamp.get("raw_hash") == raw_hash
+
+
+def strip_normalization(record):
+    """Return the record without its normalization stamp."""
+    return {key: value for key, value in record.items() if key != NORMALIZATION_KEY}
+
+
+def normalize_cache_record(record, previous=None):
+    """
+    Normalize a freshly built cache record and stamp it.
+
+    When the previous record for the player was normalized from the same raw
+    text by the current normalizer, its corrected names are reused instead
+    of asking OpenAI again. A record is only stamped when its corrections
+    really ran (or were reused), so a build without OPENAI_API_KEY leaves it
+    to be normalized later.
+
+    Args:
+        record: New cache record with raw (uncorrected) text, modified in place
+        previous: The player's record from the previous cache, if any
+
+    Returns:
+        The normalized record
+    """
+    raw_hash = raw_text_hash(record)
+    reused = bool(previous) and is_normalized(previous, raw_hash)
+    if reused:
+        for field in RAW_TEXT_FIELDS:
+            if isinstance(record.get(field), dict) and isinstance(previous.get(field), dict):
+                record[field]["default"] = previous[field].get("default", "")
+        record["name"] = previous.get("name", record.get("name", ""))
+        record["birthplace"] = previous.get("birthplace", record.get("birthplace", ""))
+    else:
+        normalize_finnish_player_data(record)
+
+    if reused or normalizer_available():
+        record[NORMALIZATION_KEY] = {"version": NORMALIZER_VERSION, "raw_hash": raw_hash}
+    return record
+
+
 def get_cache_stats():
     """Return cache statistics for debugging."""
     return {
@@ -6,10 +6,12 @@ Continuously monitors NHL games and updates Finnish player data every 30 seconds
 Integrates with existing batch collection system.
 
 Usage: python realtime_monitor.py [--daemon] [--config config.json]
+                                  [--record CASSETTE | --replay CASSETTE]
 """
 
 import json
 import logging
+import os
 import sys
 import time
 from datetime import datetime, timedelta
@@ -18,6 +20,15 @@ from threading import Lock, Thread
 from typing import Dict, List, Optional
 import argparse
 
+# Shared fetch layer lives two levels up (scripts/data_collection)
+_data_collection_dir = str(Path(__file__).parent.parent.parent)
+if _data_collection_dir not in sys.path:
+    sys.path.insert(0, _data_collection_dir)
+
+from config import NHL_API_BASE
+from utils import fetch_from_api as fetch_json_from_api
+from cassette import add_cassette_arguments, apply_cassette_arguments
+
 # Import our modules
 from state_manager import GameStateManager
 from data_updater import DataUpdater
@@ -66,11 +77,16 @@ class RealtimeMonitor:
         """Load configuration from JSON file"""
         try:
             with open(config_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+                config = json.load(f)
         except Exception as e:
             print(f"Error loading config {config_path}: {e}")
             return self._default_config()
 
+        # NHL_API_BASE in the environment wins over the config file
+        if os.environ.get("NHL_API_BASE"):
+            config.setdefault('api', {})['base_url'] = NHL_API_BASE
+        return config
+
     def _default_config(self) -> dict:
         """Default configuration"""
         return {
@@ -80,7 +96,7 @@ class RealtimeMonitor:
                 "max_concurrent_updates": 5
             },
             "api": {
-                "base_url": "https://api-web.nhle.com",
+                "base_url": NHL_API_BASE,
                 "request_timeout": 10,
                 "retry_attempts": 2
             },
@@ -117,34 +133,25 @@ class RealtimeMonitor:
         """
         Fetch data from NHL API with retry logic
 
+        Goes through the shared fetch layer (pooled session, rate limiting,
+        cassette record/replay) but bypasses the response cache so live
+        games are always read fresh.
+
         Args:
             url: API endpoint URL
 
         Returns:
             JSON data or None if error
         """
-        import requests
-
         api_config = self.config.get('api', {})
         timeout = api_config.get('request_timeout', 10)
         max_retries = api_config.get('retry_attempts', 2)
-        retry_delay = api_config.get('retry_delay', 2)
-
-        for attempt in range(max_retries):
-            try:
-                response = requests.get(url, timeout=timeout)
-                response.raise_for_status()
-                return response.json()
-            except Exception as e:
-                self.logger.warning(f"API request failed (attempt {attempt + 1}): {e}")
-                if attempt < max_retries - 1:
-                    time.sleep(retry_delay)
-                else:
-                    self.logger.error(f"API request failed after {max_retries} attempts")
-                    self.stats['errors'] += 1
-                    return None
 
-        return None
+        data = fetch_json_from_api(url, max_retries=max_retries, timeout=timeout, use_cache=False)
+        if data is None:
+            self.logger.error(f"API request failed after {max_retries} attempts: {url}")
+            self.stats['errors'] += 1
+        return data
 
     def load_finnish_player_cache(self) -> Dict[int, dict]:
         """Load cached Finnish player information"""
@@ -157,8 +164,11 @@ class RealtimeMonitor:
         try:
             with open(cache_path, 'r', encoding='utf-8') as f:
                 str_cache = json.load(f)
-                # Convert string keys to integers
-                return {int(k): v for k, v in str_cache.items()}
+                # Convert string keys to integers, dropping build_cache's normalization stamp
+                return {
+                    int(k): {field: value for field, value in v.items() if field != 'normalization'}
+                    for k, v in str_cache.items()
+                }
         except Exception as e:
             self.logger.error(f"Error loading cache: {e}")
             return {}
@@ -426,7 +436,9 @@ def main():
     parser = argparse.ArgumentParser(description='Real-time NHL Finnish player monitor')
     parser.add_argument('--config', type=Path, help='Path to configuration file')
     parser.add_argument('--daemon', action='store_true', help='Run as daemon')
+    add_cassette_arguments(parser)
     args = parser.parse_args()
+    apply_cassette_arguments(args)
 
     monitor = RealtimeMonitor(args.config)
 
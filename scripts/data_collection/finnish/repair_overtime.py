@@ -1,26 +1,15 @@
 #!/usr/bin/env python3
 import json
 import os
-import time
-import requests
+import sys
 from pathlib import Path
 from datetime import datetime
 
-NHL_API_BASE = "https://api-web.nhle.com"
-GAMES_DIR = Path("static/data/prepopulated/games")
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-def fetch_from_api(url, max_retries=2):
-    for attempt in range(max_retries):
-        try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            if attempt == max_retries - 1:
-                print(f"Error fetching {url}: {e}")
-                return None
-            time.sleep(2)
-    return None
+from config import GAMES_DIR
+from utils import fetch_from_api, game_boxscore_url
 
 def repair_game_data(file_path):
     print(f"Repairing {file_path.name}...")
@@ -44,8 +33,7 @@ def repair_game_data(file_path):
             continue
             
         print(f"  🏒 Fetching details for game {game_id} ({game.get('awayTeam')} @ {game.get('homeTeam')})...")
-        url = f"{NHL_API_BASE}/v1/gamecenter/{game_id}/boxscore"
-        details = fetch_from_api(url)
+        details = fetch_from_api(game_boxscore_url(game_id), max_retries=2)
         
         if details:
             pd = details.get("periodDescriptor", {})
@@ -60,8 +48,6 @@ def repair_game_data(file_path):
             print(f"    ✅ Updated: period={period}, isOT={is_ot}, isSO={is_so}")
         else:
             print(f"    ❌ Failed to fetch details for game {game_id}")
-            
-        time.sleep(1) # Rate limiting
 
     if updated:
         try:
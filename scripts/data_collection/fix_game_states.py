@@ -11,71 +11,33 @@ Usage:
     python fix_game_states.py --date 2026-01-14  # Fix specific date
 """
 
-import json
 import sys
-import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Set, Tuple
 
-# NHL API Base
-NHL_API_BASE = "https://api-web.nhle.com"
+# Add this directory to path for shared config/utils imports
+sys.path.insert(0, str(Path(__file__).parent))
 
-# Project paths
-BASE_DIR = Path(__file__).parent.parent.parent
-GAMES_DIR = BASE_DIR / "static/data/prepopulated/games"
-
-
-def fetch_from_api(url: str, max_retries: int = 2) -> dict | None:
-    """Fetch data from NHL API with retry logic."""
-    import requests
-
-    for attempt in range(max_retries):
-        try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            if attempt == max_retries - 1:
-                print(f"    ❌ Error fetching {url}: {e}")
-                return None
-            time.sleep(2)
-    return None
+from config import GAMES_DIR
+from game_store import get_game_store
+from utils import fetch_from_api, game_boxscore_url
 
 
 def find_games_needing_fix(dry_run: bool = False, target_date: str | None = None) -> List[Tuple[Path, int, dict]]:
     """
-    Scan game JSON files for games with CRIT or FINAL states.
+    Find games with CRIT or FINAL states (indexed query on the game store).
 
     Returns:
         List of (file_path, game_id, game_data) tuples
     """
-    games_to_fix = []
-
-    if target_date:
-        json_files = [GAMES_DIR / f"{target_date}.json"]
-    else:
-        json_files = sorted(GAMES_DIR.glob("*.json"), reverse=True)
-
     print(f"🔍 Scanning for games with CRIT/FINAL states...")
 
-    for file_path in json_files:
-        if not file_path.exists():
-            continue
-
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            for game in data.get("games", []):
-                game_state = game.get("gameState")
-                game_id = game.get("gameId")
-
-                if game_state in ["CRIT", "FINAL"] and game_id:
-                    games_to_fix.append((file_path, game_id, game))
-
-        except Exception as e:
-            print(f"⚠️ Error reading {file_path.name}: {e}")
+    games_to_fix = [
+        (GAMES_DIR / f"{date_str}.json", game["gameId"], game)
+        for date_str, game in get_game_store().find_games(states=("CRIT", "FINAL"), date=target_date)
+        if game.get("gameId")
+    ]
 
     print(f"   Found {len(games_to_fix)} games needing fix")
     return games_to_fix
@@ -83,8 +45,7 @@ def find_games_needing_fix(dry_run: bool = False, target_date: str | None = None
 
 def fetch_correct_game_data(game_id: int) -> dict | None:
     """Fetch correct game data from NHL API."""
-    url = f"{NHL_API_BASE}/v1/gamecenter/{game_id}/boxscore"
-    boxscore = fetch_from_api(url)
+    boxscore = fetch_from_api(game_boxscore_url(game_id), max_retries=2)
 
     if not boxscore:
         return None
@@ -135,11 +96,9 @@ def update_player_scores_in_file(
     Update player data in the JSON file for a specific game.
     Updates game_score field and recent_results for affected players.
     """
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-    except Exception as e:
-        print(f"    ❌ Error reading file: {e}")
+    data = get_game_store().day(file_path.stem)
+    if data is None:
+        print(f"    ❌ {file_path.stem} is not in the game store")
         return False
 
     updated_players = False
@@ -193,8 +152,7 @@ def update_player_scores_in_file(
 
     if updated_players:
         try:
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            get_game_store().save_day(data)
             return True
         except Exception as e:
             print(f"    ❌ Error writing file: {e}")
@@ -237,12 +195,10 @@ def fix_game(
         print(f"   [DRY RUN] Would update game state and scores")
         return True
 
-    # Update the game in the JSON file
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            file_data = json.load(f)
-    except Exception as e:
-        print(f"   ❌ Error reading file: {e}")
+    # Update the game in the store (the JSON file is exported from it)
+    file_data = get_game_store().day(file_path.stem)
+    if file_data is None:
+        print(f"   ❌ {file_path.stem} is not in the game store")
         return False
 
     # Find and update the game
@@ -264,8 +220,7 @@ def fix_game(
 
     # Save updated game data
     try:
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(file_data, f, indent=2, ensure_ascii=False)
+        get_game_store().save_day(file_data)
         print(f"   ✅ Updated game summary")
     except Exception as e:
         print(f"   ❌ Error writing file: {e}")
@@ -340,8 +295,6 @@ def main():
             else:
                 failed_count += 1
 
-            time.sleep(1)  # Rate limiting
-
     print("\n" + "=" * 80)
     print(f"✅ Fixed: {fixed_count} games")
     if failed_count > 0:
@@ -0,0 +1,263 @@
+"""
+Persistent index of final game results.
+
+Maps gameId -> {date, teams, scores, isOT/isSO, full team names}, built from
+the daily game files in GAMES_DIR and kept in sync with them by file size
+and mtime, so answering "how did this game end?" for a player's recent games
+needs no boxscore request. Games the daily files do not cover can be added
+from a boxscore and are remembered too.
+
+The index lives at GAME_FACTS_FILE (.cache/game-facts.json) and is rebuilt
+from scratch whenever it is missing or unreadable.
+"""
+
+import atexit
+import json
+import os
+import threading
+from pathlib import Path
+
+from config import GAMES_DIR, GAME_FACTS_FILE
+from utils import extract_team_name
+
+GAME_FACTS_FORMAT = 1
+FINAL_GAME_STATES = ("OFF", "FINAL")
+
+
+def _facts_from_summary(summary, date_str, team_names):
+    """Build a game entry from a daily file's game summary."""
+    home = summary.get("homeTeam", "")
+    away = summary.get("awayTeam", "")
+    return {
+        "date": date_str,
+        "homeTeam": home,
+        "awayTeam": away,
+        "homeScore": summary.get("homeScore", 0),
+        "awayScore": summary.get("awayScore", 0),
+        "isOT": summary.get("isOT", False),
+        "isSO": summary.get("isSO", False),
+        "homeTeamName": team_names.get(home, ""),
+        "awayTeamName": team_names.get(away, ""),
+    }
+
+
+class GameFactsIndex:
+    """Thread-safe gameId -> final game facts index backed by a JSON file."""
+
+    def __init__(self, path=None, games_dir=None):
+        """
+        Args:
+            path: Index file (defaults to GAME_FACTS_FILE)
+            games_dir: Daily game files to index (defaults to GAMES_DIR)
+        """
+        self.path = Path(path or GAME_FACTS_FILE)
+        self.games_dir = Path(games_dir or GAMES_DIR)
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._files = {}  # file name -> [size, mtime_ns] when last indexed
+        self._games = {}  # str(gameId) -> facts
+        self._teams = {}  # abbrev -> full name, latest seen
+        self.stats = {"hits": 0, "misses": 0, "files_indexed": 0, "boxscores_added": 0}
+        self._load()
+
+    # -------------------------------------------------------------------------
+    # Storage
+    # -------------------------------------------------------------------------
+    def _load(self):
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        if index.get("format") != GAME_FACTS_FORMAT:
+            return
+        self._files = index.get("files", {})
+        self._games = index.get("games", {})
+        self._teams = index.get("teams", {})
+
+    def save(self):
+        """Write the index to disk if it changed (atomic replace)."""
+        with self._lock:
+            if not self._dirty:
+                return False
+            index = {
+                "format": GAME_FACTS_FORMAT,
+                "files": dict(sorted(self._files.items())),
+                "teams": dict(sorted(self._teams.items())),
+                "games": dict(sorted(self._games.items())),
+            }
+            self._dirty = False
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, self.path)
+        return True
+
+    # -------------------------------------------------------------------------
+    # Indexing
+    # -------------------------------------------------------------------------
+    def _add_day_locked(self, data):
+        date_str = data.get("date", "")
+        team_names = {}
+        for player in data.get("players", []):
+            if player.get("team") and player.get("team_full"):
+                team_names[player["team"]] = player["team_full"]
+            if player.get("opponent") and player.get("opponent_full"):
+                team_names[player["opponent"]] = player["opponent_full"]
+        self._teams.update(team_names)
+
+        for summary in data.get("games", []):
+            game_id = summary.get("gameId")
+            if game_id is None or summary.get("gameState") not in FINAL_GAME_STATES:
+                continue
+            facts = _facts_from_summary(summary, date_str, team_names)
+            previous = self._games.get(str(game_id), {})
+            # A day without Finnish players carries no names; keep older ones
+            for key in ("homeTeamName", "awayTeamName"):
+                facts[key] = facts[key] or previous.get(key, "")
+            self._games[str(game_id)] = facts
+        self._dirty = True
+
+    def add_day(self, data, file_path=None):
+        """
+        Index the games of one daily file (call after writing it).
+
+        Args:
+            data: Daily game data as written to GAMES_DIR
+            file_path: The file it was written to, so refresh() skips it
+        """
+        with self._lock:
+            self._add_day_locked(data)
+            if file_path is not None:
+                file_path = Path(file_path)
+                try:
+                    st = file_path.stat()
+                except OSError:
+                    return
+                self._files[file_path.name] = [st.st_size, st.st_mtime_ns]
+
+    def add_boxscore(self, game_id, boxscore):
+        """
+        Index a final game from its boxscore (ignored while not final).
+
+        Returns:
+            The game's facts dict, or None if the boxscore is not final
+        """
+        if not boxscore or boxscore.get("gameState") not in FINAL_GAME_STATES:
+            return None
+        home = boxscore.get("homeTeam", {})
+        away = boxscore.get("awayTeam", {})
+        pd = boxscore.get("periodDescriptor", {})
+        facts = {
+            "date": boxscore.get("gameDate", ""),
+            "homeTeam": home.get("abbrev", ""),
+            "awayTeam": away.get("abbrev", ""),
+            "homeScore": home.get("score", 0),
+            "awayScore": away.get("score", 0),
+            "isOT": pd.get("number", 0) > 3,
+            "isSO": pd.get("periodType") == "SO",
+            "homeTeamName": extract_team_name(home),
+            "awayTeamName": extract_team_name(away),
+        }
+        with self._lock:
+            if self._games.get(str(game_id)) == facts:
+                return facts
+            self._games[str(game_id)] = facts
+            for abbrev, name in ((facts["homeTeam"], facts["homeTeamName"]), (facts["awayTeam"], facts["awayTeamName"])):
+                if abbrev and name:
+                    self._teams[abbrev] = name
+            self.stats["boxscores_added"] += 1
+            self._dirty = True
+        return facts
+
+    def refresh(self):
+        """
+        Re-index daily files that are new or changed since they were indexed.
+
+        Returns:
+            Number of files (re)indexed
+        """
+        if not self.games_dir.exists():
+            return 0
+        changed = []
+        with self._lock:
+            for path in sorted(self.games_dir.glob("*.json")):
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                if self._files.get(path.name) != [st.st_size, st.st_mtime_ns]:
+                    changed.append((path, [st.st_size, st.st_mtime_ns]))
+
+        for path, signature in changed:
+            try:
+                with open(path, encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                continue
+            with self._lock:
+                self._add_day_locked(data)
+                self._files[path.name] = signature
+                self.stats["files_indexed"] += 1
+        return len(changed)
+
+    # -------------------------------------------------------------------------
+    # Lookups
+    # -------------------------------------------------------------------------
+    def get(self, game_id):
+        """
+        Look up a final game.
+
+        Returns:
+            Facts dict (do not mutate), or None if the game is not indexed
+        """
+        with self._lock:
+            facts = self._games.get(str(game_id))
+            self.stats["misses" if facts is None else "hits"] += 1
+        return facts
+
+    def team_name(self, abbrev):
+        """Latest known full name for a team abbreviation, or the abbreviation."""
+        with self._lock:
+            return self._teams.get(abbrev) or abbrev
+
+    def get_stats(self):
+        with self._lock:
+            stats = dict(self.stats)
+            stats["games"] = len(self._games)
+            stats["files"] = len(self._files)
+        return stats
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_game_facts():
+    """
+    Get the process-wide game facts index, refreshed from GAMES_DIR.
+
+    The index is saved automatically at exit.
+    """
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                index = GameFactsIndex()
+                index.refresh()
+                atexit.register(index.save)
+                _index = index
+    return _index
+
+
+def format_game_facts_stats():
+    """Format game facts index usage as a one-line summary."""
+    stats = get_game_facts().get_stats()
+    return (
+        f"Game facts: {stats['hits']} hits, {stats['misses']} misses, "
+        f"{stats['games']} games indexed from {stats['files']} files"
+    )
@@ -0,0 +1,491 @@
+#!/usr/bin/env python3
+"""
+SQLite index of the daily games, player games, players and venues.
+
+Every daily game file in GAMES_DIR is indexed in one SQLite database
+(GAME_STORE_FILE, .cache/game-store.sqlite3) with indexes on gameId,
+playerId, date and team, so repairs and analytics are indexed queries
+instead of a json.load of every file. The collectors write a day into the
+store and export the static JSON file from it; export_day() writes exactly
+what save_json() of the same dict would.
+
+The store is an index, not the source of truth: the committed JSON files
+are, and they are what gets deployed. It lives in the gitignored .cache/
+and re-imports any file that is new or changed since it was imported (by
+size and mtime, like game_facts.py), so a fresh checkout or a hand-edited
+file never leaves it stale, and deleting it only costs a rebuild.
+
+Tables:
+    days          date, header (the file's other keys, in order), file signature
+    games         one row per game summary per day file (PK date, position)
+    player_games  one row per player record per day file (PK date, position)
+    players       latest identity per playerId
+    venues        (name, city) -> address, referenced by games.venue_id
+
+Usage:
+    python game_store.py                 # sync from GAMES_DIR and show stats
+    python game_store.py --export        # rewrite every daily file from the store
+    python game_store.py --export 2025-11-15
+    python game_store.py --duplicates    # games stored under more than one date
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+
+from config import GAMES_DIR, GAME_STORE_FILE, JSON_ENSURE_ASCII, JSON_INDENT
+
+GAME_STORE_SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS days (
+    date TEXT PRIMARY KEY,
+    header TEXT NOT NULL,
+    file_size INTEGER,
+    file_mtime_ns INTEGER
+);
+CREATE TABLE IF NOT EXISTS venues (
+    venue_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    city TEXT NOT NULL,
+    address TEXT,
+    UNIQUE (name, city)
+);
+CREATE TABLE IF NOT EXISTS games (
+    date TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    game_id INTEGER,
+    home_team TEXT,
+    away_team TEXT,
+    home_score INTEGER,
+    away_score INTEGER,
+    game_state TEXT,
+    game_type INTEGER,
+    start_time TEXT,
+    period INTEGER,
+    is_ot INTEGER,
+    is_so INTEGER,
+    venue_id INTEGER REFERENCES venues (venue_id),
+    record TEXT NOT NULL,
+    PRIMARY KEY (date, position)
+);
+CREATE INDEX IF NOT EXISTS games_by_id ON games (game_id);
+CREATE INDEX IF NOT EXISTS games_by_home ON games (home_team, date);
+CREATE INDEX IF NOT EXISTS games_by_away ON games (away_team, date);
+CREATE INDEX IF NOT EXISTS games_by_state ON games (game_state);
+CREATE TABLE IF NOT EXISTS player_games (
+    date TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    game_id INTEGER,
+    player_id INTEGER,
+    team TEXT,
+    opponent TEXT,
+    goals INTEGER,
+    assists INTEGER,
+    points INTEGER,
+    record TEXT NOT NULL,
+    PRIMARY KEY (date, position)
+);
+CREATE INDEX IF NOT EXISTS player_games_by_player ON player_games (player_id, date);
+CREATE INDEX IF NOT EXISTS player_games_by_game ON player_games (game_id);
+CREATE INDEX IF NOT EXISTS player_games_by_team ON player_games (team, date);
+CREATE TABLE IF NOT EXISTS players (
+    player_id INTEGER PRIMARY KEY,
+    name TEXT,
+    position TEXT,
+    team TEXT,
+    birth_date TEXT,
+    birthplace TEXT,
+    headshot_url TEXT,
+    last_date TEXT
+);
+"""
+
+# Day file keys held in their own tables; the header keeps their place
+LIST_KEYS = ("games", "players")
+
+
+def _dumps(value):
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _flag(value):
+    return None if value is None else int(bool(value))
+
+
+class GameStore:
+    """Thread-safe SQLite store of the daily game files."""
+
+    def __init__(self, path=None, games_dir=None):
+        """
+        Args:
+            path: Database file (defaults to GAME_STORE_FILE)
+            games_dir: Daily game files it mirrors (defaults to GAMES_DIR)
+        """
+        self.path = Path(path or GAME_STORE_FILE)
+        self.games_dir = Path(games_dir or GAMES_DIR)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        version = self._db.execute("PRAGMA user_version").fetchone()[0]
+        if version != GAME_STORE_SCHEMA_VERSION:
+            # Derived from the daily files, so an old layout is simply rebuilt
+            with self._db:
+                for (table,) in self._db.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall():
+                    self._db.execute(f"DROP TABLE IF EXISTS {table}")
+        self._db.executescript(SCHEMA)
+        self._db.execute(f"PRAGMA user_version={GAME_STORE_SCHEMA_VERSION}")
+        self.stats = {"days_imported": 0, "days_exported": 0, "queries": 0}
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+    # -------------------------------------------------------------------------
+    # Import
+    # -------------------------------------------------------------------------
+    def _venue_id_locked(self, name, city, address):
+        row = self._db.execute("SELECT venue_id, address FROM venues WHERE name = ? AND city = ?",
+                               (name, city)).fetchone()
+        if row is None:
+            return self._db.execute("INSERT INTO venues (name, city, address) VALUES (?, ?, ?)",
+                                    (name, city, address)).lastrowid
+        if address and address != row[1]:
+            self._db.execute("UPDATE venues SET address = ? WHERE venue_id = ?", (address, row[0]))
+        return row[0]
+
+    def _import_day_locked(self, data, signature):
+        date_str = data["date"]
+        header = {key: (None if key in LIST_KEYS else value) for key, value in data.items()}
+        self._db.execute("DELETE FROM games WHERE date = ?", (date_str,))
+        self._db.execute("DELETE FROM player_games WHERE date = ?", (date_str,))
+        self._db.execute(
+            "INSERT OR REPLACE INTO days (date, header, file_size, file_mtime_ns) VALUES (?, ?, ?, ?)",
+            (date_str, _dumps(header), *(signature or (None, None))),
+        )
+
+        game_venues = {}
+        player_rows = []
+        for position, player in enumerate(data.get("players", [])):
+            game_id = player.get("game_id")
+            if player.get("game_venue") and game_id not in game_venues:
+                game_venues[game_id] = self._venue_id_locked(
+                    player["game_venue"], player.get("game_city") or "", player.get("game_address"))
+            player_rows.append((
+                date_str, position, game_id, player.get("playerId"), player.get("team"), player.get("opponent"),
+                player.get("goals"), player.get("assists"), player.get("points"), _dumps(player),
+            ))
+            if player.get("playerId") is not None:
+                self._db.execute(
+                    """INSERT INTO players (player_id, name, position, team, birth_date, birthplace, headshot_url, last_date)
+                       VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                       ON CONFLICT (player_id) DO UPDATE SET
+                           name = excluded.name, position = excluded.position, team = excluded.team,
+                           birth_date = excluded.birth_date, birthplace = excluded.birthplace,
+                           headshot_url = excluded.headshot_url, last_date = excluded.last_date
+                       WHERE excluded.last_date >= players.last_date""",
+                    (player["playerId"], player.get("name"), player.get("position"), player.get("team"),
+                     player.get("birth_date"), player.get("birthplace"), player.get("headshot_url"), date_str),
+                )
+        self._db.executemany("INSERT INTO player_games VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", player_rows)
+
+        game_rows = []
+        for position, game in enumerate(data.get("games", [])):
+            game_id = game.get("gameId")
+            game_rows.append((
+                date_str, position, game_id, game.get("homeTeam"), game.get("awayTeam"),
+                game.get("homeScore"), game.get("awayScore"), game.get("gameState"), game.get("gameType"),
+                game.get("startTime"), game.get("period"), _flag(game.get("isOT")), _flag(game.get("isSO")),
+                game_venues.get(game_id), _dumps(game),
+            ))
+        self._db.executemany("INSERT INTO games VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", game_rows)
+        self.stats["days_imported"] += 1
+
+    def import_day(self, data, file_path=None):
+        """
+        Store one day (replacing what the store had for that date).
+
+        Args:
+            data: Daily game data, as written to GAMES_DIR
+            file_path: The file it was read from or written to, so sync() skips it
+        """
+        signature = None
+        if file_path is not None:
+            try:
+                st = Path(file_path).stat()
+                signature = (st.st_size, st.st_mtime_ns)
+            except OSError:
+                pass
+        with self._lock, self._db:
+            self._import_day_locked(data, signature)
+
+    def sync(self):
+        """
+        Import daily files that are new or changed, and drop days whose file is gone.
+
+        Returns:
+            Number of files imported
+        """
+        if not self.games_dir.exists():
+            return 0
+        with self._lock:
+            known = {date_str: (size, mtime) for date_str, size, mtime
+                     in self._db.execute("SELECT date, file_size, file_mtime_ns FROM days")}
+        files = {}
+        for path in sorted(self.games_dir.glob("*.json")):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            files[path.stem] = (path, (st.st_size, st.st_mtime_ns))
+
+        imported = 0
+        for date_str, (path, signature) in files.items():
+            if known.get(date_str) == signature:
+                continue
+            try:
+                with open(path, encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                continue
+            if data.get("date") != date_str:
+                continue
+            with self._lock, self._db:
+                self._import_day_locked(data, signature)
+            imported += 1
+
+        removed = [date_str for date_str, signature in known.items() if date_str not in files and signature[0] is not None]
+        if removed:
+            with self._lock, self._db:
+                for table in ("days", "games", "player_games"):
+                    self._db.executemany(f"DELETE FROM {table} WHERE date = ?", [(d,) for d in removed])
+        return imported
+
+    # -------------------------------------------------------------------------
+    # Export
+    # -------------------------------------------------------------------------
+    def day(self, date_str):
+        """
+        Rebuild a day's data dict (the daily file's content), or None if unknown.
+
+        The result is a fresh copy; pass it to save_day() after changing it.
+        """
+        with self._lock:
+            row = self._db.execute("SELECT header FROM days WHERE date = ?", (date_str,)).fetchone()
+            if row is None:
+                return None
+            games = [json.loads(record) for (record,) in self._db.execute(
+                "SELECT record FROM games WHERE date = ? ORDER BY position", (date_str,))]
+            players = [json.loads(record) for (record,) in self._db.execute(
+                "SELECT record FROM player_games WHERE date = ? ORDER BY position", (date_str,))]
+        data = json.loads(row[0])
+        if "games" in data:
+            data["games"] = games
+        if "players" in data:
+            data["players"] = players
+        return data
+
+    def export_day(self, date_str, output_dir=None):
+        """
+        Write a day's JSON file from the store (atomic replace).
+
+        Byte-identical to save_json() of the same data.
+
+        Returns:
+            Path of the file written, or None if the store has no such day
+        """
+        data = self.day(date_str)
+        if data is None:
+            return None
+        output_dir = Path(output_dir or self.games_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        output_file = output_dir / f"{date_str}.json"
+        tmp_path = output_file.with_name(f"{output_file.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=JSON_INDENT, ensure_ascii=JSON_ENSURE_ASCII)
+        os.replace(tmp_path, output_file)
+
+        if output_dir == self.games_dir:
+            st = output_file.stat()
+            with self._lock, self._db:
+                self._db.execute("UPDATE days SET file_size = ?, file_mtime_ns = ? WHERE date = ?",
+                                 (st.st_size, st.st_mtime_ns, date_str))
+        self.stats["days_exported"] += 1
+        return output_file
+
+    def save_day(self, data):
+        """Store a day and export its JSON file. Returns the file path."""
+        self.import_day(data)
+        return self.export_day(data["date"])
+
+    def dates(self):
+        with self._lock:
+            return [date_str for (date_str,) in self._db.execute("SELECT date FROM days ORDER BY date")]
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+    def _query(self, sql, params=()):
+        with self._lock:
+            self.stats["queries"] += 1
+            return self._db.execute(sql, params).fetchall()
+
+    def find_games(self, states=None, game_type=None, date=None, missing_period=False, exclude_states=None):
+        """
+        Game summaries matching all given filters, newest date first.
+
+        Args:
+            states: Only these gameState values
+            game_type: Only this gameType (2 = regular season)
+            date: Only this date (YYYY-MM-DD)
+            missing_period: Only games without a period
+            exclude_states: Skip these gameState values
+
+        Returns:
+            List of (date, game summary dict)
+        """
+        clauses, params = [], []
+        if states:
+            clauses.append(f"game_state IN ({', '.join('?' * len(states))})")
+            params.extend(states)
+        if exclude_states:
+            clauses.append(f"(game_state IS NULL OR game_state NOT IN ({', '.join('?' * len(exclude_states))}))")
+            params.extend(exclude_states)
+        if game_type is not None:
+            clauses.append("game_type = ?")
+            params.append(game_type)
+        if date is not None:
+            clauses.append("date = ?")
+            params.append(date)
+        if missing_period:
+            clauses.append("period IS NULL")
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._query(f"SELECT date, record FROM games {where} ORDER BY date DESC, position", params)
+        return [(date_str, json.loads(record)) for date_str, record in rows]
+
+    def game_periods(self):
+        """gameId -> {isOT, isSO, period} for every game that has them."""
+        rows = self._query(
+            "SELECT game_id, is_ot, is_so, period FROM games WHERE is_ot IS NOT NULL AND period IS NOT NULL")
+        return {
+            game_id: {"isOT": bool(is_ot), "isSO": None if is_so is None else bool(is_so), "period": period}
+            for game_id, is_ot, is_so, period in rows
+        }
+
+    def team_games(self, team, start=None, end=None):
+        """A team's game summaries (home or away) between two dates, oldest first."""
+        rows = self._query(
+            """SELECT record FROM games
+               WHERE (home_team = ? OR away_team = ?) AND date BETWEEN ? AND ?
+               ORDER BY date, position""", (team, team, start or "", end or "9999"))
+        return [json.loads(record) for (record,) in rows]
+
+    def player_games(self, player_id=None, team=None, start=None, end=None):
+        """
+        Player records between two dates, oldest first.
+
+        Args:
+            player_id: Only this player
+            team: Only players of this team
+            start: First date (inclusive)
+            end: Last date (inclusive)
+
+        Returns:
+            List of (date, player record dict)
+        """
+        clauses, params = ["date BETWEEN ? AND ?"], [start or "", end or "9999"]
+        if player_id is not None:
+            clauses.append("player_id = ?")
+            params.append(player_id)
+        if team is not None:
+            clauses.append("team = ?")
+            params.append(team)
+        rows = self._query(
+            f"SELECT date, record FROM player_games WHERE {' AND '.join(clauses)} ORDER BY date, position", params)
+        return [(date_str, json.loads(record)) for date_str, record in rows]
+
+    def duplicate_games(self):
+        """gameId -> dates, for games stored under more than one date."""
+        rows = self._query(
+            """SELECT game_id, group_concat(date) FROM games
+               WHERE game_id IN (SELECT game_id FROM games GROUP BY game_id HAVING COUNT(*) > 1)
+               GROUP BY game_id ORDER BY game_id""")
+        return {game_id: sorted(dates.split(",")) for game_id, dates in rows}
+
+    def get_stats(self):
+        stats = dict(self.stats)
+        for table in ("days", "games", "player_games", "players", "venues"):
+            with self._lock:
+                stats[table] = self._db.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        return stats
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_game_store():
+    """Get the process-wide game store, synced from GAMES_DIR."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                store = GameStore()
+                store.sync()
+                _store = store
+    return _store
+
+
+def format_game_store_stats():
+    """Format game store contents as a one-line summary."""
+    stats = get_game_store().get_stats()
+    return (
+        f"Game store: {stats['days']} days, {stats['games']} games, {stats['player_games']} player games, "
+        f"{stats['players']} players, {stats['venues']} venues"
+    )
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+def main():
+    parser = argparse.ArgumentParser(description="Sync, query and export the SQLite game store")
+    parser.add_argument("--export", nargs="*", metavar="DATE",
+                        help="Rewrite daily JSON files from the store (all dates when none given)")
+    parser.add_argument("--output-dir", type=Path, default=None,
+                        help="Export somewhere other than GAMES_DIR")
+    parser.add_argument("--duplicates", action="store_true", help="List games stored under more than one date")
+    args = parser.parse_args()
+
+    store = GameStore()
+    imported = store.sync()
+    print(f"🗄️  Synced {imported} daily file(s) from {store.games_dir}")
+
+    if args.export is not None:
+        dates = args.export or store.dates()
+        for date_str in dates:
+            if store.export_day(date_str, args.output_dir) is None:
+                print(f"   ⚠️  {date_str}: not in the store")
+        print(f"📁 Exported {store.stats['days_exported']} daily file(s)")
+
+    if args.duplicates:
+        duplicates = store.duplicate_games()
+        print(f"🔁 {len(duplicates)} game(s) stored under more than one date")
+        for game_id, dates in duplicates.items():
+            print(f"   {game_id}: {', '.join(dates)}")
+
+    stats = store.get_stats()
+    print(f"📊 {stats['days']} days, {stats['games']} games, {stats['player_games']} player games, "
+          f"{stats['players']} players, {stats['venues']} venues ({store.path})")
+    store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
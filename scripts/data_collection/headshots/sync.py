@@ -9,10 +9,17 @@ Called automatically by fetch.py after fetching game data.
 from __future__ import annotations
 
 import io
+import sys
 from pathlib import Path
 from typing import List, Set, Optional
 
-import requests
+# Downloads go through the shared session so cassettes capture them too
+_parent_dir = str(Path(__file__).parent.parent)
+if _parent_dir not in sys.path:
+    sys.path.insert(0, _parent_dir)
+
+from config import HEADSHOTS_DIR, NHL_API_BASE
+from utils import http_get
 
 try:
     from PIL import Image
@@ -26,15 +33,11 @@ try:
 except ImportError:
     REMBG_AVAILABLE = False
 
-NHL_API = "https://api-web.nhle.com"
+NHL_API = NHL_API_BASE
 HEADSHOT_CDN = "https://assets.nhle.com/mugs/nhl"
 IMAGE_SIZE = 168
 WEBP_QUALITY = 80
 
-# Get project root (4 levels up from this file)
-PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
-HEADSHOTS_DIR = PROJECT_ROOT / "static" / "headshots"
-
 
 def get_existing_headshots() -> Set[int]:
     """Get set of player IDs that already have WebP headshots."""
@@ -61,7 +64,7 @@ def get_headshot_bytes(player_id: int, team: str, headshot_url: Optional[str] =
     # Try pre-computed URL first (fastest)
     if headshot_url:
         try:
-            resp = requests.get(headshot_url, timeout=10)
+            resp = http_get(headshot_url, timeout=10)
             resp.raise_for_status()
             return resp.content
         except Exception:
@@ -69,12 +72,12 @@ def get_headshot_bytes(player_id: int, team: str, headshot_url: Optional[str] =
     
     # Try player landing page
     try:
-        resp = requests.get(f"{NHL_API}/v1/player/{player_id}/landing", timeout=10)
+        resp = http_get(f"{NHL_API}/v1/player/{player_id}/landing", timeout=10)
         resp.raise_for_status()
         data = resp.json()
         url = data.get("headshot")
         if url:
-            resp = requests.get(url, timeout=10)
+            resp = http_get(url, timeout=10)
             resp.raise_for_status()
             return resp.content
     except Exception:
@@ -84,7 +87,7 @@ def get_headshot_bytes(player_id: int, team: str, headshot_url: Optional[str] =
     for season in ["20252026", "current"]:
         try:
             url = f"{HEADSHOT_CDN}/{season}/{team}/{player_id}.png"
-            resp = requests.get(url, timeout=10)
+            resp = http_get(url, timeout=10)
             resp.raise_for_status()
             return resp.content
         except Exception:
@@ -0,0 +1,173 @@
+"""
+Per-endpoint request metrics for NHL data collection.
+
+Every request made through utils.http_get and every fetch_json outcome is
+counted per endpoint family (schedule, boxscore, ...): requests, latency
+histogram, bytes received, retries, 429s, cache hits and failures. Entry
+points turn these into a JSON run report plus a human summary at exit (see
+utils.start_run_report).
+"""
+
+import threading
+
+from config import METRICS_LATENCY_BUCKETS_MS
+
+# fetch_json outcomes tracked per family (see utils.FetchResult)
+OUTCOMES = ("fetched", "unchanged", "not_modified", "cached", "coalesced", "failed", "skipped")
+
+
+class EndpointMetrics:
+    """Counters and latency histogram for one endpoint family."""
+
+    def __init__(self, buckets_ms=None):
+        self.buckets_ms = tuple(buckets_ms or METRICS_LATENCY_BUCKETS_MS)
+        self.requests = 0
+        self.errors = 0  # requests that raised (timeouts, connection errors)
+        self.throttled = 0  # 429 responses
+        self.server_errors = 0  # 5xx responses
+        self.retries = 0
+        self.bytes = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self.rate_limit_wait = 0.0
+        self.histogram = [0] * (len(self.buckets_ms) + 1)  # last bucket = overflow
+        self.outcomes = dict.fromkeys(OUTCOMES, 0)
+
+    def observe(self, seconds, size, status_code):
+        self.requests += 1
+        self.bytes += size
+        self.latency_total += seconds
+        self.latency_max = max(self.latency_max, seconds)
+        ms = seconds * 1000
+        for i, bound in enumerate(self.buckets_ms):
+            if ms <= bound:
+                self.histogram[i] += 1
+                break
+        else:
+            self.histogram[-1] += 1
+        if status_code is None:
+            self.errors += 1
+        elif status_code == 429:
+            self.throttled += 1
+        elif status_code >= 500:
+            self.server_errors += 1
+
+    def percentile(self, fraction):
+        """
+        Estimate a latency percentile from the histogram.
+
+        Returns:
+            Upper bound of the bucket holding the percentile, in milliseconds
+            (None when there were no requests or it falls in the overflow bucket)
+        """
+        if not self.requests:
+            return None
+        threshold = fraction * self.requests
+        seen = 0
+        for i, count in enumerate(self.histogram[:-1]):
+            seen += count
+            if seen >= threshold:
+                return self.buckets_ms[i]
+        return None
+
+    def snapshot(self):
+        histogram = {f"<={bound}ms": count for bound, count in zip(self.buckets_ms, self.histogram)}
+        histogram[f">{self.buckets_ms[-1]}ms"] = self.histogram[-1]
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "throttled_429": self.throttled,
+            "server_errors_5xx": self.server_errors,
+            "errors": self.errors,
+            "bytes": self.bytes,
+            "latency_seconds_total": round(self.latency_total, 3),
+            "latency_ms_mean": round(self.latency_total * 1000 / self.requests, 1) if self.requests else None,
+            "latency_ms_p50": self.percentile(0.5),
+            "latency_ms_p95": self.percentile(0.95),
+            "latency_ms_max": round(self.latency_max * 1000, 1),
+            "latency_histogram": histogram,
+            "rate_limit_wait_seconds": round(self.rate_limit_wait, 3),
+            "outcomes": dict(self.outcomes),
+        }
+
+
+class Metrics:
+    """Thread-safe registry of per-family endpoint metrics."""
+
+    def __init__(self):
+        self._families = {}
+        self._lock = threading.Lock()
+
+    def _family(self, family):
+        metrics = self._families.get(family)
+        if metrics is None:
+            metrics = self._families[family] = EndpointMetrics()
+        return metrics
+
+    def record_request(self, family, seconds, size, status_code):
+        """Record one HTTP request (status_code None if it raised)."""
+        with self._lock:
+            self._family(family).observe(seconds, size, status_code)
+
+    def record_retry(self, family):
+        with self._lock:
+            self._family(family).retries += 1
+
+    def record_wait(self, family, seconds):
+        """Record time spent waiting for the rate limiter."""
+        with self._lock:
+            self._family(family).rate_limit_wait += seconds
+
+    def record_outcome(self, family, outcome):
+        """Record how a fetch_json call was answered (see OUTCOMES)."""
+        with self._lock:
+            self._family(family).outcomes[outcome] += 1
+
+    def reset(self):
+        with self._lock:
+            self._families.clear()
+
+    def snapshot(self):
+        """Return per-family metrics plus a "total" row."""
+        with self._lock:
+            families = {name: m.snapshot() for name, m in sorted(self._families.items())}
+        total = {
+            key: sum(f[key] for f in families.values())
+            for key in ("requests", "retries", "throttled_429", "server_errors_5xx", "errors", "bytes")
+        }
+        total["latency_seconds_total"] = round(sum(f["latency_seconds_total"] for f in families.values()), 3)
+        total["rate_limit_wait_seconds"] = round(sum(f["rate_limit_wait_seconds"] for f in families.values()), 3)
+        total["outcomes"] = {o: sum(f["outcomes"][o] for f in families.values()) for o in OUTCOMES}
+        return {"endpoints": families, "total": total}
+
+    def format_summary(self):
+        """Format per-family metrics as a fixed-width table."""
+        snapshot = self.snapshot()
+        lines = [
+            f"{'Endpoint':<15}{'Reqs':>6}{'Cached':>8}{'Shared':>8}{'304':>6}{'Retry':>7}{'429':>5}{'Err':>5}"
+            f"{'MB':>8}{'p50':>8}{'p95':>8}{'Net s':>8}{'Wait s':>8}"
+        ]
+
+        def ms(value):
+            return f"{value}ms" if value is not None else "-"
+
+        rows = list(snapshot["endpoints"].items()) + [("total", snapshot["total"])]
+        for name, m in rows:
+            errors = m["errors"] + m["server_errors_5xx"]
+            lines.append(
+                f"{name:<15}{m['requests']:>6}{m['outcomes']['cached']:>8}{m['outcomes']['coalesced']:>8}"
+                f"{m['outcomes']['not_modified']:>6}{m['retries']:>7}{m['throttled_429']:>5}{errors:>5}"
+                f"{m['bytes'] / (1024 * 1024):>8.2f}{ms(m.get('latency_ms_p50')):>8}"
+                f"{ms(m.get('latency_ms_p95')):>8}{m['latency_seconds_total']:>8.1f}"
+                f"{m['rate_limit_wait_seconds']:>8.1f}"
+            )
+        return "\n".join(lines)
+
+
+# Process-wide metrics shared by every fetcher
+_metrics = Metrics()
+
+
+def get_metrics():
+    """Get the process-wide endpoint metrics."""
+    return _metrics
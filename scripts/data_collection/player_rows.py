@@ -0,0 +1,255 @@
+"""
+Compact player-game rows shared by the all-player collectors.
+
+One PlayerGameRow per player per game, with __slots__ instead of a ~20-key
+dict, so season-scale runs hold far less memory per row. Rows are filled by
+one extractor per position kind (skater, goalie) and written back out in
+each collector's existing JSON format by row_to_dict() / dump_json().
+
+Usage:
+    rows = extract_player_rows(boxscore, game_id, home_team, away_team, date_str)
+    with open(path, "w", encoding="utf-8") as f:
+        dump_json(data, f, SEASON_SCHEMA)
+"""
+
+import json
+from json.encoder import encode_basestring, encode_basestring_ascii
+from operator import attrgetter
+
+PLAYER_CATEGORIES = ("forwards", "defense", "goalies")
+
+# Stat fields, in season file key order. Skaters have no goalie stats and
+# goalies no skater stats (those fields stay None, or 0 where the season
+# file always carried them).
+STAT_FIELDS = (
+    "goals", "assists", "points", "shots", "plusMinus", "pim", "timeOnIce",
+    "saves", "savePct", "shotsAgainst", "goalsAgainst",
+    "hits", "blockedShots", "takeaways", "giveaways", "powerPlayGoals",
+)
+IDENTITY_FIELDS = ("playerId", "name", "team", "position", "isGoalie", "gameId", "gameDate")
+
+
+def _pct(value):
+    return round(value, 3) if value else 0.0
+
+
+class PlayerGameRow:
+    """One player's line in one game (fields outside its schema are None)."""
+
+    __slots__ = IDENTITY_FIELDS + STAT_FIELDS
+
+    def __repr__(self):
+        return f"PlayerGameRow({self.playerId}, {self.name!r}, {self.team}, game {self.gameId})"
+
+    def __getitem__(self, key):
+        """Dict-style read access, for code written against the dict rows."""
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+
+# =============================================================================
+# Extraction
+# =============================================================================
+def _new_row(player, team, game_id, game_date, goalie):
+    row = object.__new__(PlayerGameRow)
+    row.playerId = player.get("playerId")
+    row.name = player.get("name", {}).get("default", "").strip()
+    row.team = team
+    row.position = player.get("position", "N/A")
+    row.isGoalie = goalie
+    row.gameId = game_id
+    row.gameDate = game_date
+    return row
+
+
+def _extract_skater(player, team, game_id, game_date):
+    """Row for a skater's boxscore line."""
+    get = player.get
+    row = _new_row(player, team, game_id, game_date, False)
+    row.goals = get("goals", 0)
+    row.assists = get("assists", 0)
+    row.points = get("points", 0)
+    row.shots = get("sog", 0)
+    row.plusMinus = get("plusMinus", 0)
+    row.pim = get("pim", 0)
+    row.timeOnIce = get("toi", "00:00")
+    row.saves = 0
+    row.savePct = 0.0
+    row.shotsAgainst = None
+    row.goalsAgainst = None
+    row.hits = get("hits", 0)
+    row.blockedShots = get("blockedShots", 0)
+    row.takeaways = get("takeaways", 0)
+    row.giveaways = get("giveaways", 0)
+    row.powerPlayGoals = get("powerPlayGoals", 0)
+    return row
+
+
+def _extract_goalie(player, team, game_id, game_date):
+    """Row for a goalie's boxscore line (goalie scoring is not in this structure)."""
+    get = player.get
+    row = _new_row(player, team, game_id, game_date, True)
+    row.goals = 0
+    row.assists = 0
+    row.points = 0
+    row.shots = 0
+    row.plusMinus = 0
+    row.pim = get("pim", 0)
+    row.timeOnIce = get("toi", "00:00")
+    row.saves = get("saves", 0)
+    row.savePct = _pct(get("savePctg", 0.0))
+    row.shotsAgainst = get("shotsAgainst", 0)
+    row.goalsAgainst = get("goalsAgainst", 0)
+    row.hits = None
+    row.blockedShots = None
+    row.takeaways = None
+    row.giveaways = None
+    row.powerPlayGoals = None
+    return row
+
+
+def iter_boxscore_players(game_data):
+    """
+    Yield (team side, player stats) for every player in a boxscore.
+
+    Away team first, then home; forwards, defense, goalies within each.
+    """
+    player_stats = (game_data or {}).get("playerByGameStats") or {}
+    for team_side in ("awayTeam", "homeTeam"):
+        team_stats = player_stats.get(team_side, {})
+        for category in PLAYER_CATEGORIES:
+            for player in team_stats.get(category, ()):
+                yield team_side, player
+
+
+def extract_player_rows(game_data, game_id, home_team, away_team, game_date):
+    """
+    Extract a row for every player in a boxscore.
+
+    Args:
+        game_data: Boxscore from the NHL API
+        game_id: Game ID
+        home_team: Home team abbreviation
+        away_team: Away team abbreviation
+        game_date: Date string stored on each row
+
+    Returns:
+        List of PlayerGameRow (away team first, as in the boxscore)
+    """
+    teams = {"awayTeam": away_team, "homeTeam": home_team}
+    rows = []
+    append = rows.append
+    for team_side, player in iter_boxscore_players(game_data):
+        extract = _extract_goalie if player.get("position") == "G" else _extract_skater
+        append(extract(player, teams[team_side], game_id, game_date))
+    return rows
+
+
+# =============================================================================
+# Serialization
+# =============================================================================
+class RowSchema:
+    """JSON key order for skater and goalie rows in one output format."""
+
+    def __init__(self, skater_keys, goalie_keys):
+        self.skater_keys = tuple(skater_keys)
+        self.goalie_keys = tuple(goalie_keys)
+        self._skater_values = attrgetter(*self.skater_keys)
+        self._goalie_values = attrgetter(*self.goalie_keys)
+
+    def keys(self, row):
+        return self.goalie_keys if row.isGoalie else self.skater_keys
+
+    def values(self, row):
+        return self._goalie_values(row) if row.isGoalie else self._skater_values(row)
+
+    def to_dict(self, row):
+        return dict(zip(self.keys(row), self.values(row)))
+
+
+_COMMON_KEYS = ("playerId", "name", "team", "position", "goals", "assists", "points", "shots",
+                "plusMinus", "pim", "timeOnIce", "isGoalie", "saves", "savePct")
+
+# season/fetch_season_games.py output
+SEASON_SCHEMA = RowSchema(
+    _COMMON_KEYS + ("hits", "blockedShots", "takeaways", "giveaways", "powerPlayGoals", "gameId", "gameDate"),
+    _COMMON_KEYS + ("shotsAgainst", "goalsAgainst", "gameId", "gameDate"),
+)
+
+# python_utils/expand_games.py output
+EXPANDED_SCHEMA = RowSchema(
+    _COMMON_KEYS + ("gameId", "gameDate"),
+    _COMMON_KEYS + ("gameId", "gameDate"),
+)
+
+
+def row_to_dict(row, schema=SEASON_SCHEMA):
+    """Convert a row to a dict in the schema's key order."""
+    return schema.to_dict(row)
+
+
+class _RowWriter:
+    """Formats rows as the exact text json.dump(indent=...) gives their dicts."""
+
+    def __init__(self, schema, indent, level, ensure_ascii):
+        string = encode_basestring_ascii if ensure_ascii else encode_basestring
+        self.encoders = {
+            str: string,
+            int: int.__repr__,
+            float: float.__repr__,
+            bool: lambda value: "true" if value else "false",
+            type(None): lambda value: "null",
+        }
+        self.schema = schema
+        self.prefixes = {}
+        for keys in (schema.skater_keys, schema.goalie_keys):
+            self.prefixes[keys] = [f"{string(key)}: " for key in keys]
+        field_pad = "\n" + " " * (indent * (level + 1))
+        self.open = "{" + field_pad
+        self.separator = "," + field_pad
+        self.close = "\n" + " " * (indent * level) + "}"
+
+    def format(self, row):
+        encoders = self.encoders
+        prefixes = self.prefixes[self.schema.keys(row)]
+        fields = [
+            prefix + (encoders.get(type(value)) or json.dumps)(value)
+            for prefix, value in zip(prefixes, self.schema.values(row))
+        ]
+        return self.open + self.separator.join(fields) + self.close
+
+
+def dump_json(data, fp, schema=SEASON_SCHEMA, indent=2, ensure_ascii=False):
+    """
+    Write a dict like json.dump(data, fp, indent=indent) would.
+
+    Top-level lists of PlayerGameRow are written row by row in the schema's
+    key order, without building a dict per row; everything else goes
+    through json. The output is byte-identical to dumping the rows as dicts.
+
+    Args:
+        data: Dict to write (e.g. a season file with a "players" row list)
+        fp: Text file to write to
+        schema: RowSchema for the rows (SEASON_SCHEMA or EXPANDED_SCHEMA)
+        indent: Indentation width
+        ensure_ascii: Escape non-ASCII characters
+    """
+    if not data:
+        fp.write("{}")
+        return
+    pad = " " * indent
+    writer = _RowWriter(schema, indent, 2, ensure_ascii)
+    item_pad = "\n" + pad * 2
+    for i, (key, value) in enumerate(data.items()):
+        fp.write(("{" if i == 0 else ",") + "\n" + pad + json.dumps(key, ensure_ascii=ensure_ascii) + ": ")
+        if isinstance(value, list) and value and isinstance(value[0], PlayerGameRow):
+            fp.write("[")
+            for j, row in enumerate(value):
+                fp.write(("" if j == 0 else ",") + item_pad + writer.format(row))
+            fp.write("\n" + pad + "]")
+        else:
+            text = json.dumps(value, indent=indent, ensure_ascii=ensure_ascii)
+            fp.write(text.replace("\n", "\n" + pad))
+    fp.write("\n}")
@@ -0,0 +1,185 @@
+"""
+Token-bucket rate limiting for NHL data collection.
+
+Each host gets its own bucket with a burst capacity and an adaptive (AIMD)
+refill rate: the rate is cut multiplicatively whenever the host answers
+429 Too Many Requests and grows back additively after successful requests.
+Buckets are thread-safe and can be awaited from asyncio code as well.
+"""
+
+import asyncio
+import threading
+import time
+from urllib.parse import urlsplit
+
+from config import (
+    NHL_API_BASE,
+    RATE_LIMIT_PER_SECOND,
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_MIN_RATE,
+    RATE_LIMIT_BACKOFF_FACTOR,
+    RATE_LIMIT_RECOVERY_STEP,
+    NOMINATIM_BASE,
+    NOMINATIM_RATE_LIMIT,
+)
+
+
+def _host_of(url_or_host):
+    """Return the host name for a URL, a bare host, or None (NHL API host)."""
+    if not url_or_host:
+        url_or_host = NHL_API_BASE
+    if "://" in url_or_host:
+        return urlsplit(url_or_host).hostname or url_or_host
+    return url_or_host
+
+
+class TokenBucket:
+    """Thread-safe token bucket with an AIMD-adjusted refill rate."""
+
+    def __init__(self, rate, burst, min_rate=None, backoff_factor=None, recovery_step=None):
+        """
+        Args:
+            rate: Maximum sustained requests per second
+            burst: Number of requests allowed back-to-back
+            min_rate: Lowest rate reached by repeated backoffs
+            backoff_factor: Multiplier applied to the rate on a 429
+            recovery_step: Requests/second regained per successful request
+        """
+        self.max_rate = float(rate)
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self.min_rate = min(self.max_rate, RATE_LIMIT_MIN_RATE if min_rate is None else min_rate)
+        self.backoff_factor = RATE_LIMIT_BACKOFF_FACTOR if backoff_factor is None else backoff_factor
+        self.recovery_step = RATE_LIMIT_RECOVERY_STEP if recovery_step is None else recovery_step
+
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+        self.requests = 0
+        self.throttled = 0
+        self.waited_seconds = 0.0
+
+    def _refill(self, now):
+        elapsed = now - self._updated
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def reserve(self):
+        """
+        Take one token without blocking.
+
+        Returns:
+            Seconds the caller must wait before sending its request
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            self.requests += 1
+            delay = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+            self.waited_seconds += delay
+            return delay
+
+    def acquire(self):
+        """Block the calling thread until a token is available."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self):
+        """Wait (without blocking the event loop) until a token is available."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def on_throttled(self):
+        """Multiplicative decrease after a 429 response."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = max(self.min_rate, self.rate * self.backoff_factor)
+            self._tokens = min(self._tokens, 0.0)
+            self.throttled += 1
+
+    def on_success(self):
+        """Additive increase after a successful response."""
+        with self._lock:
+            if self.rate < self.max_rate:
+                self._refill(time.monotonic())
+                self.rate = min(self.max_rate, self.rate + self.recovery_step)
+
+    def stats(self):
+        """Return a snapshot of this bucket's state and counters."""
+        with self._lock:
+            return {
+                "rate": round(self.rate, 3),
+                "max_rate": self.max_rate,
+                "burst": self.burst,
+                "requests": self.requests,
+                "throttled": self.throttled,
+                "waited_seconds": round(self.waited_seconds, 3),
+            }
+
+
+class RateLimiter:
+    """Registry of per-host token buckets."""
+
+    def __init__(self, rate=None, burst=None, host_limits=None):
+        """
+        Args:
+            rate: Default requests per second for hosts without an explicit limit
+            burst: Default burst capacity
+            host_limits: Dict mapping host -> (rate, burst)
+        """
+        self.rate = RATE_LIMIT_PER_SECOND if rate is None else rate
+        self.burst = RATE_LIMIT_BURST if burst is None else burst
+        self.host_limits = dict(host_limits or {})
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, url_or_host=None):
+        """Get (creating if needed) the bucket for a URL or host."""
+        host = _host_of(url_or_host)
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(host)
+                if bucket is None:
+                    rate, burst = self.host_limits.get(host, (self.rate, self.burst))
+                    bucket = TokenBucket(rate, burst)
+                    self._buckets[host] = bucket
+        return bucket
+
+    def acquire(self, url_or_host=None):
+        """Block until the host's bucket grants a request."""
+        return self.bucket(url_or_host).acquire()
+
+    async def acquire_async(self, url_or_host=None):
+        """Await until the host's bucket grants a request."""
+        return await self.bucket(url_or_host).acquire_async()
+
+    def on_throttled(self, url_or_host=None):
+        """Report a 429 from the host."""
+        self.bucket(url_or_host).on_throttled()
+
+    def on_success(self, url_or_host=None):
+        """Report a successful response from the host."""
+        self.bucket(url_or_host).on_success()
+
+    def stats(self):
+        """Return per-host bucket statistics."""
+        with self._lock:
+            buckets = dict(self._buckets)
+        return {host: bucket.stats() for host, bucket in sorted(buckets.items())}
+
+
+# Process-wide limiter shared by every fetcher
+_limiter = RateLimiter(host_limits={
+    _host_of(NOMINATIM_BASE): (NOMINATIM_RATE_LIMIT, 1),
+})
+
+
+def get_rate_limiter():
+    """Get the process-wide rate limiter."""
+    return _limiter
@@ -18,8 +18,14 @@ sys.path.insert(0, str(scripts_dir / "finnish"))
 
 # Import from existing modules
 try:
-    from finnish.fetch import generate_finnish_players_data
-    from utils import fetch_from_api, schedule_url, save_json
+    from finnish.fetch import (
+        write_finnish_players_data, load_finnish_player_cache,
+        build_team_roster_index, game_source_hash,
+    )
+    from utils import (
+        fetch_from_api, load_json, schedule_url,
+        reset_failures, get_skipped_requests, start_run_report,
+    )
     from config import GAMES_DIR
     from generate_manifest import generate_manifest
 except ImportError as e:
@@ -37,7 +43,7 @@ def check_for_live_games(date_str, near_hours=2):
     Returns:
         bool: True if live or near-starting games are found, False otherwise.
     """
-    schedule = fetch_from_api(schedule_url(date_str))
+    schedule = fetch_from_api(schedule_url(date_str), use_cache=False)
     if not schedule:
         return False
     
@@ -85,16 +91,68 @@ def check_for_live_games(date_str, near_hours=2):
     
     return False
 
+def has_game_changes(date_str):
+    """
+    Check whether the daily file for the date is out of date.
+
+    Compares the schedule (fetched fresh, bypassing the response cache)
+    against the file on disk rather than against what the last poll saw, so
+    an update that failed or was interrupted is retried on the next poll.
+    A game counts as changed when it has started but is missing from the
+    file, or its sourceHash (state, score, period, tracked players) no
+    longer matches. Live games with Finnish players always count as changed,
+    since their stats move between schedule updates.
+
+    Args:
+        date_str: Date to check (YYYY-MM-DD)
+
+    Returns:
+        bool: True if the data file is missing or stale.
+    """
+    previous = load_json(GAMES_DIR / f"{date_str}.json")
+    if not previous:
+        return True
+
+    schedule = fetch_from_api(schedule_url(date_str), use_cache=False)
+    game_week = schedule.get("gameWeek", []) if schedule else []
+    if not game_week:
+        # Without a schedule a rebuild would only write an empty day
+        return False
+
+    finnish_cache = load_finnish_player_cache()
+    roster_index = build_team_roster_index(finnish_cache)
+    written = {game.get("gameId"): game for game in previous.get("games", [])}
+
+    for game in game_week[0].get("games", []):
+        state = game.get("gameState")
+        if state in ("FUT", "PRE"):
+            continue
+        summary = written.get(game.get("id"))
+        if summary is None:
+            return True
+        if state in ("LIVE", "CRIT") and any(
+            roster_index.get(game.get(side, {}).get("abbrev")) for side in ("awayTeam", "homeTeam")
+        ):
+            return True
+        if summary.get("sourceHash") != game_source_hash(game, finnish_cache, roster_index):
+            return True
+    return False
+
 def run_update(date_str):
     """
     Run the full data update for the specified date.
     """
     print(f"[{datetime.now().strftime('%H:%M:%S')}] Updating data for {date_str}...")
     try:
-        data = generate_finnish_players_data(date_str)
-        output_file = GAMES_DIR / f"{date_str}.json"
-        save_json(data, output_file)
+        # Same fresh schedule has_game_changes() compared against, not a cached one
+        data, output_file = write_finnish_players_data(date_str, sync_photos=False, incremental=True, use_cache=False)
+        if output_file is None:
+            print(f"[{datetime.now().strftime('%H:%M:%S')}] ⚠️ Schedule not fetched, existing file kept. Will retry next poll")
+            return
         print(f"[{datetime.now().strftime('%H:%M:%S')}] ✅ Update complete. Saved to {output_file}")
+        skipped = get_skipped_requests()
+        if skipped:
+            print(f"[{datetime.now().strftime('%H:%M:%S')}] ⚠️ {len(skipped)} request(s) skipped, will retry next poll")
         
         # Regenerate manifest to include the new/updated file
         generate_manifest()
@@ -109,6 +167,7 @@ def main():
     parser.add_argument("--force", action="store_true", help="Force update even if no live games are found")
     
     args = parser.parse_args()
+    start_run_report("realtime_poll")
     
     # Determine date (NHL "today" might be yesterday in some timezones, but we use server date)
     if args.date:
@@ -124,7 +183,10 @@ def main():
     
     if args.once:
         should_update = args.force or check_for_live_games(date_str)
-        if should_update:
+        if should_update and not args.force and not has_game_changes(date_str):
+            print(f"No changes since the last update for {date_str}. Skipping rewrite.")
+            should_update = False
+        elif should_update:
             run_update(date_str)
         else:
             print(f"No live or near games found for {date_str}. Skipping update.")
@@ -140,8 +202,14 @@ def main():
     
     try:
         while True:
-            if args.force or check_for_live_games(date_str):
+            reset_failures()  # every poll gets a fresh retry budget
+            if args.force:
                 run_update(date_str)
+            elif check_for_live_games(date_str):
+                if has_game_changes(date_str):
+                    run_update(date_str)
+                else:
+                    print(f"[{datetime.now().strftime('%H:%M:%S')}] No changes since last update. Skipping rewrite.")
             else:
                 print(f"[{datetime.now().strftime('%H:%M:%S')}] No live games. Waiting...")
             
@@ -0,0 +1,274 @@
+"""
+Persistent on-disk cache for NHL API responses.
+
+Responses are stored gzip-compressed, one file per URL, with freshness
+decided per endpoint family (see config.API_CACHE_TTLS): boxscores and
+play-by-play of official (OFF) games never change and are kept forever,
+FINAL ones are re-checked after minutes since the official payload and stat
+corrections come later, schedules expire after minutes, landing pages after
+hours. The cache is capped in size and evicts
+the least recently used entries first.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+from config import (
+    API_CACHE_ENABLED,
+    API_CACHE_DIR,
+    API_CACHE_MAX_BYTES,
+    API_CACHE_TTLS,
+)
+from endpoints import endpoint_family
+
+# Only OFF is official; FINAL is the provisional result before it
+OFFICIAL_GAME_STATE = "OFF"
+PROVISIONAL_GAME_STATE = "FINAL"
+_POLICY_TTL = object()  # sentinel: use cache_ttl() for the URL
+
+
+def cache_ttl(url, data):
+    """
+    Decide how long a response may be served from the cache.
+
+    Args:
+        url: Request URL
+        data: Parsed JSON response
+
+    Returns:
+        Seconds the response stays fresh, None to keep it forever,
+        or 0 if it should not be cached at all
+    """
+    family = endpoint_family(url)
+    if family in ("boxscore", "play-by-play"):
+        game_state = data.get("gameState") if isinstance(data, dict) else None
+        if game_state == PROVISIONAL_GAME_STATE:
+            return API_CACHE_TTLS.get("final-game", 0)
+        if game_state != OFFICIAL_GAME_STATE:
+            return API_CACHE_TTLS.get("live-game", 0)
+    return API_CACHE_TTLS.get(family, 0)
+
+
+class ResponseCache:
+    """Size-capped, LRU-evicted, gzip-compressed response cache."""
+
+    def __init__(self, cache_dir=None, max_bytes=None):
+        """
+        Args:
+            cache_dir: Directory for cache files (defaults to API_CACHE_DIR)
+            max_bytes: Size cap before LRU eviction (defaults to API_CACHE_MAX_BYTES)
+        """
+        self.cache_dir = Path(cache_dir or API_CACHE_DIR)
+        self.max_bytes = API_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        self._lock = threading.Lock()
+        self._index = None  # path -> (size, last_access), loaded lazily
+        self._total_bytes = 0
+        self.stats = {"hits": 0, "misses": 0, "revalidated": 0, "stores": 0, "evictions": 0}
+
+    # -------------------------------------------------------------------------
+    # Storage helpers
+    # -------------------------------------------------------------------------
+    def _path_for(self, url):
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        return self.cache_dir / digest[:2] / f"{digest}.json.gz"
+
+    def _load_index(self):
+        """Scan the cache directory once to learn entry sizes and ages."""
+        if self._index is not None:
+            return
+        self._index = {}
+        self._total_bytes = 0
+        if self.cache_dir.exists():
+            for path in self.cache_dir.glob("*/*.json.gz"):
+                try:
+                    st = path.stat()
+                except OSError:
+                    continue
+                self._index[path] = (st.st_size, st.st_mtime)
+                self._total_bytes += st.st_size
+
+    def _read(self, path):
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, EOFError, json.JSONDecodeError):
+            return None
+
+    def _evict(self):
+        """Drop least recently used entries until under the size cap."""
+        if self._total_bytes <= self.max_bytes:
+            return
+        target = self.max_bytes * 0.9
+        for path, (size, _) in sorted(self._index.items(), key=lambda item: item[1][1]):
+            if self._total_bytes <= target:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            del self._index[path]
+            self._total_bytes -= size
+            self.stats["evictions"] += 1
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+    def lookup(self, url):
+        """
+        Read the stored entry for a URL regardless of freshness.
+
+        Returns:
+            Entry dict with url, stored_at, expires_at, data and any stored
+            validators (etag, last_modified), or None
+        """
+        path = self._path_for(url)
+        entry = self._read(path) if path.exists() else None
+        if entry is None or entry.get("url") != url:
+            return None
+        return entry
+
+    def get(self, url):
+        """
+        Get a fresh cached response for a URL.
+
+        Returns:
+            Parsed JSON data, or None on a miss or when the entry has expired
+        """
+        return self.fresh_data(url, self.lookup(url))
+
+    def fresh_data(self, url, entry):
+        """
+        Count a lookup() result as a hit or miss and return its data if fresh.
+
+        Lets a caller that also wants the stale entry (for revalidation) read
+        the cache file once instead of calling get() and then lookup().
+
+        Returns:
+            Parsed JSON data, or None when the entry is missing or expired
+        """
+        now = time.time()
+        if entry is None or not self.is_fresh(entry, now):
+            with self._lock:
+                self.stats["misses"] += 1
+            return None
+
+        self.touch(url, now)
+        with self._lock:
+            self.stats["hits"] += 1
+        return entry["data"]
+
+    @staticmethod
+    def is_fresh(entry, now=None):
+        """Check whether an entry is still within its TTL."""
+        expires_at = entry.get("expires_at")
+        return expires_at is None or (now or time.time()) < expires_at
+
+    def touch(self, url, now=None):
+        """Mark an entry as recently used (for LRU eviction)."""
+        path = self._path_for(url)
+        now = now or time.time()
+        try:
+            os.utime(path, (now, now))
+        except OSError:
+            return
+        with self._lock:
+            if self._index is not None and path in self._index:
+                self._index[path] = (self._index[path][0], now)
+
+    def put(self, url, data, ttl=_POLICY_TTL, **extra):
+        """
+        Store a response if its endpoint policy allows caching.
+
+        Args:
+            url: Request URL
+            data: Parsed JSON response
+            ttl: Override for the policy TTL (seconds, None = forever, 0 = skip)
+            **extra: Additional metadata stored alongside the entry
+
+        Returns:
+            True if the response was stored
+        """
+        if ttl is _POLICY_TTL:
+            ttl = cache_ttl(url, data)
+        if ttl == 0:
+            return False
+
+        now = time.time()
+        entry = {
+            "url": url,
+            "stored_at": now,
+            "expires_at": None if ttl is None else now + ttl,
+            "data": data,
+        }
+        entry.update(extra)
+
+        path = self._path_for(url)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, path)
+            size = path.stat().st_size
+        except OSError as e:
+            print(f"Warning: Could not write cache entry for {url}: {e}")
+            return False
+
+        with self._lock:
+            self._load_index()
+            old_size = self._index.get(path, (0, 0))[0]
+            self._index[path] = (size, now)
+            self._total_bytes += size - old_size
+            self.stats["stores"] += 1
+            self._evict()
+        return True
+
+    def revalidate(self, url, entry):
+        """
+        Refresh a stale entry after the server confirmed it (HTTP 304).
+
+        The payload and validators are kept; only the freshness window restarts.
+        """
+        extra = {key: entry[key] for key in ("etag", "last_modified") if entry.get(key)}
+        self.put(url, entry["data"], **extra)
+        with self._lock:
+            self.stats["revalidated"] += 1
+            self.stats["stores"] -= 1
+
+    def get_stats(self):
+        """Return hit/miss counters plus current size on disk."""
+        with self._lock:
+            self._load_index()
+            stats = dict(self.stats)
+            stats["entries"] = len(self._index)
+            stats["bytes"] = self._total_bytes
+        lookups = stats["hits"] + stats["misses"]
+        served = stats["hits"] + stats["revalidated"]
+        stats["hit_rate"] = round(served / lookups, 3) if lookups else 0.0
+        return stats
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache():
+    """
+    Get the process-wide response cache.
+
+    Returns:
+        ResponseCache instance, or None when caching is disabled (NHL_API_CACHE=0)
+    """
+    global _cache
+    if not API_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = ResponseCache()
+    return _cache
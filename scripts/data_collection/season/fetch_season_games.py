@@ -6,11 +6,19 @@ Fetches ALL games and player data for the current NHL season.
 This version gets complete game data for all players across the entire season.
 Usage: python fetch-season-games.py [start_date] [end_date]
 Date format: YYYY-MM-DD (defaults to current season)
+
+Finished games are streamed to NDJSON shards with a checkpoint
+(season_stream.py), so an interrupted run resumes from the last completed
+game; the season JSON file is assembled from the shards at the end.
+
+With --incremental the latest season file is updated in place: dates it
+already covers with final games are kept, and only new or unsettled dates
+are fetched.
 """
 
+import argparse
 import json
 import sys
-import time
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -20,203 +28,171 @@ _parent_dir = str(Path(__file__).parent.parent)
 if _parent_dir not in sys.path:
     sys.path.insert(0, _parent_dir)
 
-from config import SEASON_DIR, NHL_API_BASE
-from utils import fetch_from_api, rate_limit, save_json, schedule_url, game_boxscore_url
-
-def get_schedule_for_date(date):
-    """Get NHL schedule for a specific date"""
-    url = schedule_url(date)
-    data = fetch_from_api(url)
-    if not data:
-        return None
-
-    # Extract games from the nested gameWeek structure
-    game_week = data.get("gameWeek", [])
-    if game_week and len(game_week) > 0:
-        return {
-            "games": game_week[0].get("games", []),
-            "date": game_week[0].get("date", date)
-        }
-    return {"games": [], "date": date}
+from config import SEASON_DIR, NHL_API_BASE, SEASON_STORE_DIR
+from utils import (
+    fetch_from_api,
+    ensure_dir,
+    schedule_url,
+    game_boxscore_url,
+    get_skip_reason,
+    get_skipped_requests,
+    format_failure_stats,
+    start_run_report,
+)
+from cassette import add_cassette_arguments, apply_cassette_arguments, get_cassette
+from player_rows import extract_player_rows
+from season_stream import SeasonStream
+from season_store import NUMPY_AVAILABLE, SeasonStoreBuilder
+
+def iter_schedule_days(start_date, end_date):
+    """
+    Walk the schedule one week per request.
+
+    /v1/schedule/{date} returns the whole week starting at that date, so
+    every day in the response is used and the walk continues from
+    nextStartDate. Games are deduped by id across weeks.
+
+    Args:
+        start_date: First date (YYYY-MM-DD)
+        end_date: Last date (YYYY-MM-DD)
+
+    Yields:
+        Tuple of (date string, list of schedule games, skip reason or None)
+        for every date from start to end, in order. A failed week yields its
+        dates with the skip reason.
+    """
+    cursor = datetime.strptime(start_date, "%Y-%m-%d").date()
+    end = datetime.strptime(end_date, "%Y-%m-%d").date()
+    seen_ids = set()
+
+    while cursor <= end:
+        url = schedule_url(cursor.isoformat())
+        data = fetch_from_api(url)
+        week_end = min(cursor + timedelta(days=6), end)
+
+        if not data:
+            reason = get_skip_reason(url) or "fetch failed"
+            while cursor <= week_end:
+                yield cursor.isoformat(), [], reason
+                cursor += timedelta(days=1)
+            continue
+
+        games_by_day = {day.get("date"): day.get("games", []) for day in data.get("gameWeek", [])}
+        next_start = data.get("nextStartDate")
+        if next_start:
+            next_start = datetime.strptime(next_start, "%Y-%m-%d").date()
+            if next_start > cursor:
+                week_end = min(next_start - timedelta(days=1), end)
+
+        while cursor <= week_end:
+            games = []
+            for game in games_by_day.get(cursor.isoformat(), []):
+                if game.get("id") not in seen_ids:
+                    seen_ids.add(game.get("id"))
+                    games.append(game)
+            yield cursor.isoformat(), games, None
+            cursor += timedelta(days=1)
+
+# A date's games are all final this many days after it (late West Coast
+# games end after midnight UTC; unplayed games are not in the season file)
+SETTLED_AFTER_DAYS = 2
+
+def find_latest_season_file():
+    """Newest season-*.json in SEASON_DIR, or None."""
+    season_files = sorted(SEASON_DIR.glob("season-*.json"), reverse=True)
+    return season_files[0] if season_files else None
+
+def settled_dates(season_data):
+    """
+    Dates of a season file that do not need fetching again.
+
+    A date is settled when it is inside the file's date range, its schedule
+    was fetched, every recorded game on it is final (OFF) and it lies at
+    least SETTLED_AFTER_DAYS before the file was generated.
+
+    Args:
+        season_data: Season file dict
+
+    Returns:
+        Set of date strings (YYYY-MM-DD)
+    """
+    date_range = season_data.get("date_range", {})
+    generated_at = season_data.get("generated_at")
+    if not date_range.get("start") or not date_range.get("end") or not generated_at:
+        return set()
+
+    start = datetime.strptime(date_range["start"], "%Y-%m-%d").date()
+    generated = datetime.fromisoformat(generated_at).date()
+    end = min(datetime.strptime(date_range["end"], "%Y-%m-%d").date(),
+              generated - timedelta(days=SETTLED_AFTER_DAYS))
+
+    unsettled = {item["date"] for item in season_data.get("skipped_dates", [])}
+    for game in season_data.get("games", []):
+        if game.get("error") or game.get("gameState") != "OFF":
+            unsettled.add(game.get("gameDate"))
+
+    dates = set()
+    day = start
+    while day <= end:
+        if day.isoformat() not in unsettled:
+            dates.add(day.isoformat())
+        day += timedelta(days=1)
+    return dates
 
 def get_game_details(game_id):
     """Get detailed game information including player stats"""
     url = game_boxscore_url(game_id)
     return fetch_from_api(url)
 
-def extract_all_player_data(game_data, game_id, home_team, away_team, game_date):
-    """Extract all player data from game"""
-    players = []
-
-    if not game_data:
-        return players
-
-    # Get player stats from the correct API structure
-    player_stats = game_data.get("playerByGameStats", {})
-    if not player_stats:
-        return players
-
-    # Process away team players (forwards, defense, goalies)
-    away_stats = player_stats.get("awayTeam", {})
-    for player_category in ["forwards", "defense", "goalies"]:
-        for player in away_stats.get(player_category, []):
-            player_id = player.get("playerId")
-            name = player.get("name", {}).get("default", "")
-            position = player.get("position", "N/A")
-
-            # Extract stats based on position
-            if position == "G":
-                # Goalie stats
-                saves = player.get("saves", 0)
-                shots_against = player.get("shotsAgainst", 0)
-                save_pct = player.get("savePctg", 0.0)
-                goals_against = player.get("goalsAgainst", 0)
-
-                players.append({
-                    "playerId": player_id,
-                    "name": name.strip(),
-                    "team": away_team,
-                    "position": position,
-                    "goals": 0,  # Goalies don't score in this structure
-                    "assists": 0,  # Goalies don't get assists in this structure
-                    "points": 0,
-                    "shots": 0,
-                    "plusMinus": 0,
-                    "pim": player.get("pim", 0),
-                    "timeOnIce": player.get("toi", "00:00"),
-                    "isGoalie": True,
-                    "saves": saves,
-                    "savePct": round(save_pct, 3) if save_pct else 0.0,
-                    "shotsAgainst": shots_against,
-                    "goalsAgainst": goals_against,
-                    "gameId": game_id,
-                    "gameDate": game_date
-                })
-            else:
-                # Skater stats (forwards and defense)
-                players.append({
-                    "playerId": player_id,
-                    "name": name.strip(),
-                    "team": away_team,
-                    "position": position,
-                    "goals": player.get("goals", 0),
-                    "assists": player.get("assists", 0),
-                    "points": player.get("points", 0),
-                    "shots": player.get("sog", 0),
-                    "plusMinus": player.get("plusMinus", 0),
-                    "pim": player.get("pim", 0),
-                    "timeOnIce": player.get("toi", "00:00"),
-                    "isGoalie": False,
-                    "saves": 0,
-                    "savePct": 0.0,
-                    "hits": player.get("hits", 0),
-                    "blockedShots": player.get("blockedShots", 0),
-                    "takeaways": player.get("takeaways", 0),
-                    "giveaways": player.get("giveaways", 0),
-                    "powerPlayGoals": player.get("powerPlayGoals", 0),
-                    "gameId": game_id,
-                    "gameDate": game_date
-                })
-
-    # Process home team players (forwards, defense, goalies)
-    home_stats = player_stats.get("homeTeam", {})
-    for player_category in ["forwards", "defense", "goalies"]:
-        for player in home_stats.get(player_category, []):
-            player_id = player.get("playerId")
-            name = player.get("name", {}).get("default", "")
-            position = player.get("position", "N/A")
-
-            # Extract stats based on position
-            if position == "G":
-                # Goalie stats
-                saves = player.get("saves", 0)
-                shots_against = player.get("shotsAgainst", 0)
-                save_pct = player.get("savePctg", 0.0)
-                goals_against = player.get("goalsAgainst", 0)
-
-                players.append({
-                    "playerId": player_id,
-                    "name": name.strip(),
-                    "team": home_team,
-                    "position": position,
-                    "goals": 0,  # Goalies don't score in this structure
-                    "assists": 0,  # Goalies don't get assists in this structure
-                    "points": 0,
-                    "shots": 0,
-                    "plusMinus": 0,
-                    "pim": player.get("pim", 0),
-                    "timeOnIce": player.get("toi", "00:00"),
-                    "isGoalie": True,
-                    "saves": saves,
-                    "savePct": round(save_pct, 3) if save_pct else 0.0,
-                    "shotsAgainst": shots_against,
-                    "goalsAgainst": goals_against,
-                    "gameId": game_id,
-                    "gameDate": game_date
-                })
-            else:
-                # Skater stats (forwards and defense)
-                players.append({
-                    "playerId": player_id,
-                    "name": name.strip(),
-                    "team": home_team,
-                    "position": position,
-                    "goals": player.get("goals", 0),
-                    "assists": player.get("assists", 0),
-                    "points": player.get("points", 0),
-                    "shots": player.get("sog", 0),
-                    "plusMinus": player.get("plusMinus", 0),
-                    "pim": player.get("pim", 0),
-                    "timeOnIce": player.get("toi", "00:00"),
-                    "isGoalie": False,
-                    "saves": 0,
-                    "savePct": 0.0,
-                    "hits": player.get("hits", 0),
-                    "blockedShots": player.get("blockedShots", 0),
-                    "takeaways": player.get("takeaways", 0),
-                    "giveaways": player.get("giveaways", 0),
-                    "powerPlayGoals": player.get("powerPlayGoals", 0),
-                    "gameId": game_id,
-                    "gameDate": game_date
-                })
+def generate_season_data(start_date, end_date, stream):
+    """
+    Fetch all games in a date range into a SeasonStream.
 
-    return players
+    Each finished game is appended to the stream as soon as it is fetched and
+    each date is checkpointed when done, so only the current game is held in
+    memory. Dates the stream already completed are not fetched again, nor are
+    games already written for the date being resumed.
 
-def generate_season_data(start_date, end_date):
-    """Generate comprehensive data for all games in a date range"""
+    Args:
+        start_date: First date (YYYY-MM-DD)
+        end_date: Last date (YYYY-MM-DD)
+        stream: SeasonStream for this range
+    """
 
     start = datetime.strptime(start_date, "%Y-%m-%d")
     end = datetime.strptime(end_date, "%Y-%m-%d")
-
-    all_games = []
-    all_players = []
     total_days = (end - start).days + 1
-    current_day = 0
 
     print(f"Fetching season data from {start_date} to {end_date}")
     print(f"Total days to process: {total_days}")
-    print()
 
-    current_date = start
-    while current_date <= end:
-        current_day += 1
-        date_str = current_date.strftime("%Y-%m-%d")
+    all_dates = [(start + timedelta(days=n)).strftime("%Y-%m-%d") for n in range(total_days)]
+    resume_date = stream.resume_date(all_dates)
+    if resume_date is None:
+        print(f"All dates already fetched ({stream.path})")
+        print()
+        return
+    first_day = all_dates.index(resume_date)
+    if first_day or stream.cursor:
+        print(f"Resuming at {resume_date} ({first_day} dates already done, {stream.path})")
+    print()
 
+    for current_day, (date_str, games, skip_reason) in enumerate(iter_schedule_days(resume_date, end_date), first_day + 1):
+        if date_str in stream.completed_dates:
+            continue
         print(f"[{current_day:3d}/{total_days}] Processing {date_str}...")
 
-        # Get schedule for the date
-        schedule = get_schedule_for_date(date_str)
-        if not schedule:
-            current_date += timedelta(days=1)
+        if skip_reason:
+            stream.complete_date(date_str, skip_reason)
             continue
 
-        games = schedule.get("games", [])
         if not games:
             print(f"   No games scheduled")
-            current_date += timedelta(days=1)
+            stream.complete_date(date_str)
             continue
 
         print(f"   Found {len(games)} games")
+        written_ids = stream.written_game_ids(date_str)
 
         for i, game in enumerate(games, 1):
             game_id = game.get("id")
@@ -224,6 +200,10 @@ def generate_season_data(start_date, end_date):
             away_team = game.get("awayTeam", {}).get("abbrev", "UNK")
             game_state = game.get("gameState", "UNKNOWN")
 
+            if game_id in written_ids:
+                print(f"   Game {i}/{len(games)}: {away_team} @ {home_team} - Already fetched")
+                continue
+
             # Skip games that haven't been played yet (FUT = future, PRE = preseason)
             # OFF/FINAL = game is over and finished (this is what we want!)
             # CRIT = overtime/shootout - only accept if period > 3
@@ -256,8 +236,7 @@ def generate_season_data(start_date, end_date):
                         continue
 
                 # Extract all player data
-                players = extract_all_player_data(game_details, game_id, home_team, away_team, date_str)
-                all_players.extend(players)
+                players = extract_player_rows(game_details, game_id, home_team, away_team, date_str)
 
                 # Add game summary
                 home_score = game_details.get("homeTeam", {}).get("score", 0)
@@ -269,7 +248,7 @@ def generate_season_data(start_date, end_date):
                 is_so = pd.get("periodType") == "SO"
                 period = pd.get("number", 3)
 
-                all_games.append({
+                stream.append_game(date_str, {
                     "gameId": game_id,
                     "gameDate": date_str,
                     "homeTeam": home_team,
@@ -283,18 +262,18 @@ def generate_season_data(start_date, end_date):
                     "isSO": is_so,
                     "period": period,
                     "players_count": len(players)
-                })
+                }, players)
 
                 # Show top performers from this game
-                scorers = sorted([p for p in players if p["points"] > 0],
-                               key=lambda x: x["points"], reverse=True)[:3]
+                scorers = sorted([p for p in players if p.points > 0],
+                               key=lambda x: x.points, reverse=True)[:3]
                 if scorers:
-                    scorer_names = [f"{p['name']} ({p['points']}pts)" for p in scorers]
+                    scorer_names = [f"{p.name} ({p.points}pts)" for p in scorers]
                     print(f"      Top scorers: {', '.join(scorer_names)}")
 
             else:
                 print(f"      Failed to get details for game {game_id}")
-                all_games.append({
+                stream.append_game(date_str, {
                     "gameId": game_id,
                     "gameDate": date_str,
                     "homeTeam": home_team,
@@ -305,41 +284,32 @@ def generate_season_data(start_date, end_date):
                     "gameType": game.get("gameType", 2),
                     "startTime": game.get("startTimeUTC", ""),
                     "players_count": 0,
-                    "error": True
-                })
-
-            # Rate limiting between games
-            rate_limit(1.0)
-
-        current_date += timedelta(days=1)
-
-        # Rate limiting between days
-        rate_limit(2.0)
-
-    return {
-        "season": "2025-26",
-        "date_range": {
-            "start": start_date,
-            "end": end_date
-        },
-        "games": all_games,
-        "players": all_players,
-        "total_games": len([g for g in all_games if not g.get("error")]),
-        "total_players": len(all_players),
-        "generated_at": datetime.now().isoformat()
-    }
+                    "error": True,
+                    "reason": get_skip_reason(game_boxscore_url(game_id)) or "fetch failed"
+                }, [])
+
+        stream.complete_date(date_str)
 
 def main():
     # Get dates from command line or use defaults
-    if len(sys.argv) >= 2:
-        start_date = sys.argv[1]
-    else:
-        start_date = "2025-10-01"  # Approximate start of 2025-26 season
-
-    if len(sys.argv) >= 3:
-        end_date = sys.argv[2]
-    else:
-        end_date = datetime.now().strftime("%Y-%m-%d")
+    parser = argparse.ArgumentParser(description="Fetch all NHL games for a date range")
+    parser.add_argument("start_date", nargs="?", default="2025-10-01",  # Approximate start of 2025-26 season
+                        help="First date (YYYY-MM-DD)")
+    parser.add_argument("end_date", nargs="?", default=datetime.now().strftime("%Y-%m-%d"),
+                        help="Last date (YYYY-MM-DD, default: today)")
+    parser.add_argument("--restart", action="store_true",
+                        help="Discard shards and checkpoint of an earlier run for this range")
+    parser.add_argument("--no-finalize", action="store_true",
+                        help="Only write the NDJSON shards; a later run finalizes them")
+    parser.add_argument("--stream-dir", type=Path, default=None,
+                        help="Directory for NDJSON shards (default: SEASON_STREAM_DIR)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Update the latest season file: fetch only dates it lacks or that were not final")
+    add_cassette_arguments(parser)
+    args = parser.parse_args()
+    apply_cassette_arguments(args)
+    start_run_report("fetch_season_games")
+    start_date, end_date = args.start_date, args.end_date
 
     # Validate date formats
     try:
@@ -350,34 +320,64 @@ def main():
         sys.exit(1)
 
     print(f"Fetching ALL NHL games data for 2025-26 season...")
-    data = generate_season_data(start_date, end_date)
-
-    # Save using shared utilities
+    season_file = find_latest_season_file() if args.incremental else None
+    season_data = None
+    if season_file:
+        with open(season_file, encoding="utf-8") as f:
+            season_data = json.load(f)
+        start_date = min(start_date, season_data["date_range"]["start"])
+        end_date = max(end_date, season_data["date_range"]["end"])
+    elif args.incremental:
+        print(f"No season file in {SEASON_DIR}, fetching the full range")
+
+    stream = SeasonStream(start_date, end_date, root=args.stream_dir, restart=args.restart)
+    if season_data is not None:
+        kept_dates = settled_dates(season_data)
+        stream.import_dates(season_data, kept_dates - stream.completed_dates)
+        print(f"📂 Updating {season_file.name}: {len(kept_dates)} settled dates kept")
+        del season_data
+    generate_season_data(start_date, end_date, stream)
+
+    if args.no_finalize:
+        print(f"\n✅ Streamed season data:")
+        print(f"   🏒 Games: {stream.game_count()}")
+        print(f"   📁 Shards in: {stream.path}")
+        return
+
+    # Assemble the season file from the shards, one game at a time
+    # (an incremental run replaces the file it started from)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    output_file = SEASON_DIR / f"season-2025-26-{timestamp}.json"
-    save_json(data, output_file)
+    output_file = season_file or SEASON_DIR / f"season-2025-26-{timestamp}.json"
+    ensure_dir(output_file.parent)
+    # The columnar store (season_store.py) is filled in the same pass
+    builder = SeasonStoreBuilder() if NUMPY_AVAILABLE else None
+    summary = stream.finalize(output_file, on_row=builder.add if builder else None)
+    stream.remove()
+    store = builder.build() if builder else None
+    if store is not None:
+        store.save(SEASON_STORE_DIR)
 
     print(f"\n✅ Generated season data:")
-    print(f"   📅 Period: {data['date_range']['start']} to {data['date_range']['end']}")
-    print(f"   🏒 Games: {data['total_games']}")
-    print(f"   👥 Players: {data['total_players']}")
+    print(f"   📅 Period: {start_date} to {end_date}")
+    print(f"   🏒 Games: {summary['total_games']}")
+    print(f"   👥 Players: {summary['total_players']}")
     print(f"   📁 Saved to: {output_file}")
+    if store is not None:
+        print(f"   📦 Columnar store: {SEASON_STORE_DIR}")
+    if get_cassette() is not None:
+        print(f"   📼 {get_cassette().summary()}")
+    if get_skipped_requests():
+        print(f"   ⚠️  {format_failure_stats()}")
+        for item in get_skipped_requests():
+            print(f"      - {item['url']}: {item['reason']}")
 
     # Print some statistics
-    if data["games"]:
-        # Top scorers in season
-        season_scorers = sorted(data["players"],
-                              key=lambda x: x["points"], reverse=True)[:10]
-
-        # Games by team
-        team_games = {}
-        for game in data["games"]:
-            if not game.get("error"):
-                team_games[game["homeTeam"]] = team_games.get(game["homeTeam"], 0) + 1
-                team_games[game["awayTeam"]] = team_games.get(game["awayTeam"], 0) + 1
+    if summary["games"]:
+        top_scorers = store.top_rows("points", 10) if store is not None else summary["top_scorers"]
+        team_games = store.games_by_team() if store is not None else summary["team_games"]
 
         print(f"\n🌟 Season Top 10 Scorers:")
-        for i, player in enumerate(season_scorers, 1):
+        for i, player in enumerate(top_scorers, 1):
             print(f"   {i:2d}. {player['name']} ({player['team']}) - {player['points']} pts")
 
         print(f"\n📊 Games Played by Team:")
@@ -7,57 +7,27 @@ Prefers using local daily game data to avoid API calls.
 
 import json
 import sys
-import time
-import requests
 from pathlib import Path
 from datetime import datetime
 
-# NHL API Base
-NHL_API_BASE = "https://api-web.nhle.com"
+# Add parent directory to path for imports
+_parent_dir = str(Path(__file__).parent.parent)
+if _parent_dir not in sys.path:
+    sys.path.insert(0, _parent_dir)
 
-# Project paths
-BASE_DIR = Path(__file__).parent.parent.parent.parent
-GAMES_DIR = BASE_DIR / "static/data/prepopulated/games"
-SEASON_DIR = BASE_DIR / "static/data/prepopulated/season"
-
-def fetch_from_api(url, max_retries=2):
-    for attempt in range(max_retries):
-        try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            if attempt == max_retries - 1:
-                print(f"Error fetching {url}: {e}")
-                return None
-            time.sleep(2)
-    return None
+from config import GAMES_DIR, SEASON_DIR
+from game_store import get_game_store
+from utils import fetch_from_api, game_boxscore_url
 
 def load_daily_game_map():
-    """Build a map of gameId -> {isOT, isSO, period} from daily files"""
-    game_map = {}
+    """Build a map of gameId -> {isOT, isSO, period} from the daily games (game store)"""
     if not GAMES_DIR.exists():
         print(f"⚠️ Games directory {GAMES_DIR} not found")
-        return game_map
+        return {}
+
+    print(f"🔍 Querying the game store for game info...")
+    game_map = get_game_store().game_periods()
 
-    json_files = list(GAMES_DIR.glob("*.json"))
-    print(f"🔍 Scanning {len(json_files)} daily files for game info...")
-    
-    for file_path in json_files:
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                for game in data.get("games", []):
-                    game_id = game.get("gameId")
-                    if game_id and "isOT" in game and "period" in game:
-                        game_map[game_id] = {
-                            "isOT": game.get("isOT"),
-                            "isSO": game.get("isSO"),
-                            "period": game.get("period")
-                        }
-        except:
-            continue
-            
     print(f"✅ Found detail info for {len(game_map)} games in local files")
     return game_map
 
@@ -97,8 +67,7 @@ def repair_season_file(file_path):
         else:
             # Fallback to API
             print(f"  🏒 Fetching details for game {game_id} ({game.get('awayTeam')} @ {game.get('homeTeam')})...")
-            url = f"{NHL_API_BASE}/v1/gamecenter/{game_id}/boxscore"
-            details = fetch_from_api(url)
+            details = fetch_from_api(game_boxscore_url(game_id), max_retries=2)
             
             if details:
                 pd = details.get("periodDescriptor", {})
@@ -112,7 +81,6 @@ def repair_season_file(file_path):
                 updated_count += 1
                 api_count += 1
                 print(f"    ✅ API Update: period={period}, isOT={is_ot}, isSO={is_so}")
-                time.sleep(0.5) # Modest rate limiting
             else:
                 print(f"    ❌ Failed to fetch details for game {game_id}")
 
@@ -0,0 +1,294 @@
+"""
+Streaming output for full-season generation.
+
+Each finished game is appended as one NDJSON line ({"game": summary,
+"players": [rows]}) to a per-date shard under SEASON_STREAM_DIR, and a
+checkpoint records which dates are complete plus the last written game. A
+crashed or interrupted run resumes from the last completed game, and memory
+no longer grows with the season: finalize() assembles the season JSON file
+from the shards one game at a time, byte-identical to json.dump(indent=2)
+of the in-memory dict.
+
+Layout:
+    .cache/season-stream/{start}_{end}/
+        checkpoint.json
+        2025-10-07.ndjson
+        ...
+"""
+
+import json
+import os
+import shutil
+from datetime import datetime
+from pathlib import Path
+
+from config import JSON_ENSURE_ASCII, JSON_INDENT, SEASON_STREAM_DIR
+from player_rows import SEASON_SCHEMA
+
+SEASON_STREAM_FORMAT = 1
+TOP_SCORERS = 10
+
+
+def _atomic_write_json(path, payload):
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+class SeasonStream:
+    """NDJSON shards plus checkpoint for one season date range."""
+
+    def __init__(self, start_date, end_date, root=None, restart=False):
+        """
+        Args:
+            start_date: First date of the range (YYYY-MM-DD)
+            end_date: Last date of the range (YYYY-MM-DD)
+            root: Directory holding streams (defaults to SEASON_STREAM_DIR)
+            restart: Discard anything already written for this range
+        """
+        self.start_date = start_date
+        self.end_date = end_date
+        self.path = Path(root or SEASON_STREAM_DIR) / f"{start_date}_{end_date}"
+        if restart and self.path.exists():
+            shutil.rmtree(self.path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.checkpoint_file = self.path / "checkpoint.json"
+
+        self.completed_dates = set()
+        self.skipped_dates = {}  # date -> reason
+        self.cursor = None
+        if self.checkpoint_file.exists():
+            try:
+                with open(self.checkpoint_file, encoding="utf-8") as f:
+                    checkpoint = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                checkpoint = {}
+            if checkpoint.get("format") == SEASON_STREAM_FORMAT:
+                self.completed_dates = set(checkpoint.get("completed_dates", []))
+                self.skipped_dates = {d["date"]: d["reason"] for d in checkpoint.get("skipped_dates", [])}
+                self.cursor = checkpoint.get("cursor")
+
+    # -------------------------------------------------------------------------
+    # Writing
+    # -------------------------------------------------------------------------
+    def _shard(self, date_str):
+        return self.path / f"{date_str}.ndjson"
+
+    def _save_checkpoint(self):
+        _atomic_write_json(self.checkpoint_file, {
+            "format": SEASON_STREAM_FORMAT,
+            "start": self.start_date,
+            "end": self.end_date,
+            "cursor": self.cursor,
+            "completed_dates": sorted(self.completed_dates),
+            "skipped_dates": [{"date": d, "reason": r} for d, r in sorted(self.skipped_dates.items())],
+            "updated_at": datetime.now().isoformat(),
+        })
+
+    def written_game_ids(self, date_str):
+        """
+        IDs of the games already in a date's shard.
+
+        A line cut short by a crash is dropped from the shard, so that game
+        is fetched again.
+        """
+        shard = self._shard(date_str)
+        if not shard.exists():
+            return set()
+        game_ids = set()
+        valid_bytes = 0
+        with open(shard, "rb") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    break
+                if not line.endswith(b"\n"):
+                    break
+                game_ids.add(record["game"]["gameId"])
+                valid_bytes += len(line)
+        if valid_bytes != shard.stat().st_size:
+            with open(shard, "r+b") as f:
+                f.truncate(valid_bytes)
+        return game_ids
+
+    def append_game(self, date_str, summary, rows):
+        """Append a finished game and its player rows, then move the cursor."""
+        record = {"game": summary, "players": [SEASON_SCHEMA.to_dict(row) for row in rows]}
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+        with open(self._shard(date_str), "a", encoding="utf-8") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+        self.cursor = {"date": date_str, "gameId": summary["gameId"]}
+        self._save_checkpoint()
+
+    def complete_date(self, date_str, skip_reason=None):
+        """Mark a date done (skip_reason: its schedule could not be fetched)."""
+        self.skipped_dates.pop(date_str, None)
+        if skip_reason:
+            self.skipped_dates[date_str] = skip_reason
+        self.completed_dates.add(date_str)
+        self.cursor = {"date": date_str, "gameId": None}
+        self._save_checkpoint()
+
+    def import_dates(self, season_data, dates):
+        """
+        Copy the games and player rows of some dates from an existing season file.
+
+        Each date's shard is rewritten from season_data and the date marked
+        complete, so calling this again after an interruption is safe.
+
+        Args:
+            season_data: Season file dict (games, players, ...)
+            dates: Dates to copy (YYYY-MM-DD)
+        """
+        dates = set(dates)
+        if not dates:
+            return
+        rows_by_game = {}
+        for row in season_data.get("players", []):
+            if row.get("gameDate") in dates:
+                rows_by_game.setdefault(row.get("gameId"), []).append(row)
+        lines_by_date = {date_str: [] for date_str in dates}
+        for game in season_data.get("games", []):
+            if game.get("gameDate") in dates:
+                record = {"game": game, "players": rows_by_game.get(game.get("gameId"), [])}
+                lines_by_date[game["gameDate"]].append(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+        for date_str, lines in lines_by_date.items():
+            shard = self._shard(date_str)
+            if lines:
+                with open(shard, "w", encoding="utf-8") as f:
+                    f.writelines(lines)
+            elif shard.exists():
+                shard.unlink()
+            self.skipped_dates.pop(date_str, None)
+            self.completed_dates.add(date_str)
+        self._save_checkpoint()
+
+    def remove(self):
+        """Delete the shards and checkpoint (after a successful finalize)."""
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    # -------------------------------------------------------------------------
+    # Reading
+    # -------------------------------------------------------------------------
+    def resume_date(self, dates):
+        """First date in the given (ordered) dates that is not complete, or None."""
+        for date_str in dates:
+            if date_str not in self.completed_dates:
+                return date_str
+        return None
+
+    def records(self):
+        """Yield (game summary, player row dicts) for every written game, in date order."""
+        for shard in sorted(self.path.glob("*.ndjson")):
+            with open(shard, encoding="utf-8") as f:
+                for line in f:
+                    if line.endswith("\n"):
+                        record = json.loads(line)
+                        yield record["game"], record["players"]
+
+    def game_count(self):
+        return sum(1 for _ in self.records())
+
+    # -------------------------------------------------------------------------
+    # Finalize
+    # -------------------------------------------------------------------------
+    def finalize(self, output_file, season="2025-26", on_row=None):
+        """
+        Assemble the season JSON file from the shards (atomic replace).
+
+        Writes the shape generate_season_data() used to build in memory,
+        with JSON_INDENT/JSON_ENSURE_ASCII, holding one game at a time.
+
+        Args:
+            output_file: Season JSON file to write
+            season: Season label
+            on_row: Optional callable given each player row dict as written
+
+        Returns:
+            Summary dict: games (including failed ones), total_games,
+            total_players, top_scorers, team_games
+        """
+        output_file = Path(output_file)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        summary = {"games": 0, "total_games": 0, "total_players": 0, "top_scorers": [], "team_games": {}}
+
+        def games():
+            for game, _ in self.records():
+                summary["games"] += 1
+                if not game.get("error"):
+                    summary["total_games"] += 1
+                    for team in (game["homeTeam"], game["awayTeam"]):
+                        summary["team_games"][team] = summary["team_games"].get(team, 0) + 1
+                yield game
+
+        def players():
+            top = summary["top_scorers"]
+            for _, rows in self.records():
+                for row in rows:
+                    summary["total_players"] += 1
+                    if on_row is not None:
+                        on_row(row)
+                    # Stable like sorted(..., reverse=True)[:10]: earlier rows win ties
+                    if len(top) < TOP_SCORERS or row["points"] > top[-1]["points"]:
+                        i = len(top)
+                        while i > 0 and top[i - 1]["points"] < row["points"]:
+                            i -= 1
+                        top.insert(i, row)
+                        del top[TOP_SCORERS:]
+                    yield row
+
+        items = [
+            ("season", season),
+            ("date_range", {"start": self.start_date, "end": self.end_date}),
+            ("games", _Streamed(games())),
+            ("players", _Streamed(players())),
+            ("total_games", lambda: summary["total_games"]),
+            ("total_players", lambda: summary["total_players"]),
+            ("generated_at", datetime.now().isoformat()),
+        ]
+        # Only present when a schedule could not be fetched, so a re-run knows what to retry
+        if self.skipped_dates:
+            items.append(("skipped_dates", [{"date": d, "reason": r} for d, r in sorted(self.skipped_dates.items())]))
+
+        tmp_path = output_file.with_name(f"{output_file.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            write_json_object(f, items, indent=JSON_INDENT, ensure_ascii=JSON_ENSURE_ASCII)
+        os.replace(tmp_path, output_file)
+        return summary
+
+
+class _Streamed:
+    """A list value written item by item from an iterator."""
+
+    def __init__(self, items):
+        self.items = items
+
+
+def write_json_object(fp, items, indent=2, ensure_ascii=False):
+    """
+    Write (key, value) pairs as a JSON object, like json.dump(dict(items), indent=indent).
+
+    A _Streamed value is written one item at a time; a callable value is
+    called when its key is reached (for totals counted while streaming).
+    """
+    pad = " " * indent
+
+    def dumps(value, level):
+        return json.dumps(value, indent=indent, ensure_ascii=ensure_ascii).replace("\n", "\n" + pad * level)
+
+    fp.write("{")
+    for i, (key, value) in enumerate(items):
+        fp.write(("" if i == 0 else ",") + "\n" + pad + json.dumps(key, ensure_ascii=ensure_ascii) + ": ")
+        if isinstance(value, _Streamed):
+            empty = True
+            for item in value.items:
+                fp.write(("[" if empty else ",") + "\n" + pad * 2 + dumps(item, 2))
+                empty = False
+            fp.write("[]" if empty else "\n" + pad + "]")
+        else:
+            fp.write(dumps(value() if callable(value) else value, 1))
+    fp.write("\n}" if items else "}")
@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+Columnar season store for player-game stats.
+
+Holds one row per player per game as typed NumPy arrays (ids, dates, stats,
+time on ice in seconds, goalie stats), with team, name and position
+dictionary-encoded into small integer codes. Leaderboards and group-by
+counts are vectorized, so league-wide queries over a full season take
+milliseconds instead of sorting lists of dicts.
+
+The store is saved as one .npy file per column plus vocab.json, and loaded
+memory-mapped:
+    .cache/season-store/
+        meta.json
+        vocab.json
+        playerId.npy, gameId.npy, gameDate.npy, points.npy, ...
+
+NumPy is optional: NUMPY_AVAILABLE is False when it is not installed, and
+callers keep their plain Python code path.
+
+Usage:
+    python season_store.py                          # latest season file
+    python season_store.py path/to/season.json --column goals --top 20
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from array import array
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+from config import SEASON_DIR, SEASON_STORE_DIR
+
+SEASON_STORE_FORMAT = 1
+
+# Numeric columns: (row field, array typecode). Fields a row's kind does
+# not have (goalie stats on skaters and vice versa) are stored as 0.
+NUMERIC_COLUMNS = (
+    ("playerId", "q"),
+    ("gameId", "q"),
+    ("goals", "h"),
+    ("assists", "h"),
+    ("points", "h"),
+    ("shots", "h"),
+    ("plusMinus", "h"),
+    ("pim", "h"),
+    ("hits", "h"),
+    ("blockedShots", "h"),
+    ("takeaways", "h"),
+    ("giveaways", "h"),
+    ("powerPlayGoals", "h"),
+    ("saves", "h"),
+    ("shotsAgainst", "h"),
+    ("goalsAgainst", "h"),
+    ("savePct", "f"),
+)
+
+# Dictionary-encoded string columns: (row field, code typecode)
+ENCODED_COLUMNS = (
+    ("team", "h"),
+    ("name", "i"),
+    ("position", "b"),
+)
+
+
+def _field(row, key):
+    """Read a field from a PlayerGameRow or a season file row dict."""
+    return row.get(key) if isinstance(row, dict) else getattr(row, key)
+
+
+def toi_seconds(toi):
+    """Convert "MM:SS" time on ice to seconds (0 when missing)."""
+    try:
+        minutes, seconds = toi.split(":")
+        return int(minutes) * 60 + int(seconds)
+    except (AttributeError, ValueError):
+        return 0
+
+
+class SeasonStoreBuilder:
+    """Accumulates rows into typed buffers; build() returns a SeasonStore."""
+
+    def __init__(self):
+        self.numeric = {field: array(typecode) for field, typecode in NUMERIC_COLUMNS}
+        self.codes = {field: array(typecode) for field, typecode in ENCODED_COLUMNS}
+        self.vocab = {field: {} for field, _ in ENCODED_COLUMNS}
+        self.toi = array("i")
+        self.is_goalie = array("b")
+        self.date_codes = array("i")
+        self.dates = {}
+
+    def add(self, row):
+        """Add one PlayerGameRow or row dict."""
+        for field, values in self.numeric.items():
+            values.append(_field(row, field) or 0)
+        for field, codes in self.codes.items():
+            vocab = self.vocab[field]
+            value = _field(row, field) or ""
+            code = vocab.get(value)
+            if code is None:
+                code = vocab[value] = len(vocab)
+            codes.append(code)
+        self.toi.append(toi_seconds(_field(row, "timeOnIce")))
+        self.is_goalie.append(bool(_field(row, "isGoalie")))
+        date = _field(row, "gameDate")
+        code = self.dates.get(date)
+        if code is None:
+            code = self.dates[date] = len(self.dates)
+        self.date_codes.append(code)
+
+    def build(self):
+        columns = {field: np.frombuffer(values, dtype=values.typecode) for field, values in self.numeric.items()}
+        columns.update({field: np.frombuffer(codes, dtype=codes.typecode) for field, codes in self.codes.items()})
+        columns["toiSeconds"] = np.frombuffer(self.toi, dtype=np.int32)
+        columns["isGoalie"] = np.frombuffer(self.is_goalie, dtype=np.int8).astype(bool)
+        dates = np.array(list(self.dates), dtype="datetime64[D]")
+        columns["gameDate"] = dates[np.frombuffer(self.date_codes, dtype=np.int32)] if len(dates) else dates
+        vocab = {field: list(values) for field, values in self.vocab.items()}
+        return SeasonStore(columns, vocab)
+
+
+class SeasonStore:
+    """Player-game stats as NumPy columns with vectorized queries."""
+
+    def __init__(self, columns, vocab):
+        """
+        Args:
+            columns: Column name -> 1-D array, all the same length
+            vocab: Encoded column name -> list of values (index = code)
+        """
+        self.columns = columns
+        self.vocab = vocab
+
+    def __len__(self):
+        return len(self.columns["playerId"])
+
+    def __getitem__(self, column):
+        return self.columns[column]
+
+    # -------------------------------------------------------------------------
+    # Construction and persistence
+    # -------------------------------------------------------------------------
+    @classmethod
+    def from_rows(cls, rows):
+        """Build a store from PlayerGameRow objects or season file row dicts."""
+        builder = SeasonStoreBuilder()
+        for row in rows:
+            builder.add(row)
+        return builder.build()
+
+    @classmethod
+    def from_season_file(cls, path):
+        """Build a store from the players of a season JSON file."""
+        with open(path, encoding="utf-8") as f:
+            return cls.from_rows(json.load(f).get("players", []))
+
+    def save(self, directory=None):
+        """
+        Write one .npy per column plus vocab.json and meta.json.
+
+        meta.json is replaced last, so a reader never sees a half-written store
+        as complete.
+        """
+        directory = Path(directory or SEASON_STORE_DIR)
+        directory.mkdir(parents=True, exist_ok=True)
+        for name, values in self.columns.items():
+            np.save(directory / f"{name}.npy", np.ascontiguousarray(values))
+        with open(directory / "vocab.json", "w", encoding="utf-8") as f:
+            json.dump(self.vocab, f, ensure_ascii=False)
+        meta = {
+            "format": SEASON_STORE_FORMAT,
+            "rows": len(self),
+            "columns": list(self.columns),
+            "saved_at": datetime.now().isoformat(),
+        }
+        tmp_path = directory / f"meta.json.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2)
+        os.replace(tmp_path, directory / "meta.json")
+
+    @classmethod
+    def load(cls, directory=None, mmap=True):
+        """
+        Load a saved store, memory-mapping the columns by default.
+
+        Returns:
+            SeasonStore, or None when no complete store of this format exists
+        """
+        directory = Path(directory or SEASON_STORE_DIR)
+        try:
+            with open(directory / "meta.json", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(directory / "vocab.json", encoding="utf-8") as f:
+                vocab = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if meta.get("format") != SEASON_STORE_FORMAT:
+            return None
+        mode = "r" if mmap else None
+        columns = {name: np.load(directory / f"{name}.npy", mmap_mode=mode) for name in meta["columns"]}
+        return cls(columns, vocab)
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+    def decode(self, column, codes):
+        """Map codes of an encoded column back to their values."""
+        vocab = self.vocab[column]
+        return [vocab[code] for code in np.asarray(codes).tolist()]
+
+    def top_k(self, column, k=10, mask=None):
+        """
+        Row indices of the k largest values of a column.
+
+        Ties keep row order, like sorted(rows, key=..., reverse=True)[:k].
+
+        Args:
+            column: Column name
+            k: Number of rows
+            mask: Optional boolean array restricting the rows considered
+        """
+        values = np.asarray(self.columns[column])
+        candidates = np.arange(len(values)) if mask is None else np.flatnonzero(mask)
+        if k < len(candidates):
+            subset = values[candidates]
+            threshold = np.partition(subset, len(subset) - k)[len(subset) - k]
+            candidates = candidates[subset >= threshold]
+        order = np.argsort(-values[candidates].astype(np.float64), kind="stable")
+        return candidates[order[:k]]
+
+    def top_rows(self, column="points", k=10, mask=None):
+        """Top-k rows as dicts with playerId, name, team, gameId, gameDate and the column."""
+        indices = self.top_k(column, k, mask)
+        names = self.decode("name", self.columns["name"][indices])
+        teams = self.decode("team", self.columns["team"][indices])
+        return [
+            {
+                "playerId": int(self.columns["playerId"][i]),
+                "name": name,
+                "team": team,
+                "gameId": int(self.columns["gameId"][i]),
+                "gameDate": str(self.columns["gameDate"][i]),
+                column: self.columns[column][i].item(),
+            }
+            for i, name, team in zip(indices.tolist(), names, teams)
+        ]
+
+    def group_sum(self, column, by="playerId"):
+        """
+        Sum a column per distinct value of another.
+
+        Returns:
+            Tuple of (sorted group keys, sums as int64 or float64)
+        """
+        keys, inverse = np.unique(np.asarray(self.columns[by]), return_inverse=True)
+        values = np.asarray(self.columns[column])
+        sums = np.bincount(inverse, weights=values, minlength=len(keys))
+        if np.issubdtype(values.dtype, np.integer) or values.dtype == bool:
+            sums = sums.astype(np.int64)
+        return keys, sums
+
+    def leaders(self, column="points", k=10):
+        """
+        Season leaders: per-player totals of a column, largest first.
+
+        Returns:
+            List of dicts: playerId, name, team (latest game), games, total
+        """
+        player_ids = np.asarray(self.columns["playerId"])
+        keys, inverse = np.unique(player_ids, return_inverse=True)
+        totals = np.bincount(inverse, weights=np.asarray(self.columns[column]), minlength=len(keys))
+        games = np.bincount(inverse, minlength=len(keys))
+        latest = np.zeros(len(keys), dtype=np.int64)
+        np.maximum.at(latest, inverse, np.arange(len(player_ids)))
+
+        top = np.argsort(-totals, kind="stable")[:k]
+        rows = latest[top]
+        names = self.decode("name", self.columns["name"][rows])
+        teams = self.decode("team", self.columns["team"][rows])
+        integer = np.issubdtype(np.asarray(self.columns[column]).dtype, np.integer)
+        return [
+            {
+                "playerId": int(keys[g]),
+                "name": name,
+                "team": team,
+                "games": int(games[g]),
+                "total": int(totals[g]) if integer else float(totals[g]),
+            }
+            for g, name, team in zip(top.tolist(), names, teams)
+        ]
+
+    def count_by(self, column="team"):
+        """Rows per value of an encoded column, in vocab (first seen) order."""
+        counts = np.bincount(np.asarray(self.columns[column]), minlength=len(self.vocab[column]))
+        return {value: int(count) for value, count in zip(self.vocab[column], counts.tolist()) if count}
+
+    def games_by_team(self):
+        """Games played per team (distinct games a team has player rows in)."""
+        teams = np.asarray(self.columns["team"]).astype(np.int64)
+        pairs = np.unique(np.asarray(self.columns["gameId"]) * len(self.vocab["team"]) + teams)
+        counts = np.bincount(pairs % len(self.vocab["team"]), minlength=len(self.vocab["team"]))
+        return {team: int(count) for team, count in zip(self.vocab["team"], counts.tolist()) if count}
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+def main():
+    parser = argparse.ArgumentParser(description="Build the columnar season store and print leaders")
+    parser.add_argument("season_file", nargs="?", type=Path, default=None,
+                        help="Season JSON file (default: newest season-*.json)")
+    parser.add_argument("--column", default="points", help="Stat to rank by (default: points)")
+    parser.add_argument("--top", type=int, default=10, help="Number of leaders (default: 10)")
+    parser.add_argument("--out", type=Path, default=None, help="Store directory (default: SEASON_STORE_DIR)")
+    args = parser.parse_args()
+
+    if not NUMPY_AVAILABLE:
+        print("❌ numpy is required. Install with: pip install numpy")
+        return 1
+
+    season_file = args.season_file
+    if season_file is None:
+        season_files = sorted(SEASON_DIR.glob("season-*.json"), reverse=True)
+        if not season_files:
+            print(f"❌ No season JSON files found in {SEASON_DIR}")
+            return 1
+        season_file = season_files[0]
+
+    started = time.perf_counter()
+    SeasonStore.from_season_file(season_file).save(args.out)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    store = SeasonStore.load(args.out)
+    started = time.perf_counter()
+    leaders = store.leaders(args.column, args.top)
+    query_ms = (time.perf_counter() - started) * 1000
+
+    print(f"📦 {len(store)} player-game rows from {season_file.name} ({build_ms:.0f} ms to build)")
+    print(f"\n🌟 Season leaders by {args.column} ({query_ms:.1f} ms):")
+    for i, leader in enumerate(leaders, 1):
+        print(f"   {i:2d}. {leader['name']} ({leader['team']}) - {leader['total']} in {leader['games']} games")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
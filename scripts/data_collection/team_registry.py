@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Season team registry.
+
+Holds every active team's ID, abbreviation, full/common/place names and
+home venue in TEAM_REGISTRY_FILE. It is built from the standings endpoint
+(active teams and names) plus the stats API team list (IDs), and rebuilt
+when the season of the dates being processed changes or after
+TEAM_REGISTRY_REFRESH_SECONDS. Home venues are filled at build time from the
+league schedule for the date, then one club schedule per team still
+missing; schedule entries the collectors fetch later keep them current.
+Lookups by abbreviation or team ID are dictionary reads with no network
+access.
+
+Usage:
+    python team_registry.py            # show the registry (building it if needed)
+    python team_registry.py --rebuild  # rebuild from the API now
+"""
+
+import argparse
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from datetime import date, datetime
+from pathlib import Path
+
+from config import TEAM_REGISTRY_FILE, TEAM_REGISTRY_REFRESH_SECONDS
+from utils import fetch_from_api, fetch_many, club_schedule_url, schedule_url, standings_url, stats_teams_url
+
+TEAM_REGISTRY_FORMAT = 1
+
+
+def season_for_date(day=None):
+    """Season ID (e.g. "20252026") a date (date or YYYY-MM-DD) belongs to; seasons roll over in July."""
+    if isinstance(day, str):
+        day = date.fromisoformat(day)
+    day = day or date.today()
+    start = day.year if day.month >= 7 else day.year - 1
+    return f"{start}{start + 1}"
+
+
+class TeamRegistry:
+    """Thread-safe team registry backed by a JSON file."""
+
+    def __init__(self, path=None, refresh_seconds=None):
+        """
+        Args:
+            path: Registry file (defaults to TEAM_REGISTRY_FILE)
+            refresh_seconds: Age after which the registry is rebuilt (defaults to TEAM_REGISTRY_REFRESH_SECONDS)
+        """
+        self.path = Path(path or TEAM_REGISTRY_FILE)
+        self.refresh_seconds = TEAM_REGISTRY_REFRESH_SECONDS if refresh_seconds is None else refresh_seconds
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.season = None
+        self.built_at = 0
+        self._teams = {}  # abbrev -> team dict
+        self._by_id = {}  # team ID -> abbrev
+        self._load()
+
+    # -------------------------------------------------------------------------
+    # Storage
+    # -------------------------------------------------------------------------
+    def _load(self):
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                registry = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        if registry.get("format") != TEAM_REGISTRY_FORMAT:
+            return
+        self.season = registry.get("season")
+        self.built_at = registry.get("built_at", 0)
+        self._set_teams(registry.get("teams", {}))
+
+    def _set_teams(self, teams):
+        self._teams = teams
+        self._by_id = {team["id"]: abbrev for abbrev, team in teams.items() if team.get("id") is not None}
+
+    def save(self):
+        """Write the registry to disk if it changed (atomic replace)."""
+        with self._lock:
+            if not self._dirty:
+                return False
+            registry = {
+                "format": TEAM_REGISTRY_FORMAT,
+                "season": self.season,
+                "built_at": self.built_at,
+                "teams": dict(sorted(self._teams.items())),
+            }
+            self._dirty = False
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(registry, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+        return True
+
+    # -------------------------------------------------------------------------
+    # Building
+    # -------------------------------------------------------------------------
+    def needs_rebuild(self, day=None):
+        """True when the registry is empty, from another season than the date's or too old."""
+        with self._lock:
+            return (
+                not self._teams
+                or self.season != season_for_date(day)
+                or time.time() - self.built_at >= self.refresh_seconds
+            )
+
+    def build(self, day=None):
+        """
+        Rebuild from the standings and stats team endpoints, then fill home venues.
+
+        Known home venues are kept. On failure the current registry is left
+        as it is.
+
+        Args:
+            day: Date (YYYY-MM-DD) whose season to build; defaults to today
+
+        Returns:
+            True if the registry was rebuilt
+        """
+        standings = fetch_from_api(standings_url(day or "now"))
+        if not standings or not standings.get("standings"):
+            print("Warning: Could not build team registry (standings unavailable)")
+            return False
+        stats_teams = fetch_from_api(stats_teams_url()) or {}
+        ids = {team.get("triCode"): team for team in stats_teams.get("data", []) if team.get("triCode")}
+
+        with self._lock:
+            teams = {}
+            for row in standings["standings"]:
+                abbrev = row.get("teamAbbrev", {}).get("default")
+                if not abbrev:
+                    continue
+                previous = self._teams.get(abbrev, {})
+                stats_team = ids.get(abbrev, {})
+                teams[abbrev] = {
+                    "id": stats_team.get("id", previous.get("id")),
+                    "abbrev": abbrev,
+                    "name": row.get("teamName", {}).get("default") or stats_team.get("fullName", ""),
+                    "common_name": row.get("teamCommonName", {}).get("default", ""),
+                    "place_name": row.get("placeName", {}).get("default", ""),
+                    "venue": previous.get("venue", ""),
+                    "venue_city": previous.get("venue_city", ""),
+                }
+            self._set_teams(teams)
+            self.season = season_for_date(day)
+            self.built_at = int(time.time())
+            self._dirty = True
+        self.fill_venues(day)
+        return True
+
+    def fill_venues(self, day=None):
+        """
+        Learn missing home venues from the schedule.
+
+        The league schedule for the date's week covers most teams; each team
+        still missing a venue costs one club schedule request.
+        """
+        schedule = fetch_from_api(schedule_url(day or "now")) or {}
+        for game_day in schedule.get("gameWeek", []):
+            self.observe_games(game_day.get("games", []))
+
+        with self._lock:
+            missing = [abbrev for abbrev, team in self._teams.items() if not team["venue"]]
+            season = self.season
+        club_schedules = fetch_many([club_schedule_url(abbrev, season) for abbrev in missing])
+        for abbrev, club_schedule in zip(missing, club_schedules):
+            self.observe_games([
+                game for game in (club_schedule or {}).get("games", [])
+                if game.get("gameType") == 2 and game.get("homeTeam", {}).get("abbrev") == abbrev
+            ])
+
+    def observe_games(self, games):
+        """
+        Learn home venues from schedule entries or boxscores (no network).
+
+        Neutral-site games are ignored.
+        """
+        with self._lock:
+            for game in games:
+                if not game or game.get("neutralSite"):
+                    continue
+                home = game.get("homeTeam", {})
+                team = self._teams.get(home.get("abbrev"))
+                venue = game.get("venue", {}).get("default", "")
+                if team is None or not venue:
+                    continue
+                city = game.get("venueLocation", {}).get("default") or home.get("placeName", {}).get("default", "")
+                if (team["venue"], team["venue_city"]) != (venue, city or team["venue_city"]):
+                    team["venue"] = venue
+                    team["venue_city"] = city or team["venue_city"]
+                    self._dirty = True
+
+    # -------------------------------------------------------------------------
+    # Lookups
+    # -------------------------------------------------------------------------
+    def get(self, abbrev):
+        """Team dict for an abbreviation, or None (do not mutate)."""
+        return self._teams.get(abbrev)
+
+    def by_id(self, team_id):
+        """Team dict for a team ID, or None (do not mutate)."""
+        abbrev = self._by_id.get(team_id)
+        return self._teams.get(abbrev) if abbrev else None
+
+    def team_name(self, abbrev):
+        """Full team name (e.g. "Boston Bruins"), or the abbreviation if unknown."""
+        team = self._teams.get(abbrev)
+        return team["name"] if team and team.get("name") else abbrev
+
+    def venue(self, abbrev):
+        """Home venue as (venue name, city), or None if not known yet."""
+        team = self._teams.get(abbrev)
+        if team and team.get("venue"):
+            return team["venue"], team["venue_city"]
+        return None
+
+    def teams(self):
+        """All team dicts, sorted by abbreviation."""
+        with self._lock:
+            return [self._teams[abbrev] for abbrev in sorted(self._teams)]
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_team_registry(refresh=True, day=None):
+    """
+    Get the process-wide team registry.
+
+    Args:
+        refresh: Rebuild from the API first if the registry is missing,
+            from another season or older than TEAM_REGISTRY_REFRESH_SECONDS
+            (False = use whatever is on disk, never touch the network)
+        day: Date being processed (YYYY-MM-DD); picks the season (defaults to today)
+
+    The registry is saved automatically at exit.
+    """
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                registry = TeamRegistry()
+                atexit.register(registry.save)
+                _registry = registry
+    if refresh and _registry.needs_rebuild(day):
+        with _registry_lock:
+            if _registry.needs_rebuild(day):
+                _registry.build(day)
+    return _registry
+
+
+def format_team_registry_stats():
+    """Format the team registry state as a one-line summary."""
+    registry = get_team_registry(refresh=False)
+    teams = registry.teams()
+    venues = sum(1 for team in teams if team["venue"])
+    built = datetime.fromtimestamp(registry.built_at).strftime("%Y-%m-%d") if registry.built_at else "never"
+    return f"Teams: {len(teams)} for season {registry.season or '-'} ({venues} venues known, built {built})"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Season team registry")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild from the standings/teams endpoints now")
+    parser.add_argument("--date", help="Build for the season of this date (YYYY-MM-DD, default: today)")
+    args = parser.parse_args()
+
+    registry = get_team_registry(refresh=not args.rebuild, day=args.date)
+    if args.rebuild and not registry.build(args.date):
+        return 1
+    registry.save()
+
+    teams = registry.teams()
+    print(f"🏒 {len(teams)} teams for season {registry.season} in {registry.path}")
+    for team in teams:
+        venue = f"{team['venue']}, {team['venue_city']}" if team["venue"] else "venue not seen yet"
+        print(f"   {team['abbrev']:<4} {str(team['id']):>3}  {team['name']:<26} {venue}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,82 +4,464 @@ Shared utility functions for NHL data collection.
 Provides common API handling, rate limiting, file I/O, and data processing.
 """
 
+import atexit
+import io
 import json
+import sys
 import time
 import random
+import threading
+from collections import OrderedDict, namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
 
 from config import (
     NHL_API_BASE,
+    NHL_STATS_API_BASE,
     API_TIMEOUT,
     API_MAX_RETRIES,
-    RATE_LIMIT_DELAY,
     RATE_LIMIT_JITTER,
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    HTTP_POOL_BLOCK,
+    HTTP_KEEP_ALIVE,
+    FETCH_MAX_CONCURRENCY,
+    SINGLE_FLIGHT_MEMO_SECONDS,
+    SINGLE_FLIGHT_MEMO_SIZE,
     JSON_INDENT,
     JSON_ENSURE_ASCII,
+    RUN_REPORT_DIR,
 )
+from rate_limiter import get_rate_limiter
+from response_cache import get_response_cache
+from endpoints import endpoint_family
+from cassette import get_cassette, CassetteMiss
+from circuit_breaker import get_failure_registry
+from metrics import get_metrics
 
 
 # =============================================================================
 # Rate Limiting
 # =============================================================================
-_last_request_time = 0
+def rate_limit(url=None):
+    """
+    Wait for the rate limiter to grant a request.
+
+    Uses the shared per-host token bucket (see rate_limiter.py), so it is
+    safe to call from several threads at once.
 
+    Args:
+        url: Request URL or host name (defaults to the NHL API host)
 
-def rate_limit(delay=None):
+    Returns:
+        Seconds spent waiting (always 0 when replaying a cassette)
     """
-    Apply rate limiting between API requests.
+    cassette = get_cassette()
+    if cassette is not None and cassette.replaying:
+        return 0.0
+    waited = get_rate_limiter().acquire(url)
+    get_metrics().record_wait(endpoint_family(url or NHL_API_BASE), waited)
+    return waited
+
+
+# =============================================================================
+# HTTP Session (connection pooling)
+# =============================================================================
+_session = None
+_session_lock = threading.Lock()
+_connection_stats = {"requests": 0, "new_connections": 0}
+_connection_stats_lock = threading.Lock()
+
+
+def _count_connection(field):
+    with _connection_stats_lock:
+        _connection_stats[field] += 1
+
+
+class _CountingHTTPConnection(HTTPConnection):
+    """HTTP connection that records every socket it opens."""
+
+    def connect(self):
+        _count_connection("new_connections")
+        return super().connect()
+
+
+class _CountingHTTPSConnection(HTTPSConnection):
+    """HTTPS connection that records every TCP+TLS handshake it performs."""
+
+    def connect(self):
+        _count_connection("new_connections")
+        return super().connect()
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _CountingHTTPConnection
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _CountingHTTPSConnection
+
+
+class _PooledAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools count new connections."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+
+def get_session():
+    """
+    Get the process-wide pooled HTTP session.
+
+    All NHL API traffic goes through this session so that connections to
+    api-web.nhle.com are kept alive and reused instead of paying a new
+    TCP+TLS handshake for every request.
+
+    Returns:
+        Shared requests.Session instance
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                # Retries are handled by fetch_from_api, not by urllib3
+                adapter = _PooledAdapter(
+                    pool_connections=HTTP_POOL_CONNECTIONS,
+                    pool_maxsize=HTTP_POOL_MAXSIZE,
+                    pool_block=HTTP_POOL_BLOCK,
+                    max_retries=0,
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                if not HTTP_KEEP_ALIVE:
+                    session.headers["Connection"] = "close"
+                _session = session
+    return _session
+
+
+def http_get(url, timeout=None, headers=None):
+    """
+    Perform a GET request through the shared pooled session.
+
+    When a cassette is active (see cassette.py) the response is recorded
+    to it, or served from it without touching the network.
 
     Args:
-        delay: Minimum seconds between requests (defaults to RATE_LIMIT_DELAY)
+        url: Request URL
+        timeout: Request timeout in seconds (defaults to API_TIMEOUT)
+        headers: Optional extra request headers
+
+    Returns:
+        requests.Response (raises requests.RequestException on failure)
+    """
+    if timeout is None:
+        timeout = API_TIMEOUT
+
+    family = endpoint_family(url)
+    cassette = get_cassette()
+    started = time.monotonic()
+    try:
+        if cassette is not None and cassette.replaying:
+            response = cassette.replay(url)
+        else:
+            _count_connection("requests")
+            response = get_session().get(url, timeout=timeout, headers=headers)
+            if cassette is not None:
+                cassette.record(url, response)
+    except CassetteMiss:
+        raise
+    except requests.RequestException:
+        get_metrics().record_request(family, time.monotonic() - started, 0, None)
+        raise
+
+    get_metrics().record_request(family, time.monotonic() - started, len(response.content), response.status_code)
+    return response
+
+
+def get_connection_stats():
+    """
+    Get connection reuse statistics for this run.
+
+    Returns:
+        Dict with requests, new_connections and reused_connections counts
+    """
+    with _connection_stats_lock:
+        stats = dict(_connection_stats)
+    stats["reused_connections"] = max(0, stats["requests"] - stats["new_connections"])
+    return stats
+
+
+def reset_connection_stats():
+    """Reset connection reuse statistics (e.g. at the start of a run)."""
+    with _connection_stats_lock:
+        for key in _connection_stats:
+            _connection_stats[key] = 0
+
+
+def get_cache_stats():
+    """
+    Get response cache statistics for this run.
+
+    Returns:
+        Dict with hits, misses, revalidated (304), stores, evictions,
+        entries, bytes and hit_rate
+        (empty when the cache is disabled)
     """
-    global _last_request_time
-    if delay is None:
-        delay = RATE_LIMIT_DELAY
+    cache = get_response_cache()
+    return cache.get_stats() if cache is not None else {}
+
+
+def format_cache_stats():
+    """Format response cache statistics as a one-line summary."""
+    stats = get_cache_stats()
+    if not stats:
+        return "Cache: disabled"
+    return (
+        f"Cache: {stats['hits']} hits, {stats['revalidated']} revalidated (304), "
+        f"{stats['misses']} misses ({stats['hit_rate']:.0%} served locally), "
+        f"{stats['entries']} entries, "
+        f"{stats['bytes'] / (1024 * 1024):.1f} MB"
+    )
+
+
+def format_connection_stats():
+    """Format connection statistics as a one-line summary."""
+    stats = get_connection_stats()
+    return (
+        f"HTTP: {stats['requests']} requests, "
+        f"{stats['new_connections']} new connections, "
+        f"{stats['reused_connections']} reused (handshakes saved)"
+    )
+
+
+def get_skipped_requests():
+    """
+    Get the URLs given up on during this run (circuit open, retry budget
+    exhausted or retries failed), so they can be retried later.
+
+    Returns:
+        List of {"url", "reason"} dicts
+    """
+    return get_failure_registry().skipped()
+
+
+def get_skip_reason(url):
+    """Reason a URL was given up on during this run, or None."""
+    return get_failure_registry().skip_reason(url)
 
-    current_time = time.time()
-    time_since_last = current_time - _last_request_time
 
-    if time_since_last < delay:
-        sleep_time = delay - time_since_last
-        time.sleep(sleep_time)
+def reset_failures():
+    """Refill the retry budget and forget skipped URLs (e.g. per polling cycle)."""
+    get_failure_registry().start_run()
 
-    _last_request_time = time.time()
+
+def format_failure_stats():
+    """Format circuit breaker and retry budget state as a one-line summary."""
+    stats = get_failure_registry().stats()
+    budget = stats["retry_budget"]
+    opened = [family for family, circuit in stats["circuits"].items() if circuit["opened"]]
+    limit = budget["max_retries"] if budget["max_retries"] is not None else "∞"
+    return (
+        f"Failures: {stats['skipped']} URL(s) skipped, "
+        f"{budget['spent']}/{limit} retries used, "
+        f"circuits opened: {', '.join(opened) if opened else 'none'}"
+    )
+
+
+# =============================================================================
+# Single-flight request coalescing
+# =============================================================================
+_inflight = {}  # url -> Future of the request currently on the wire
+_recent_results = OrderedDict()  # url -> (expires_at, FetchResult)
+_single_flight_lock = threading.Lock()
+_single_flight_stats = {"in_flight": 0, "recent": 0}
+
+
+def get_coalesce_stats():
+    """
+    Get single-flight statistics for this run.
+
+    Returns:
+        Dict with in_flight (joined a running request), recent (reused a
+        just-finished result) and their total as coalesced
+    """
+    with _single_flight_lock:
+        stats = dict(_single_flight_stats)
+    stats["coalesced"] = stats["in_flight"] + stats["recent"]
+    return stats
 
 
 # =============================================================================
 # API Fetching
 # =============================================================================
-def fetch_from_api(url, max_retries=None, timeout=None):
+class FetchResult(namedtuple("FetchResult", ["data", "status"])):
     """
-    Fetch data from NHL API with retry logic and exponential backoff.
+    Result of fetch_json: the parsed payload plus where it came from.
+
+    status is one of:
+        "fetched"      - new content downloaded from the API
+        "unchanged"    - downloaded, but identical to the cached copy
+        "not_modified" - 304 answer to a conditional request (cached copy reused)
+        "cached"       - served from a fresh cache entry without any request
+        "failed"       - all attempts failed or the retry budget ran out (data is None)
+        "skipped"      - not attempted because the endpoint's circuit is open (data is None)
+    """
+
+    __slots__ = ()
+
+    @property
+    def unchanged(self):
+        """True when the payload is the same as the last one we stored."""
+        return self.status in ("unchanged", "not_modified", "cached")
+
+
+def _conditional_headers(entry):
+    """Build If-None-Match / If-Modified-Since headers for a cached entry."""
+    headers = {}
+    if entry and entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry and entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+def fetch_json(url, max_retries=None, timeout=None, use_cache=True):
+    """
+    Fetch data from NHL API and report whether it changed.
+
+    Identical URLs are coalesced: concurrent callers share the request that
+    is already in flight, and callers arriving within
+    SINGLE_FLIGHT_MEMO_SECONDS of a successful fetch reuse its parsed
+    result. Shared payloads must be treated as read-only.
+
+    Fresh cache entries are served without a request. Stale entries that
+    carry an ETag or Last-Modified validator are revalidated with a
+    conditional GET, so an unchanged payload costs a 304 instead of a full
+    download. Retries use exponential backoff with jitter.
 
     Args:
         url: API endpoint URL
         max_retries: Maximum number of retry attempts (defaults to API_MAX_RETRIES)
         timeout: Request timeout in seconds (defaults to API_TIMEOUT)
+        use_cache: Read and write the response cache (default True)
 
     Returns:
-        JSON response data or None if all retries fail
+        FetchResult(data, status)
     """
+    metrics = get_metrics()
+    family = endpoint_family(url)
+    if not use_cache:
+        result = _fetch_json(url, max_retries, timeout, use_cache)
+        metrics.record_outcome(family, result.status)
+        return result
+
+    with _single_flight_lock:
+        recent = _recent_results.get(url)
+        if recent is not None:
+            if recent[0] > time.monotonic():
+                _recent_results.move_to_end(url)
+                _single_flight_stats["recent"] += 1
+                metrics.record_outcome(family, "coalesced")
+                return recent[1]
+            del _recent_results[url]
+
+        future = _inflight.get(url)
+        is_leader = future is None
+        if is_leader:
+            future = Future()
+            _inflight[url] = future
+        else:
+            _single_flight_stats["in_flight"] += 1
+
+    if not is_leader:
+        metrics.record_outcome(family, "coalesced")
+        return future.result()
+
+    try:
+        result = _fetch_json(url, max_retries, timeout, use_cache)
+        metrics.record_outcome(family, result.status)
+    except BaseException as e:
+        with _single_flight_lock:
+            del _inflight[url]
+        future.set_exception(e)
+        raise
+
+    with _single_flight_lock:
+        del _inflight[url]
+        if result.data is not None and SINGLE_FLIGHT_MEMO_SECONDS > 0:
+            _recent_results[url] = (time.monotonic() + SINGLE_FLIGHT_MEMO_SECONDS, result)
+            while len(_recent_results) > SINGLE_FLIGHT_MEMO_SIZE:
+                _recent_results.popitem(last=False)
+    future.set_result(result)
+    return result
+
+
+def _give_up(url, reason, status="failed"):
+    """Report and record a URL that will not be fetched this run."""
+    print(f"Error fetching {url}: {reason}")
+    get_failure_registry().record_skipped(url, reason)
+    return FetchResult(None, status)
+
+
+def _fetch_json(url, max_retries, timeout, use_cache):
+    """Fetch one URL through the cache and network (see fetch_json)."""
     if max_retries is None:
         max_retries = API_MAX_RETRIES
     if timeout is None:
         timeout = API_TIMEOUT
 
-    rate_limit()  # Apply rate limiting before each request
+    # A cassette must see every request, so it takes the response cache's place
+    cassette = get_cassette()
+    cache = get_response_cache() if use_cache and cassette is None else None
+    stale_entry = None
+    if cache is not None:
+        stale_entry = cache.lookup(url)
+        cached = cache.fresh_data(url, stale_entry)
+        if cached is not None:
+            return FetchResult(cached, "cached")
+
+    headers = _conditional_headers(stale_entry)
+    limiter = get_rate_limiter()
+    failures = get_failure_registry()
+    family = endpoint_family(url)
+    breaker = failures.breaker(family)
+
+    metrics = get_metrics()
 
     for attempt in range(max_retries):
+        if attempt > 0:
+            if not failures.retry_budget.try_spend():
+                return _give_up(url, "retry budget exhausted")
+            metrics.record_retry(family)
+        if not breaker.allow():
+            return _give_up(url, f"circuit open for {family} endpoints", status="skipped")
+
+        if cassette is None or not cassette.replaying:
+            # Apply rate limiting before each request
+            metrics.record_wait(family, limiter.acquire(url))
         try:
-            response = requests.get(url, timeout=timeout)
+            response = http_get(url, timeout=timeout, headers=headers or None)
+
+            # Any answer below 500 means the API itself is up
+            if response.status_code < 500:
+                breaker.on_success()
 
             # Handle 429 Too Many Requests specifically
             if response.status_code == 429:
+                limiter.on_throttled(url)  # Slow this host down (AIMD)
                 if attempt == max_retries - 1:
-                    print(f"Error fetching {url}: 429 Too Many Requests (max retries exceeded)")
-                    return None
+                    return _give_up(url, "429 Too Many Requests (max retries exceeded)")
 
                 # Exponential backoff with jitter for 429 errors
                 base_delay = 2 ** attempt
@@ -90,13 +472,43 @@ def fetch_from_api(url, max_retries=None, timeout=None):
                 time.sleep(delay)
                 continue
 
+            # Cached copy is still current
+            if response.status_code == 304 and stale_entry is not None:
+                limiter.on_success(url)
+                cache.revalidate(url, stale_entry)
+                failures.clear_skipped(url)
+                return FetchResult(stale_entry["data"], "not_modified")
+
+            # Other client errors (404 for an unknown game, ...) will not go away on retry
+            if 400 <= response.status_code < 500:
+                return _give_up(url, f"HTTP {response.status_code}")
+
             response.raise_for_status()
-            return response.json()
+            limiter.on_success(url)
+            data = response.json()
+
+            status = "fetched"
+            if stale_entry is not None and stale_entry.get("data") == data:
+                status = "unchanged"
+            if cache is not None:
+                cache.put(
+                    url,
+                    data,
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                )
+            failures.clear_skipped(url)
+            return FetchResult(data, status)
+
+        except CassetteMiss as e:
+            return _give_up(url, str(e))
 
         except requests.RequestException as e:
+            # Server errors, timeouts and connection failures count against the circuit
+            if breaker.on_failure():
+                return _give_up(url, f"{e} (circuit opened for {family} endpoints)", status="skipped")
             if attempt == max_retries - 1:
-                print(f"Error fetching {url}: {e}")
-                return None
+                return _give_up(url, str(e))
 
             # Exponential backoff for other errors
             base_delay = 2 ** attempt
@@ -106,9 +518,246 @@ def fetch_from_api(url, max_retries=None, timeout=None):
             print(f"Error fetching {url}: {e}. Retrying in {delay:.2f} seconds... (attempt {attempt + 1}/{max_retries})")
             time.sleep(delay)
 
+    return _give_up(url, "max retries exceeded")
+
+
+def fetch_from_api(url, max_retries=None, timeout=None, use_cache=True):
+    """
+    Fetch data from NHL API with retry logic and exponential backoff.
+
+    Responses are served from and stored in the on-disk response cache
+    (see response_cache.py) according to per-endpoint TTL policies.
+
+    Args:
+        url: API endpoint URL
+        max_retries: Maximum number of retry attempts (defaults to API_MAX_RETRIES)
+        timeout: Request timeout in seconds (defaults to API_TIMEOUT)
+        use_cache: Read and write the response cache (default True)
+
+    Returns:
+        JSON response data or None if all retries fail
+    """
+    return fetch_json(url, max_retries=max_retries, timeout=timeout, use_cache=use_cache).data
+
+
+def fetch_many(urls, max_concurrency=None, max_retries=None, timeout=None, with_status=False):
+    """
+    Fetch several API URLs concurrently with bounded parallelism.
+
+    Every URL goes through fetch_json, so retries, 429 handling, caching and
+    the shared rate limiter apply exactly as for single requests.
+
+    Args:
+        urls: Iterable of API endpoint URLs
+        max_concurrency: Maximum parallel requests (defaults to FETCH_MAX_CONCURRENCY)
+        max_retries: Passed through to fetch_json
+        timeout: Passed through to fetch_json
+        with_status: Return FetchResult objects instead of bare data
+
+    Returns:
+        List of JSON responses (None for failed URLs) in the same order as urls,
+        or FetchResult objects when with_status is True
+    """
+    urls = list(urls)
+    if not urls:
+        return []
+    if max_concurrency is None:
+        max_concurrency = FETCH_MAX_CONCURRENCY
+
+    def fetch(url):
+        result = fetch_json(url, max_retries=max_retries, timeout=timeout)
+        return result if with_status else result.data
+
+    workers = max(1, min(max_concurrency, len(urls)))
+    if workers == 1:
+        return [fetch(url) for url in urls]
+
+    # Inside map_in_order, keep messages in the calling task's log
+    buffer = _current_output()
+    if buffer is not None:
+        fetch = _with_output(fetch, buffer)
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="fetch") as executor:
+        return list(executor.map(fetch, urls))
+
+
+# =============================================================================
+# Ordered parallel execution
+# =============================================================================
+class _ThreadLocalStdout:
+    """sys.stdout proxy that lets worker threads buffer their own output."""
+
+    def __init__(self, target):
+        self.target = target
+        self.local = threading.local()
+
+    def _stream(self):
+        buffer = getattr(self.local, "buffer", None)
+        return self.target if buffer is None else buffer
+
+    def write(self, text):
+        return self._stream().write(text)
+
+    def flush(self):
+        return self._stream().flush()
+
+    def __getattr__(self, name):
+        return getattr(self.target, name)
+
+
+_stdout_lock = threading.Lock()
+
+
+def _stdout_proxy():
+    """Install (once) and return the thread-aware stdout proxy."""
+    with _stdout_lock:
+        if not isinstance(sys.stdout, _ThreadLocalStdout):
+            sys.stdout = _ThreadLocalStdout(sys.stdout)
+        return sys.stdout
+
+
+def _current_output():
+    """The calling thread's output buffer, or None when it prints directly."""
+    stdout = sys.stdout
+    if isinstance(stdout, _ThreadLocalStdout):
+        return getattr(stdout.local, "buffer", None)
     return None
 
 
+def _with_output(func, buffer):
+    """Wrap func so everything it prints goes to buffer."""
+    proxy = _stdout_proxy()
+
+    def run(*args):
+        previous = getattr(proxy.local, "buffer", None)
+        proxy.local.buffer = buffer
+        try:
+            return func(*args)
+        finally:
+            proxy.local.buffer = previous
+
+    return run
+
+
+def map_in_order(func, items, max_workers=None):
+    """
+    Run func over items on a thread pool, with results and log output
+    exactly as if the items had been processed one after another.
+
+    Each call's printed output is buffered and written out in input order as
+    soon as all earlier items have finished, so logs never interleave. Calls
+    may nest (e.g. games fanning out to players).
+
+    Args:
+        func: Callable taking one item
+        items: Iterable of items
+        max_workers: Pool size (defaults to FETCH_MAX_CONCURRENCY; 1 = serial)
+
+    Returns:
+        List of results in the same order as items (the first exception
+        raised by func is re-raised after the output before it is written)
+    """
+    items = list(items)
+    if max_workers is None:
+        max_workers = FETCH_MAX_CONCURRENCY
+    workers = max(1, min(max_workers, len(items)))
+    if workers == 1:
+        return [func(item) for item in items]
+
+    _stdout_proxy()
+
+    def run(item):
+        buffer = io.StringIO()
+        try:
+            return _with_output(func, buffer)(item), None, buffer.getvalue()
+        except Exception as e:
+            return None, e, buffer.getvalue()
+
+    results = []
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pipeline") as executor:
+        for result, error, output in executor.map(run, items):
+            sys.stdout.write(output)
+            if error is not None:
+                raise error
+            results.append(result)
+    return results
+
+
+# =============================================================================
+# Run Reports
+# =============================================================================
+def build_run_report(script, started_at, extra=None):
+    """
+    Collect everything the fetch layer measured during this run.
+
+    Args:
+        script: Entry point name (e.g. "fetch")
+        started_at: datetime the run started
+        extra: Optional dict of script-specific fields
+
+    Returns:
+        JSON-serializable report dict
+    """
+    finished_at = datetime.now()
+    cassette = get_cassette()
+    report = {
+        "script": script,
+        "started_at": started_at.isoformat(),
+        "finished_at": finished_at.isoformat(),
+        "duration_seconds": round((finished_at - started_at).total_seconds(), 3),
+        "api_base": NHL_API_BASE,
+        "metrics": get_metrics().snapshot(),
+        "connections": get_connection_stats(),
+        "cache": get_cache_stats(),
+        "coalescing": get_coalesce_stats(),
+        "rate_limiter": get_rate_limiter().stats(),
+        "failures": get_failure_registry().stats(),
+        "skipped": get_skipped_requests(),
+        "cassette": cassette.summary() if cassette is not None else None,
+    }
+    if extra:
+        report.update(extra)
+    return report
+
+
+def write_run_report(script, started_at, extra=None):
+    """
+    Write the run report to RUN_REPORT_DIR.
+
+    Returns:
+        Path of the written report
+    """
+    report = build_run_report(script, started_at, extra)
+    output_file = RUN_REPORT_DIR / f"{script}-{started_at.strftime('%Y%m%d-%H%M%S')}.json"
+    return save_json(report, output_file)
+
+
+def start_run_report(script):
+    """
+    Emit a JSON run report and a per-endpoint summary when the process exits.
+
+    Call once at the start of an entry point.
+
+    Args:
+        script: Entry point name used in the report file name
+    """
+    atexit.register(_finish_run_report, script, datetime.now())
+
+
+def _finish_run_report(script, started_at):
+    try:
+        output_file = write_run_report(script, started_at)
+    except OSError as e:
+        print(f"Warning: Could not write run report: {e}")
+        output_file = None
+
+    if get_metrics().snapshot()["endpoints"]:
+        print()
+        print(get_metrics().format_summary())
+    if output_file is not None:
+        print(f"📈 Run report: {output_file}")
+
+
 # =============================================================================
 # File I/O
 # =============================================================================
@@ -193,6 +842,26 @@ def player_landing_url(player_id):
     return f"{NHL_API_BASE}/v1/player/{player_id}/landing"
 
 
+def roster_url(team_abbrev):
+    """Get current roster URL for a team."""
+    return f"{NHL_API_BASE}/v1/roster/{team_abbrev}/current"
+
+
+def club_schedule_url(team_abbrev, season="now"):
+    """Get a team's season schedule URL (season like "20252026")."""
+    return f"{NHL_API_BASE}/v1/club-schedule-season/{team_abbrev}/{season}"
+
+
+def standings_url(date="now"):
+    """Get league standings URL (defaults to current standings)."""
+    return f"{NHL_API_BASE}/v1/standings/{date}"
+
+
+def stats_teams_url():
+    """Get the stats API team list URL (IDs, full names, tri-codes)."""
+    return f"{NHL_STATS_API_BASE}/en/team"
+
+
 # =============================================================================
 # Data Processing Helpers
 # =============================================================================
@@ -204,11 +873,17 @@ def extract_team_name(team_data):
         team_data: Team data from NHL API
 
     Returns:
-        Full team name (e.g., "Boston Bruins")
+        Full team name (e.g., "Boston Bruins"); when the response carries no
+        names, the team registry's name for its abbreviation
     """
     place_name = team_data.get("placeName", {}).get("default", "")
     common_name = team_data.get("commonName", {}).get("default", "")
-    return f"{place_name} {common_name}".strip() if place_name and common_name else common_name or place_name
+    if place_name and common_name:
+        return f"{place_name} {common_name}"
+    if common_name or place_name or not team_data.get("abbrev"):
+        return common_name or place_name
+    from team_registry import get_team_registry  # imports utils
+    return get_team_registry(refresh=False).team_name(team_data["abbrev"])
 
 
 def get_player_name(player_data):
@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+"""
+Persistent venue address registry.
+
+Maps (venue name, city) to the address Nominatim returns for it, stored in
+VENUE_REGISTRY_FILE so arenas are geocoded once rather than on every run.
+A new registry is seeded with the addresses already written to the daily
+game files. Lookups are a dictionary read: entries older than
+VENUE_REFRESH_SECONDS are still served and re-geocoded on a background
+thread, which is drained before the registry is saved at exit. Venues never
+seen before are geocoded inline. All Nominatim requests go through the shared
+rate limiter (1 request per second).
+
+Usage:
+    python venue_registry.py --seed     # import addresses from the daily game files
+    python venue_registry.py --warm     # geocode every known venue that is missing or stale
+    python venue_registry.py --stats    # show registry contents
+"""
+
+import argparse
+import atexit
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+import requests
+
+from config import (
+    GAMES_DIR,
+    NOMINATIM_BASE,
+    NOMINATIM_TIMEOUT,
+    VENUE_REFRESH_SECONDS,
+    VENUE_REGISTRY_FILE,
+)
+from utils import http_get, rate_limit
+
+VENUE_REGISTRY_FORMAT = 1
+NOMINATIM = "nominatim"
+NOT_FOUND = "not_found"
+GAME_FILE = "game_file"  # full address copied from a daily game file
+SEED = "seed"  # city/state placeholder written by older versions; never served
+
+
+def venue_key(venue_name, city):
+    """Registry key for a venue (case-insensitive)."""
+    return f"{venue_name.strip()}|{city.strip()}".casefold()
+
+
+def geocode_nominatim(venue_name, city):
+    """
+    Look a venue up with OpenStreetMap Nominatim.
+
+    Returns:
+        Address dict {street, city, state, country, postcode, full_address},
+        None if Nominatim has no match (raises on request errors)
+    """
+    headers = {'User-Agent': 'FinnishNHLPlayers/1.0'}
+    query = f"{venue_name}, {city}, USA"
+    url = f"{NOMINATIM_BASE}?format=json&addressdetails=1&q={requests.utils.quote(query)}&limit=1"
+
+    rate_limit(url)  # Nominatim allows 1 request per second
+    response = http_get(url, headers=headers, timeout=NOMINATIM_TIMEOUT)
+    response.raise_for_status()
+    results = response.json()
+    if not results:
+        return None
+
+    address = results[0].get('address', {})
+    street = address.get('road', '')
+    house_number = address.get('house_number', '')
+    city_name = address.get('city', address.get('town', address.get('village', '')))
+    state = address.get('state', '')
+    country = address.get('country', '')
+    postcode = address.get('postcode', '')
+
+    full_parts = []
+    if house_number and street:
+        full_parts.append(f"{house_number} {street}")
+    elif street:
+        full_parts.append(street)
+    if city_name:
+        full_parts.append(city_name)
+    if state:
+        full_parts.append(state)
+    if country:
+        full_parts.append(country)
+
+    return {
+        'street': street,
+        'city': city_name,
+        'state': state,
+        'country': country,
+        'postcode': postcode,
+        'full_address': ", ".join(full_parts)
+    }
+
+
+class VenueRegistry:
+    """Thread-safe (venue, city) -> address registry backed by a JSON file."""
+
+    def __init__(self, path=None, refresh_seconds=None, geocoder=None):
+        """
+        Args:
+            path: Registry file (defaults to VENUE_REGISTRY_FILE)
+            refresh_seconds: Age after which entries are re-geocoded (defaults to VENUE_REFRESH_SECONDS)
+            geocoder: Function (venue, city) -> address or None (defaults to geocode_nominatim)
+        """
+        self.path = Path(path or VENUE_REGISTRY_FILE)
+        self.refresh_seconds = VENUE_REFRESH_SECONDS if refresh_seconds is None else refresh_seconds
+        self.geocoder = geocoder or geocode_nominatim
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._venues = {}
+        self._failed = set()  # keys whose lookup errored this run; not retried until restart
+        self._queued = set()
+        self._queue = None
+        self.stats = {"hits": 0, "misses": 0, "stale": 0, "geocoded": 0, "refreshed": 0, "failures": 0}
+        self._load()
+
+    # -------------------------------------------------------------------------
+    # Storage
+    # -------------------------------------------------------------------------
+    def _load(self):
+        if self.path.exists():
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    registry = json.load(f)
+                if registry.get("format") == VENUE_REGISTRY_FORMAT:
+                    self._venues = registry.get("venues", {})
+                    return
+            except (OSError, json.JSONDecodeError):
+                pass
+        self.seed()
+
+    def seed(self, games_dir=None):
+        """
+        Add the addresses already written to the daily game files.
+
+        Returns:
+            Number of venues added
+        """
+        added = 0
+        with self._lock:
+            for venue, city, address, updated_at in addresses_from_game_files(games_dir):
+                key = venue_key(venue, city)
+                entry = self._venues.get(key)
+                if entry is not None and entry.get("source") != SEED:
+                    continue
+                self._venues[key] = {
+                    "venue": venue,
+                    "city": city,
+                    "address": {
+                        "street": "",
+                        "city": "",
+                        "state": "",
+                        "country": "",
+                        "postcode": "",
+                        "full_address": address,
+                    },
+                    "source": GAME_FILE,
+                    "updated_at": updated_at,
+                }
+                added += 1
+            self._dirty = self._dirty or added > 0
+        return added
+
+    def save(self):
+        """Write the registry to disk if it changed (atomic replace)."""
+        with self._lock:
+            if not self._dirty:
+                return False
+            registry = {
+                "format": VENUE_REGISTRY_FORMAT,
+                "venues": dict(sorted(self._venues.items())),
+            }
+            self._dirty = False
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(registry, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+        return True
+
+    # -------------------------------------------------------------------------
+    # Geocoding
+    # -------------------------------------------------------------------------
+    def _is_stale(self, entry, now=None):
+        if entry.get("source") == SEED:
+            return True
+        return (now or time.time()) - entry.get("updated_at", 0) >= self.refresh_seconds
+
+    def _geocode(self, venue_name, city):
+        """Geocode one venue and store the result; returns the entry or None on error."""
+        key = venue_key(venue_name, city)
+        try:
+            address = self.geocoder(venue_name, city)
+        except Exception as e:
+            print(f"Warning: Geocoding failed for {venue_name}, {city}: {e}")
+            with self._lock:
+                self._failed.add(key)
+                self.stats["failures"] += 1
+            return None
+
+        entry = {
+            "venue": venue_name,
+            "city": city,
+            "address": address,
+            "source": NOMINATIM if address else NOT_FOUND,
+            "updated_at": int(time.time()),
+        }
+        with self._lock:
+            previous = self._venues.get(key)
+            if address is None and previous and previous.get("address") and previous.get("source") != SEED:
+                # Keep the address we had rather than forgetting it
+                entry["address"] = previous["address"]
+            self._venues[key] = entry
+            self._dirty = True
+        return entry
+
+    def _refresh_worker(self):
+        while True:
+            venue_name, city = self._queue.get()
+            if self._geocode(venue_name, city) is not None:
+                with self._lock:
+                    self.stats["refreshed"] += 1
+            with self._lock:
+                self._queued.discard(venue_key(venue_name, city))
+            self._queue.task_done()
+
+    def _schedule_refresh(self, venue_name, city):
+        with self._lock:
+            key = venue_key(venue_name, city)
+            if key in self._queued or key in self._failed:
+                return
+            self._queued.add(key)
+            if self._queue is None:
+                self._queue = queue.Queue()
+                threading.Thread(target=self._refresh_worker, name="venue-refresh", daemon=True).start()
+        self._queue.put((venue_name, city))
+
+    def wait_for_refresh(self):
+        """Block until queued background refreshes are done."""
+        if self._queue is not None:
+            self._queue.join()
+
+    def close(self):
+        """Finish queued background refreshes and save (registered at exit)."""
+        self.wait_for_refresh()
+        self.save()
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+    def lookup(self, venue_name, city):
+        """
+        Get the address of a venue.
+
+        Known venues are answered from the registry (stale ones are
+        refreshed in the background); unknown venues, and placeholders left
+        by older registries, are geocoded inline.
+
+        Returns:
+            Address dict {street, city, state, country, postcode, full_address} or None
+        """
+        key = venue_key(venue_name, city)
+        with self._lock:
+            entry = self._venues.get(key)
+            if entry is not None and entry.get("source") == SEED:
+                entry = None
+            failed = key in self._failed
+            if entry is not None:
+                self.stats["hits"] += 1
+                stale = self._is_stale(entry)
+                if stale:
+                    self.stats["stale"] += 1
+            else:
+                self.stats["misses"] += 1
+        if entry is not None:
+            if stale:
+                self._schedule_refresh(venue_name, city)
+            return entry.get("address")
+        if failed:
+            return None
+
+        entry = self._geocode(venue_name, city)
+        if entry is not None:
+            with self._lock:
+                self.stats["geocoded"] += 1
+        return entry.get("address") if entry else None
+
+    def warm(self, venues):
+        """
+        Geocode every venue that is missing or stale, inline.
+
+        Args:
+            venues: Iterable of (venue name, city)
+
+        Returns:
+            Number of venues geocoded
+        """
+        done = 0
+        for venue_name, city in dict.fromkeys(venues):
+            with self._lock:
+                entry = self._venues.get(venue_key(venue_name, city))
+            if entry is not None and not self._is_stale(entry):
+                continue
+            if self._geocode(venue_name, city) is not None:
+                done += 1
+        return done
+
+    def known_venues(self):
+        """List of (venue name, city) for every registry entry."""
+        with self._lock:
+            return [(entry["venue"], entry["city"]) for entry in self._venues.values()]
+
+    def get_stats(self):
+        with self._lock:
+            stats = dict(self.stats)
+            stats["venues"] = len(self._venues)
+            stats["stale_entries"] = sum(1 for entry in self._venues.values() if self._is_stale(entry))
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+        return stats
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_venue_registry():
+    """
+    Get the process-wide venue registry.
+
+    Background refreshes are finished and the registry saved automatically
+    at exit.
+    """
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                registry = VenueRegistry()
+                atexit.register(registry.close)
+                _registry = registry
+    return _registry
+
+
+def format_venue_stats():
+    """Format venue registry usage as a one-line summary."""
+    stats = get_venue_registry().get_stats()
+    return (
+        f"Venues: {stats['hits']} hits, {stats['misses']} misses ({stats['hit_rate']:.0%} hit rate), "
+        f"{stats['refreshed']} refreshed, {stats['venues']} in registry"
+    )
+
+
+def venues_from_game_files(games_dir=None):
+    """Collect (venue, city) pairs used in the daily game files."""
+    return [(venue, city) for venue, city, _, _ in addresses_from_game_files(games_dir, with_empty=True)]
+
+
+def addresses_from_game_files(games_dir=None, with_empty=False):
+    """
+    Collect the venue addresses written to the daily game files.
+
+    Args:
+        games_dir: Daily game files (defaults to GAMES_DIR)
+        with_empty: Also yield venues whose address is empty
+
+    Yields:
+        (venue, city, full address, time the file was generated) tuples,
+        oldest file first
+    """
+    for path in sorted(Path(games_dir or GAMES_DIR).glob("*.json")):
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            updated_at = int(datetime.fromisoformat(data["generated_at"]).timestamp())
+        except (OSError, ValueError, KeyError, TypeError):
+            continue
+        for player in data.get("players", []):
+            if not (player.get("game_venue") and player.get("game_city")):
+                continue
+            if player.get("game_address") or with_empty:
+                yield player["game_venue"], player["game_city"], player.get("game_address") or "", updated_at
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Venue address registry")
+    parser.add_argument("--seed", action="store_true",
+                        help="Import the addresses already written to the daily game files")
+    parser.add_argument("--warm", action="store_true",
+                        help="Geocode every known venue (registry, game files) that is missing or stale")
+    parser.add_argument("--stats", action="store_true", help="Show registry statistics")
+    args = parser.parse_args()
+
+    registry = get_venue_registry()
+    if args.seed:
+        added = registry.seed()
+        registry.save()
+        print(f"✅ Imported {added} venue address(es) from the game files")
+    if args.warm:
+        venues = registry.known_venues() + venues_from_game_files()
+        print(f"Warming venue registry ({len(set(venues))} venues)...")
+        done = registry.warm(venues)
+        registry.save()
+        print(f"✅ Geocoded {done} venue(s)")
+
+    stats = registry.get_stats()
+    print(f"📍 {stats['venues']} venues in {registry.path} ({stats['stale_entries']} stale)")
+    if args.stats:
+        for name, value in stats.items():
+            print(f"   {name}: {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
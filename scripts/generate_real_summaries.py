@@ -4,8 +4,13 @@ from datetime import datetime, timedelta
 from collections import defaultdict
 import subprocess
 import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent / "data_collection"))
+
+from game_store import get_game_store
 
-DATA_DIR = "static/data/prepopulated/games"
 OUTPUT_FILE = "static/data/articles.json"
 CONTENT_DIR = "content/articles"
 
@@ -15,27 +20,12 @@ def get_iso_week(date_str):
     return year, week
 
 def load_game_data():
+    # Every player record of the daily files, from the indexed game store
     all_game_performances = []
-    for filename in os.listdir(DATA_DIR):
-        if filename.endswith(".json"):
-            try:
-                date_str = filename.replace(".json", "")
-                datetime.strptime(date_str, "%Y-%m-%d")
-            except ValueError:
-                continue
-
-            filepath = os.path.join(DATA_DIR, filename)
-            with open(filepath, 'r') as f:
-                try:
-                    day_data = json.load(f)
-                    if "players" in day_data:
-                        for p in day_data["players"]:
-                            if "date" not in p:
-                                p["date"] = day_data.get("date", date_str)
-                            all_game_performances.append(p)
-                except json.JSONDecodeError:
-                    print(f"Error decoding {filename}")
-                    continue
+    for date_str, p in get_game_store().player_games():
+        if "date" not in p:
+            p["date"] = date_str
+        all_game_performances.append(p)
 
     return all_game_performances
 
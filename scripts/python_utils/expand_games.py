@@ -6,151 +6,20 @@ This uses the game IDs we already discovered to get comprehensive data
 
 import json
 import os
-import requests
-import time
+import sys
 from datetime import datetime
 from pathlib import Path
 
-NHL_API_BASE = "https://api-web.nhle.com"
+# Use the shared fetch layer (pooled session, rate limiter, response cache)
+sys.path.insert(0, str(Path(__file__).parent.parent / "data_collection"))
 
-def fetch_from_api(url, max_retries=2):
-    """Fetch data from NHL API with retry logic"""
-    for attempt in range(max_retries):
-        try:
-            response = requests.get(url, timeout=8)
-            response.raise_for_status()
-            return response.json()
-        except requests.RequestException as e:
-            if attempt == max_retries - 1:
-                print(f"Error fetching {url}: {e}")
-                return None
-            time.sleep(2)  # Wait before retry
-    return None
+from utils import fetch_from_api, game_boxscore_url
+from player_rows import EXPANDED_SCHEMA, dump_json, extract_player_rows
+from season_store import NUMPY_AVAILABLE, SeasonStore
 
 def get_game_details(game_id):
     """Get detailed game information including player stats"""
-    url = f"{NHL_API_BASE}/v1/gamecenter/{game_id}/boxscore"
-    return fetch_from_api(url)
-
-def extract_all_player_data(game_data, game_id, home_team, away_team, game_date):
-    """Extract all player data from game"""
-    players = []
-
-    if not game_data:
-        return players
-
-    # Get player stats from the correct API structure
-    player_stats = game_data.get("playerByGameStats", {})
-    if not player_stats:
-        return players
-
-    # Process away team players (forwards, defense, goalies)
-    away_stats = player_stats.get("awayTeam", {})
-    for player_category in ["forwards", "defense", "goalies"]:
-        for player in away_stats.get(player_category, []):
-            player_id = player.get("playerId")
-            name = player.get("name", {}).get("default", "")
-            position = player.get("position", "N/A")
-
-            # Extract stats based on position
-            if position == "G":
-                # Goalie stats
-                saves = player.get("saves", 0)
-                save_pct = player.get("savePctg", 0.0)
-
-                players.append({
-                    "playerId": player_id,
-                    "name": name.strip(),
-                    "team": away_team,
-                    "position": position,
-                    "goals": 0,
-                    "assists": 0,
-                    "points": 0,
-                    "shots": 0,
-                    "plusMinus": 0,
-                    "pim": player.get("pim", 0),
-                    "timeOnIce": player.get("toi", "00:00"),
-                    "isGoalie": True,
-                    "saves": saves,
-                    "savePct": round(save_pct, 3) if save_pct else 0.0,
-                    "gameId": game_id,
-                    "gameDate": game_date
-                })
-            else:
-                # Skater stats (forwards and defense)
-                players.append({
-                    "playerId": player_id,
-                    "name": name.strip(),
-                    "team": away_team,
-                    "position": position,
-                    "goals": player.get("goals", 0),
-                    "assists": player.get("assists", 0),
-                    "points": player.get("points", 0),
-                    "shots": player.get("sog", 0),
-                    "plusMinus": player.get("plusMinus", 0),
-                    "pim": player.get("pim", 0),
-                    "timeOnIce": player.get("toi", "00:00"),
-                    "isGoalie": False,
-                    "saves": 0,
-                    "savePct": 0.0,
-                    "gameId": game_id,
-                    "gameDate": game_date
-                })
-
-    # Process home team players (forwards, defense, goalies)
-    home_stats = player_stats.get("homeTeam", {})
-    for player_category in ["forwards", "defense", "goalies"]:
-        for player in home_stats.get(player_category, []):
-            player_id = player.get("playerId")
-            name = player.get("name", {}).get("default", "")
-            position = player.get("position", "N/A")
-
-            # Extract stats based on position
-            if position == "G":
-                # Goalie stats
-                saves = player.get("saves", 0)
-                save_pct = player.get("savePctg", 0.0)
-
-                players.append({
-                    "playerId": player_id,
-                    "name": name.strip(),
-                    "team": home_team,
-                    "position": position,
-                    "goals": 0,
-                    "assists": 0,
-                    "points": 0,
-                    "shots": 0,
-                    "plusMinus": 0,
-                    "pim": player.get("pim", 0),
-                    "timeOnIce": player.get("toi", "00:00"),
-                    "isGoalie": True,
-                    "saves": saves,
-                    "savePct": round(save_pct, 3) if save_pct else 0.0,
-                    "gameId": game_id,
-                    "gameDate": game_date
-                })
-            else:
-                # Skater stats (forwards and defense)
-                players.append({
-                    "playerId": player_id,
-                    "name": name.strip(),
-                    "team": home_team,
-                    "position": position,
-                    "goals": player.get("goals", 0),
-                    "assists": player.get("assists", 0),
-                    "points": player.get("points", 0),
-                    "shots": player.get("sog", 0),
-                    "plusMinus": player.get("plusMinus", 0),
-                    "pim": player.get("pim", 0),
-                    "timeOnIce": player.get("toi", "00:00"),
-                    "isGoalie": False,
-                    "saves": 0,
-                    "savePct": 0.0,
-                    "gameId": game_id,
-                    "gameDate": game_date
-                })
-
-    return players
+    return fetch_from_api(game_boxscore_url(game_id), max_retries=2)
 
 def main():
     print("🏒 Expanding existing Finnish player data to include ALL players...")
@@ -221,7 +90,7 @@ def main():
 
             if game_details:
                 # Extract all player data
-                players = extract_all_player_data(
+                players = extract_player_rows(
                     game_details,
                     game_id,
                     game_details.get("homeTeam", {}).get("abbrev", "UNK"),
@@ -251,9 +120,6 @@ def main():
             else:
                 print(f"      ❌ Failed to get details for game {game_id}")
 
-            # Rate limiting
-            time.sleep(3)
-
         all_players.extend(date_players)
         processed_count += 1
 
@@ -269,7 +135,7 @@ def main():
 
         output_file = output_dir / f"{date_str}.json"
         with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(daily_data, f, indent=2, ensure_ascii=False)
+            dump_json(daily_data, f, EXPANDED_SCHEMA)
 
         print(f"   💾 Saved {len(date_players)} players from {len(game_ids)} games")
 
@@ -287,7 +153,7 @@ def main():
 
     season_file = output_dir / "season-2025-26-november-expanded.json"
     with open(season_file, 'w', encoding='utf-8') as f:
-        json.dump(season_data, f, indent=2, ensure_ascii=False)
+        dump_json(season_data, f, EXPANDED_SCHEMA)
 
     print(f"\n✅ Expansion complete!")
     print(f"   📅 Processed {processed_count} dates")
@@ -296,20 +162,25 @@ def main():
     print(f"   📁 Daily files: {output_dir}")
     print(f"   📄 Season file: {season_file}")
 
-    # Show some statistics
+    # Show some statistics (vectorized over the columnar store when numpy is installed)
+    if all_players and NUMPY_AVAILABLE:
+        store = SeasonStore.from_rows(all_players)
+        scorers = store.top_rows("points", 10)
+        team_counts = store.count_by("team")
+    elif all_players:
+        scorers = sorted(all_players, key=lambda x: x.points, reverse=True)[:10]
+        team_counts = {}
+        for player in all_players:
+            team = player.team
+            team_counts[team] = team_counts.get(team, 0) + 1
+
     if all_players:
         # Top scorers
-        scorers = sorted(all_players, key=lambda x: x["points"], reverse=True)[:10]
         print(f"\n🌟 Top 10 Scorers:")
         for i, player in enumerate(scorers, 1):
             print(f"   {i:2d}. {player['name']} ({player['team']}) - {player['points']} pts")
 
         # Team player counts
-        team_counts = {}
-        for player in all_players:
-            team = player["team"]
-            team_counts[team] = team_counts.get(team, 0) + 1
-
         print(f"\n📊 Players by Team:")
         for team, count in sorted(team_counts.items(), key=lambda x: x[1], reverse=True)[:10]:
             print(f"   {team}: {count} players")
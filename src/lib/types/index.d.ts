@@ -58,6 +58,9 @@ export interface Player {
     power_play_goals?: number
     short_handed_goals?: number
     even_strength_goals?: number
+    power_play_assists?: number
+    short_handed_assists?: number
+    game_winning_goals?: number
     shifts?: number
     created_at?: string
     recent_results?: RecentGame[] // Last 10 games